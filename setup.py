@@ -25,6 +25,7 @@ dev_packages = [
     'codespell',
     'fakeredis==1.7.0',
     'flake8',
+    'httpx>=0.26.0; python_version >= "3.8.0"',
     'isort>=5.0.0',
     'mako',
     'pre-commit',
@@ -64,7 +65,12 @@ setup(
     ],
     description=metadata['__description__'],
     download_url=metadata['__download_url__'],
-    extras_require={'dev': dev_packages, 'develop': dev_packages, 'development': dev_packages},
+    extras_require={
+        'async': ['httpx>=0.26.0'],
+        'dev': dev_packages,
+        'develop': dev_packages,
+        'development': dev_packages,
+    },
     include_package_data=True,
     install_requires=[
         'arrow',
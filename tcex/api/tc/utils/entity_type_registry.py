@@ -0,0 +1,70 @@
+"""ThreatConnect Entity Type Registry"""
+# standard library
+import logging
+import threading
+import weakref
+from typing import FrozenSet
+
+# third-party
+from requests import Session
+
+# first-party
+from tcex.api.tc.utils.threat_intel_utils import ThreatIntelUtils
+
+# get tcex logger
+logger = logging.getLogger('tcex')
+
+
+class EntityTypeRegistry:
+    """ThreatConnect Entity Type Registry
+
+    A process-wide registry of the ThreatConnect Indicator and Group types used by the input
+    field type validators. The Indicator types are retrieved once per session (the type metadata
+    cache is shared across sessions) and held as a lookup set, so validating a large entity
+    array makes at most one API call.
+    """
+
+    def __init__(self) -> None:
+        """Initialize Class Properties."""
+        self._group_types = frozenset(ThreatIntelUtils(session_tc=None).group_types)
+        self._indicator_types = weakref.WeakKeyDictionary()  # session -> types
+        self._lock = threading.Lock()
+        self.log = logger
+
+    def clear(self) -> None:
+        """Clear the registered Indicator types."""
+        with self._lock:
+            self._indicator_types.clear()
+
+    @property
+    def group_types(self) -> FrozenSet[str]:
+        """Return the ThreatConnect Group types."""
+        return self._group_types
+
+    def indicator_types(self, session_tc: Session) -> FrozenSet[str]:
+        """Return the ThreatConnect Indicator types.
+
+        Args:
+            session_tc: An configured instance of request.Session with TC API Auth.
+        """
+        types = self._indicator_types.get(session_tc)
+        if types is not None:
+            return types
+
+        with self._lock:
+            # another thread may have loaded the types while waiting on the lock
+            types = self._indicator_types.get(session_tc)
+            if types is None:
+                types = frozenset(ThreatIntelUtils(session_tc=session_tc).indicator_types)
+                if types:
+                    # only successful lookups are stored, so a failed request is retried
+                    self._indicator_types[session_tc] = types
+                    self.log.debug(
+                        f'feature=entity-type-registry, event=indicator-types-loaded, '
+                        f'count={len(types)}'
+                    )
+        return types
+
+
+# the process-wide entity type registry
+entity_type_registry = EntityTypeRegistry()
@@ -10,6 +10,7 @@ import jmespath
 from requests import Session
 
 # first-party
+from tcex.api.tc.utils.type_metadata_cache import type_metadata_cache
 from tcex.backports import cached_property
 from tcex.exit.error_codes import handle_error
 
@@ -57,6 +58,11 @@ class ThreatIntelUtils:
             },
         }
 
+    @property
+    def _base_url(self) -> Optional[str]:
+        """Return the TC instance URL of the session, used as the type metadata cache key."""
+        return getattr(self.session_tc, 'base_url', None)
+
     def _association_types(self) -> None:
         """Retrieve Custom Indicator Associations types from the ThreatConnect API."""
 
@@ -146,17 +152,8 @@ class ThreatIntelUtils:
                 return key
         return None
 
-    @cached_property
-    def indicator_associations_types_data(self) -> Dict[str, dict]:
-        """Return ThreatConnect associations type data.
-
-        Retrieve the data from the API if it hasn't already been retrieved.
-
-        Returns:
-            (dict): A dictionary of ThreatConnect associations types.
-        """
-        _association_types = {}
-
+    def _indicator_associations_types_fetch(self) -> Optional[Dict[str, dict]]:
+        """Return ThreatConnect associations type data from the API, None on failure."""
         # Dynamically create custom indicator class
         r = self.session_tc.get('/v2/types/associationTypes')
 
@@ -165,7 +162,7 @@ class ThreatIntelUtils:
             self.log.warning(
                 'feature=threat-intel-common, event=association-types-download, status=failure'
             )
-            return _association_types
+            return None
 
         # validate successful API results
         data: dict = r.json()
@@ -173,17 +170,36 @@ class ThreatIntelUtils:
             self.log.warning(
                 'feature=threat-intel-common, event=association-types-download, status=failure'
             )
-            return _association_types
+            return None
 
         # TODO: [low] make an Model for this data and return model?
+        association_types = {}
         try:
             # Association Type Name is not a unique value at this time, but should be.
-            association_types = {}
             for association in data.get('data', {}).get('associationType', []):
                 association_types[association.get('name')] = association
         except Exception as e:
             handle_error(code=200, message_values=[e])
-        return _association_types
+        return association_types
+
+    @cached_property
+    def indicator_associations_types_data(self) -> Dict[str, dict]:
+        """Return ThreatConnect associations type data.
+
+        Retrieve the data from the process-wide type metadata cache, which only calls the API
+        once per TTL window for each ThreatConnect instance.
+
+        Returns:
+            (dict): A dictionary of ThreatConnect associations types.
+        """
+        return (
+            type_metadata_cache.get(
+                self._base_url,
+                '/v2/types/associationTypes',
+                self._indicator_associations_types_fetch,
+            )
+            or {}
+        )
 
     @cached_property
     def indicator_types(self) -> List[str]:
@@ -239,15 +255,8 @@ class ThreatIntelUtils:
 
         return resolved_inputs
 
-    @cached_property
-    def indicator_types_data(self) -> Dict[str, dict]:
-        """Return ThreatConnect indicator types data.
-
-        Retrieve the data from the API if it hasn't already been retrieved.
-
-        Returns:
-            (dict): A dictionary of ThreatConnect Indicator data.
-        """
+    def _indicator_types_fetch(self) -> Dict[str, dict]:
+        """Return ThreatConnect indicator types data from the API."""
         # retrieve data from API
         r = self.session_tc.get('/v2/types/indicatorTypes')
 
@@ -260,6 +269,20 @@ class ThreatIntelUtils:
             _indicator_types[itd.get('name')] = itd
         return _indicator_types
 
+    @cached_property
+    def indicator_types_data(self) -> Dict[str, dict]:
+        """Return ThreatConnect indicator types data.
+
+        Retrieve the data from the process-wide type metadata cache, which only calls the API
+        once per TTL window for each ThreatConnect instance.
+
+        Returns:
+            (dict): A dictionary of ThreatConnect Indicator data.
+        """
+        return type_metadata_cache.get(
+            self._base_url, '/v2/types/indicatorTypes', self._indicator_types_fetch
+        )
+
     @staticmethod
     def safe_indicator(indicator: str) -> str:
         """Format indicator value for safe HTTP request.
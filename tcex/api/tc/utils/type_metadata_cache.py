@@ -0,0 +1,208 @@
+"""ThreatConnect Type Metadata Cache"""
+# standard library
+import hashlib
+import json
+import logging
+import os
+import stat
+import tempfile
+import threading
+import time
+from typing import Callable, Optional
+
+# get tcex logger
+logger = logging.getLogger('tcex')
+
+
+class TypeMetadataCache:
+    """ThreatConnect Type Metadata Cache
+
+    A process-wide, TTL based cache for ThreatConnect type metadata (e.g., indicator types and
+    association types) that is shared by all ThreatIntelUtils instances. Data is kept in memory
+    and written to disk keyed by the TC instance URL, so short lived Apps only call the API once
+    per TTL window.
+
+    * Fresh data (younger than ttl) is returned without calling the API.
+    * Stale data is returned immediately and revalidated in a background thread.
+    * When no data is available the API is called once, concurrent callers wait for the result.
+
+    The cache files are only used when the cache directory is owned by the current user and is
+    not writable by other users, otherwise the data is only cached in memory.
+
+    Args:
+        cache_path: The directory for the cache files, defaults to a private per-user directory
+            in the system temp directory.
+        ttl: The number of seconds cached data is considered fresh.
+    """
+
+    def __init__(self, cache_path: Optional[str] = None, ttl: Optional[int] = 3_600) -> None:
+        """Initialize Class Properties."""
+        self.cache_path = cache_path or self._default_cache_path()
+        self.ttl = ttl
+
+        # properties
+        self._data = {}  # key -> (fetched_at, data)
+        self._key_locks = {}
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._trusted_cache_paths = {}  # cache path -> trusted
+        self.log = logger
+
+    @staticmethod
+    def _default_cache_path() -> str:
+        """Return the per-user cache directory in the system temp directory."""
+        user = os.getuid() if hasattr(os, 'getuid') else os.getlogin()
+        return os.path.join(tempfile.gettempdir(), f'tcex-type-cache-{user}')
+
+    def _disk_enabled(self) -> bool:
+        """Return True if the cache directory can be trusted for the cache files.
+
+        The directory is created with owner only permissions. An existing directory (e.g., one
+        created by another user to plant type metadata) must be a real directory owned by the
+        current user that other users can't write to. The check is done once per directory.
+        """
+        cache_path = self.cache_path
+        with self._lock:
+            if cache_path not in self._trusted_cache_paths:
+                self._trusted_cache_paths[cache_path] = self._verify_cache_path(cache_path)
+            return self._trusted_cache_paths[cache_path]
+
+    @staticmethod
+    def _key(base_url: str, path: str) -> str:
+        """Return the cache key for the TC instance URL and API path."""
+        return hashlib.sha256(f'{base_url}{path}'.encode()).hexdigest()[:32]
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        """Return the lock for a single cache key."""
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _fetch(self, key: str, path: str, loader: Callable[[], Optional[dict]]) -> Optional[dict]:
+        """Call the loader and store the result in memory and on disk.
+
+        Args:
+            key: The cache key.
+            path: The API path, used for logging.
+            loader: The method that retrieves the data from the API, returns None on failure.
+        """
+        data = loader()
+        if data is None:
+            return None
+
+        fetched_at = time.time()
+        with self._lock:
+            self._data[key] = (fetched_at, data)
+        self._write(key, fetched_at, data)
+        self.log.debug(f'feature=type-metadata-cache, event=fetched, path={path}')
+        return data
+
+    def _fqfn(self, key: str) -> str:
+        """Return the cache filename for the key."""
+        return os.path.join(self.cache_path, f'{key}.json')
+
+    def _read(self, key: str) -> Optional[tuple]:
+        """Return the (fetched_at, data) stored on disk for the key."""
+        if not self._disk_enabled():
+            return None
+
+        try:
+            with open(self._fqfn(key)) as fh:
+                cached = json.load(fh)
+            return cached['fetched_at'], cached['data']
+        except (OSError, KeyError, TypeError, ValueError):
+            return None
+
+    def _refresh(self, key: str, path: str, loader: Callable[[], Optional[dict]]) -> None:
+        """Revalidate stale data in a background thread (once per key)."""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def _target():
+            try:
+                self._fetch(key, path, loader)
+            except Exception as e:
+                self.log.warning(
+                    f'feature=type-metadata-cache, event=refresh-failed, path={path}, error={e}'
+                )
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=_target, name='type-metadata-refresh', daemon=True).start()
+
+    def _verify_cache_path(self, cache_path: str) -> bool:
+        """Create the cache directory and verify it's private to the current user."""
+        try:
+            os.makedirs(cache_path, mode=0o700, exist_ok=True)
+            st = os.lstat(cache_path)
+        except OSError as e:
+            self.log.warning(f'feature=type-metadata-cache, event=create-failed, error={e}')
+            return False
+
+        trusted = stat.S_ISDIR(st.st_mode)
+        if hasattr(os, 'getuid'):
+            trusted = trusted and st.st_uid == os.getuid() and not st.st_mode & 0o022
+        if not trusted:
+            self.log.warning(
+                'feature=type-metadata-cache, event=untrusted-cache-path, '
+                f'cache-path={cache_path}, using memory only cache'
+            )
+        return trusted
+
+    def _write(self, key: str, fetched_at: float, data: dict) -> None:
+        """Atomically write the data for the key to disk (best effort)."""
+        if not self._disk_enabled():
+            return
+
+        try:
+            fd, temp_fqfn = tempfile.mkstemp(dir=self.cache_path, suffix='.tmp')
+            with os.fdopen(fd, 'w') as fh:
+                json.dump({'fetched_at': fetched_at, 'data': data}, fh)
+            os.replace(temp_fqfn, self._fqfn(key))
+        except OSError as e:
+            self.log.warning(f'feature=type-metadata-cache, event=write-failed, error={e}')
+
+    def clear(self) -> None:
+        """Clear the in-memory cache."""
+        with self._lock:
+            self._data.clear()
+
+    def get(
+        self, base_url: Optional[str], path: str, loader: Callable[[], Optional[dict]]
+    ) -> Optional[dict]:
+        """Return the cached data for the TC instance URL and API path.
+
+        Args:
+            base_url: The TC instance URL, when None the data is not cached.
+            path: The API path of the type metadata (e.g., /v2/types/indicatorTypes).
+            loader: The method that retrieves the data from the API, returns None on failure.
+        """
+        if not base_url:
+            return loader()
+
+        key = self._key(base_url, path)
+        with self._lock:
+            cached = self._data.get(key)
+
+        if cached is None:
+            with self._key_lock(key):
+                # another thread may have loaded the data while waiting on the lock
+                with self._lock:
+                    cached = self._data.get(key)
+                if cached is None:
+                    cached = self._read(key)
+                    if cached is None:
+                        return self._fetch(key, path, loader)
+                    with self._lock:
+                        self._data[key] = cached
+
+        fetched_at, data = cached
+        if time.time() - fetched_at >= self.ttl:
+            self._refresh(key, path, loader)
+        return data
+
+
+# the process-wide type metadata cache
+type_metadata_cache = TypeMetadataCache()
@@ -2,5 +2,11 @@
 # flake8: noqa
 # first-party
 from tcex.api.tc.v2.batch.batch import Batch
+from tcex.api.tc.v2.batch.batch_poll_strategy import (
+    AdaptivePollStrategy,
+    ExponentialPollStrategy,
+    FixedPollStrategy,
+    PollStrategy,
+)
 from tcex.api.tc.v2.batch.batch_submit import BatchSubmit
 from tcex.api.tc.v2.batch.batch_writer import BatchWriter, GroupType, IndicatorType
@@ -3,20 +3,28 @@
 import gzip
 import json
 import os
-import sys
+import re
+import shutil
+import tempfile
 import threading
 import time
 import traceback
 from collections import deque
-from typing import TYPE_CHECKING, Any, Callable, Optional, Tuple, Union
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Iterator, Optional, Tuple, Union
 
 # third-party
 from requests import Response, Session
+from requests.utils import super_len
 
 # first-party
+from tcex.api.tc.v2.batch.batch_multipart_encoder import BatchMultipartEncoder
+from tcex.api.tc.v2.batch.batch_poller import BatchPoller
 from tcex.api.tc.v2.batch.batch_submit import BatchSubmit
 from tcex.api.tc.v2.batch.batch_writer import BatchWriter, GroupType, IndicatorType
 from tcex.exit.error_codes import handle_error
+from tcex.pleb.threading import ThreadContext
 
 if TYPE_CHECKING:
     # first-party
@@ -76,8 +84,15 @@ class Batch(BatchWriter, BatchSubmit):
         # properties
         self._batch_max_chunk = 5_000
         self._batch_max_size = 75_000_000  # max size in bytes
+        self._batch_spool_max_size = 1_000_000  # batch JSON spooled to disk above this size
         self._file_merge_mode = None
+        self._error_json_lock = threading.Lock()
         self._file_threads = []
+        self._file_threads_lock = threading.Lock()
+        self._file_upload_backoff = 2  # seconds, doubled on each retry
+        self._file_upload_retries = 3
+        self._file_upload_retry_status_codes = [429, 500, 502, 503, 504]
+        self._file_upload_workers = 4
         self._hash_collision_mode = None
         self._submit_thread = None
 
@@ -92,12 +107,6 @@ class Batch(BatchWriter, BatchSubmit):
         self._saved_indicators = None  # indicates indicators shelf file was provided
         self.enable_saved_file = False
 
-        # default properties
-        self._batch_data_count = None
-        self._poll_interval = None
-        self._poll_interval_times = []
-        self._poll_timeout = 3600
-
         # batch debug/replay variables
         self._debug = None
         self.debug_path = os.path.join(self.inputs.model.tc_temp_path, 'DEBUG')
@@ -132,7 +141,7 @@ class Batch(BatchWriter, BatchSubmit):
         if self.groups.get(xid) is not None:
             # return existing group from memory
             group_data = self.groups.get(xid)
-        elif self.groups_shelf.get(xid) is not None:
+        elif xid in self.groups_shelf:
             # return existing group from shelf
             group_data = self.groups_shelf.get(xid)
         else:
@@ -162,7 +171,7 @@ class Batch(BatchWriter, BatchSubmit):
         if self.indicators.get(xid) is not None:
             # return existing indicator from memory
             indicator_data = self.indicators.get(xid)
-        elif self.indicators_shelf.get(xid) is not None:
+        elif xid in self.indicators_shelf:
             # return existing indicator from shelf
             indicator_data = self.indicators_shelf.get(xid)
         else:
@@ -170,6 +179,61 @@ class Batch(BatchWriter, BatchSubmit):
             self.indicators[xid] = indicator_data
         return indicator_data
 
+    @staticmethod
+    @contextmanager
+    def _file_content_body(content: Union[bytes, str, os.PathLike, BinaryIO]) -> Iterator:
+        """Yield the file content as a request body, rewinding or opening streams as required.
+
+        Args:
+            content: The file content, a path to the file, or a binary file object.
+        """
+        if isinstance(content, os.PathLike):
+            with open(content, 'rb') as fh:
+                yield fh
+        else:
+            if hasattr(content, 'seekable') and content.seekable():
+                content.seek(0)
+            yield content
+
+    @contextmanager
+    def _file_content_rewindable(
+        self, content: Union[bytes, str, os.PathLike, BinaryIO]
+    ) -> Iterator[Union[bytes, str, os.PathLike, BinaryIO]]:
+        """Yield file content that can be read more than once.
+
+        A stream that can not be rewound (e.g., a socket or a pipe) is read once into a spooled
+        temp file, so that the debug save, upload retries, and the PUT fallback can all send it.
+
+        Args:
+            content: The file content, a path to the file, or a binary file object.
+        """
+        if not hasattr(content, 'read') or (hasattr(content, 'seekable') and content.seekable()):
+            yield content
+            return
+
+        with tempfile.SpooledTemporaryFile(
+            max_size=self._batch_spool_max_size, dir=self.inputs.model.tc_temp_path
+        ) as fh:
+            shutil.copyfileobj(content, fh)
+            yield fh
+
+    def _file_content_save(
+        self, content: Union[bytes, str, os.PathLike, BinaryIO], fqfn: str
+    ) -> None:
+        """Write the file content to disk without reading streams into memory.
+
+        Args:
+            content: The file content, a path to the file, or a binary file object.
+            fqfn: The fully qualified filename to write.
+        """
+        with self._file_content_body(content) as body, open(fqfn, 'wb') as fh:
+            if hasattr(body, 'read'):
+                shutil.copyfileobj(body, fh)
+            else:
+                if not isinstance(body, bytes):
+                    body = body.encode()
+                fh.write(body)
+
     def close(self) -> None:
         """Cleanup batch job."""
         # allow pol thread to complete before wrapping up
@@ -177,7 +241,9 @@ class Batch(BatchWriter, BatchSubmit):
             self._submit_thread.join()
 
         # allow file threads to complete before wrapping up job
-        for t in self._file_threads:
+        with self._file_threads_lock:
+            file_threads = list(self._file_threads)
+        for t in file_threads:
             t.join()
 
         self.groups_shelf.close()
@@ -186,7 +252,7 @@ class Batch(BatchWriter, BatchSubmit):
             # delete saved files
             if os.path.isfile(self.group_shelf_fqfn):
                 os.remove(self.group_shelf_fqfn)
-            if os.path.isfile(self.group_shelf_fqfn):
+            if os.path.isfile(self.indicator_shelf_fqfn):
                 os.remove(self.indicator_shelf_fqfn)
 
     @property
@@ -259,7 +325,7 @@ class Batch(BatchWriter, BatchSubmit):
 
                 # update entity trackers
                 tracker['count'] += 1
-                tracker['bytes'] += sys.getsizeof(json.dumps(group_data))
+                tracker['bytes'] += len(self._size_tracker.encode(group_data, cache=True))
 
                 # extend xids with any groups associated with the same GroupType
                 xids.extend(group_data.get('associatedGroupXid', []))
@@ -344,15 +410,14 @@ class Batch(BatchWriter, BatchSubmit):
             bool: True if max values have been hit, else False.
         """
         # process the indicators
-        for xid, indicator_data in list(indicators.items()):
+        for _, indicator_data in self._drain(indicators):
             if not isinstance(indicator_data, dict):
                 indicator_data = indicator_data.data
             data['indicator'].append(indicator_data)
-            del indicators[xid]
 
             # update entity trackers
             tracker['count'] += 1
-            tracker['bytes'] += sys.getsizeof(json.dumps(indicator_data))
+            tracker['bytes'] += len(self._size_tracker.encode(indicator_data, cache=True))
 
             if tracker.get('count') % 2_500 == 0:
                 # log count/size at a sane level
@@ -395,6 +460,26 @@ class Batch(BatchWriter, BatchSubmit):
                 self._debug = True
         return self._debug
 
+    @property
+    def file_upload_retries(self) -> int:
+        """Return the number of times a failed file upload is retried."""
+        return self._file_upload_retries
+
+    @file_upload_retries.setter
+    def file_upload_retries(self, value: int):
+        """Set the number of times a failed file upload is retried."""
+        self._file_upload_retries = int(value)
+
+    @property
+    def file_upload_workers(self) -> int:
+        """Return the max number of concurrent file uploads."""
+        return self._file_upload_workers
+
+    @file_upload_workers.setter
+    def file_upload_workers(self, value: int):
+        """Set the max number of concurrent file uploads."""
+        self._file_upload_workers = max(int(value), 1)
+
     @property
     def halt_on_file_error(self) -> bool:
         """Return halt on file post error value."""
@@ -477,8 +562,7 @@ class Batch(BatchWriter, BatchSubmit):
                 continue
 
             # write the file to disk
-            with open(fqfn, 'wb') as fh:
-                fh.write(content)
+            self._file_content_save(content, fqfn)
 
     @property
     def saved_groups(self) -> bool:
@@ -590,16 +674,7 @@ class Batch(BatchWriter, BatchSubmit):
 
         if process_files:
             # submit file data after batch job is complete
-            self._file_threads.append(
-                self.submit_thread(
-                    name='submit-files',
-                    target=self.submit_files,
-                    args=(
-                        file_data,
-                        halt_on_error,
-                    ),
-                )
-            )
+            self._append_file_thread(file_data, halt_on_error)
         return batch_data
 
     def submit_all(
@@ -633,11 +708,7 @@ class Batch(BatchWriter, BatchSubmit):
             dict: The Batch Status from the ThreatConnect API.
         """
         batch_data_array = []
-        file_data = {}
         while True:
-            batch_data = {}
-            batch_id = None
-
             # get file, group, and indicator data
             content = self.data
 
@@ -645,69 +716,198 @@ class Batch(BatchWriter, BatchSubmit):
             if not content.get('group') and not content.get('indicator'):
                 break
 
-            if self.action.lower() == 'delete':
-                # no need to process files on a delete batch job
-                process_files = False
+            batch_data_array.append(
+                self._submit_all_chunk(content, poll, errors, process_files, halt_on_error)
+            )
 
-                # while waiting of FR for delete support in createAndUpload submit delete request
-                # the old way (submit job + submit data), still using V2.
-                if len(content) > 0:  # pylint: disable=len-as-condition
-                    batch_id = self.submit_job(halt_on_error)
-                    if batch_id is not None:
-                        batch_data = self.submit_data(
-                            batch_id=batch_id, content=content, halt_on_error=halt_on_error
-                        )
+        return batch_data_array
+
+    def _submit_all_chunk(
+        self,
+        content: dict,
+        poll: bool,
+        errors: bool,
+        process_files: bool,
+        halt_on_error: bool,
+        poller: Optional[BatchPoller] = None,
+    ) -> dict:
+        """Submit a single chunk of batch data to ThreatConnect API.
+
+        Args:
+            content: The dict of file, groups, and indicator data.
+            poll: If True poll batch for status.
+            errors: If True retrieve any batch errors (only if poll is True).
+            process_files: If true send any document or report attachments to the API.
+            halt_on_error: If True any exception will raise an error.
+            poller: The poller for the batch status, if not provided the batch is polled in
+                the calling thread.
+
+        Returns.
+            dict: The Batch Status from the ThreatConnect API.
+        """
+        batch_data = {}
+        batch_id = None
+        file_data = {}
+
+        if self.action.lower() == 'delete':
+            # no need to process files on a delete batch job
+            process_files = False
+
+            # while waiting of FR for delete support in createAndUpload submit delete request
+            # the old way (submit job + submit data), still using V2.
+            if len(content) > 0:  # pylint: disable=len-as-condition
+                batch_id = self.submit_job(halt_on_error)
+                if batch_id is not None:
+                    batch_data = self.submit_data(
+                        batch_id=batch_id, content=content, halt_on_error=halt_on_error
+                    )
+            else:
+                batch_data = {}
+        else:
+            # pop any file content to pass to submit_files
+            file_data = content.pop('file', {})
+            batch_data = (
+                self.submit_create_and_upload(content=content, halt_on_error=halt_on_error)
+                .get('data', {})
+                .get('batchStatus', {})
+            )
+            batch_id = batch_data.get('id')
+
+        if batch_id is not None:
+            self.log.info(f'feature=batch, event=status, batch-id={batch_id}')
+            # job hit queue
+            if poll:
+                # poll for status
+                if poller is not None:
+                    batch_data = poller.poll(batch_id, halt_on_error=halt_on_error).result()
                 else:
-                    batch_data = {}
+                    batch_data = self.poll(batch_id, halt_on_error=halt_on_error)
+                batch_data = batch_data.get('data', {}).get('batchStatus')
+                if errors:
+                    # retrieve errors
+                    error_count = batch_data.get('errorCount', 0)
+                    error_groups = batch_data.get('errorGroupCount', 0)
+                    error_indicators = batch_data.get('errorIndicatorCount', 0)
+                    if error_count > 0 or error_groups > 0 or error_indicators > 0:
+                        batch_data['errors'] = self.errors(batch_id)
             else:
-                # pop any file content to pass to submit_files
-                file_data = content.pop('file', {})
-                batch_data = (
-                    self.submit_create_and_upload(content=content, halt_on_error=halt_on_error)
-                    .get('data', {})
-                    .get('batchStatus', {})
+                # can't process files if status is unknown (polling must be enabled)
+                process_files = False
+
+        if process_files:
+            # submit file data after batch job is complete
+            self._append_file_thread(file_data, halt_on_error)
+
+        # write errors for debugging
+        self.write_error_json(batch_data.get('errors'))
+
+        return batch_data
+
+    def _submit_all_pipeline_stop(self, futures: set) -> bool:
+        """Return True if any completed batch job raised or returned a critical error.
+
+        Args:
+            futures: The completed batch job futures.
+        """
+        for future in futures:
+            if future.exception() is not None:
+                self.log.error(
+                    f'feature=batch, event=submit-pipeline-halted, error={future.exception()}'
                 )
-                batch_id = batch_data.get('id')
-
-            if batch_id is not None:
-                self.log.info(f'feature=batch, event=status, batch-id={batch_id}')
-                # job hit queue
-                if poll:
-                    # poll for status
-                    batch_data = (
-                        self.poll(batch_id, halt_on_error=halt_on_error)
-                        .get('data', {})
-                        .get('batchStatus')
+                return True
+
+            for error in future.result().get('errors') or []:
+                error_reason = error.get('errorReason') or ''
+                for error_msg in self._critical_failures:
+                    if re.findall(error_msg, error_reason):
+                        self.log.error(
+                            'feature=batch, event=submit-pipeline-halted, '
+                            f'error-reason={error_reason}'
+                        )
+                        return True
+        return False
+
+    def submit_all_pipeline(
+        self,
+        poll: Optional[bool] = True,
+        errors: Optional[bool] = True,
+        process_files: Optional[bool] = True,
+        halt_on_error: Optional[bool] = True,
+        max_in_flight: Optional[int] = 3,
+    ) -> list:
+        """Submit Batch request to ThreatConnect API with multiple batch jobs in flight.
+
+        This method works the same as submit_all, except each batch job is submitted and has
+        errors retrieved in a worker thread, with the status of all in flight batch jobs polled
+        by a single poller thread. While the worker threads wait on the API the next chunk of
+        batch data is built, with up to max_in_flight batch jobs outstanding at any time.
+
+        If a batch job raises an exception or returns a critical error no new batch jobs are
+        submitted, the in flight batch jobs are allowed to complete and any data not yet
+        submitted remains in the batch.
+
+        Args:
+            poll: If True poll batch for status.
+            errors: If True retrieve any batch errors (only if poll is True).
+            process_files: If true send any document or report attachments to the API.
+            halt_on_error: If True any exception will raise an error.
+            max_in_flight: The max number of batch jobs submitted at the same time.
+
+        Returns.
+            list: The Batch Status from the ThreatConnect API, in the order submitted.
+        """
+        futures = []
+        in_flight = set()
+        halted = False
+        # the batch jobs are submitted and polled in the context of the calling thread
+        context = ThreadContext()
+        poller = BatchPoller(self)
+        try:
+            with ThreadPoolExecutor(
+                max_workers=max_in_flight, thread_name_prefix='submit-pipeline'
+            ) as executor:
+                while True:
+                    if len(in_flight) >= max_in_flight:
+                        # wait for a batch job to complete before building the next chunk
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        halted = self._submit_all_pipeline_stop(done)
+                    else:
+                        done = {f for f in in_flight if f.done()}
+                        in_flight -= done
+                        halted = self._submit_all_pipeline_stop(done)
+
+                    if halted is True:
+                        break
+
+                    # get file, group, and indicator data
+                    content = self.data
+
+                    # break loop when end of data is reached
+                    if not content.get('group') and not content.get('indicator'):
+                        break
+
+                    future = executor.submit(
+                        context.run,
+                        self._submit_all_chunk,
+                        content,
+                        poll,
+                        errors,
+                        process_files,
+                        halt_on_error,
+                        poller,
                     )
-                    if errors:
-                        # retrieve errors
-                        error_count = batch_data.get('errorCount', 0)
-                        error_groups = batch_data.get('errorGroupCount', 0)
-                        error_indicators = batch_data.get('errorIndicatorCount', 0)
-                        if error_count > 0 or error_groups > 0 or error_indicators > 0:
-                            batch_data['errors'] = self.errors(batch_id)
-                else:
-                    # can't process files if status is unknown (polling must be enabled)
-                    process_files = False
-
-            if process_files:
-                # submit file data after batch job is complete
-                self._file_threads.append(
-                    self.submit_thread(
-                        name='submit-files',
-                        target=self.submit_files,
-                        args=(
-                            file_data,
-                            halt_on_error,
-                        ),
+                    futures.append(future)
+                    in_flight.add(future)
+                    self.log.debug(
+                        f'feature=batch, event=submit-pipeline, batch-job={len(futures)}, '
+                        f'in-flight={len(in_flight)}'
                     )
-                )
-            batch_data_array.append(batch_data)
+        finally:
+            # the poller completes any batch jobs still being polled before stopping
+            poller.stop()
 
-            # write errors for debugging
-            self.write_error_json(batch_data.get('errors'))
-
-        return batch_data_array
+        # raise the first exception in submission order, after all batch jobs are complete
+        return [future.result() for future in futures]
 
     def submit_callback(
         self,
@@ -765,7 +965,7 @@ class Batch(BatchWriter, BatchSubmit):
             .get('data', {})
             .get('batchStatus', {})
         )
-        self.log.trace(f'feature=batch, event=submit-callback, batch-data={batch_data}')
+        self.log.trace('feature=batch, event=submit-callback, batch-data=%s', batch_data)
 
         # launch batch polling in a thread
         self._submit_thread = self.submit_thread(
@@ -808,16 +1008,7 @@ class Batch(BatchWriter, BatchSubmit):
         # submission thread is allowed, there is no limit on file upload threads. the upload
         # status returned by file upload will be ignored when running in a thread.
         if file_data:
-            self._file_threads.append(
-                self.submit_thread(
-                    name='submit-files',
-                    target=self.submit_files,
-                    args=(
-                        file_data,
-                        halt_on_error,
-                    ),
-                )
-            )
+            self._append_file_thread(file_data, halt_on_error)
 
         # send batch_status to callback
         if callable(callback):
@@ -841,9 +1032,6 @@ class Batch(BatchWriter, BatchSubmit):
         if self.halt_on_batch_error is not None:
             halt_on_error = self.halt_on_batch_error
 
-        # special code for debugging App using batchV2.
-        self.write_batch_json(content)
-
         # store the length of the batch data to use for poll interval calculations
         self.log.info(
             '''feature=batch, event=submit-create-and-upload, type=group, '''
@@ -855,16 +1043,33 @@ class Batch(BatchWriter, BatchSubmit):
         )
 
         try:
-            files = (('config', json.dumps(self.settings)), ('content', json.dumps(content)))
-            params = {'includeAdditional': 'true'}
-            r = self.session_tc.post('/v2/batch/createAndUpload', files=files, params=params)
+            # serialize the batch data once, reusing the entity bytes encoded while collecting
+            # the batch data, into a temp file that is streamed for the upload and debug write
+            with tempfile.SpooledTemporaryFile(
+                max_size=self._batch_spool_max_size, dir=self.inputs.model.tc_temp_path
+            ) as content_fh:
+                self._size_tracker.dump(content, content_fh)
+
+                # special code for debugging App using batchV2.
+                self.write_batch_json(content_fh)
+
+                body = BatchMultipartEncoder(
+                    [('config', json.dumps(self.settings).encode()), ('content', content_fh)]
+                )
+                headers = {'Content-Type': body.content_type}
+                params = {'includeAdditional': 'true'}
+                r = self.session_tc.post(
+                    '/v2/batch/createAndUpload', data=body, headers=headers, params=params
+                )
             if not r.ok or 'application/json' not in r.headers.get('content-type', ''):
                 handle_error(
                     code=10510,
                     message_values=[r.status_code, r.text],
                     raise_error=halt_on_error,
                 )
-            return r.json()
+            data = r.json()
+            self._batch_size_record(data.get('data', {}).get('batchStatus', {}).get('id'), content)
+            return data
         except Exception as e:
             handle_error(code=10505, message_values=[e], raise_error=halt_on_error)
 
@@ -873,6 +1078,14 @@ class Batch(BatchWriter, BatchSubmit):
     def submit_files(self, file_data: dict, halt_on_error: Optional[bool] = True) -> dict:
         """Submit Files for Documents and Reports to ThreatConnect API.
 
+        Up to file_upload_workers files are uploaded at the same time. File content can be
+        bytes, a string, a path (os.PathLike) or a binary file object, or a callable that
+        returns any of these. Paths and file objects are streamed to the API instead of
+        being read into memory. Uploads that fail with a connection error or a retryable
+        status code are retried up to file_upload_retries times with exponential backoff. The
+        files are uploaded in the context of the calling thread, so in Service Apps the token
+        of the calling thread is used.
+
         Critical Errors
 
         * There is insufficient document storage allocated to this account.
@@ -888,79 +1101,177 @@ class Batch(BatchWriter, BatchSubmit):
         if self.halt_on_file_error is not None:
             halt_on_error = self.halt_on_file_error
 
-        upload_status = []
         self.log.info(f'feature=batch, action=submit-files, count={len(file_data)}')
-        for xid, content_data in list(file_data.items()):
-            del file_data[xid]  # win or loose remove the entry
-            status = True
+        context = ThreadContext()
+        futures = []
+        start = time.time()
+        with ThreadPoolExecutor(
+            max_workers=self.file_upload_workers, thread_name_prefix='submit-files'
+        ) as executor:
+            for xid, content_data in list(file_data.items()):
+                del file_data[xid]  # win or loose remove the entry
+
+                # used for debug/testing to prevent upload of previously uploaded file
+                if self.debug and xid in self.saved_xids:
+                    self.log.debug(
+                        f'feature=batch-submit-files, action=skip-previously-saved-file, xid={xid}'
+                    )
+                    continue
 
-            # used for debug/testing to prevent upload of previously uploaded file
-            if self.debug and xid in self.saved_xids:
-                self.log.debug(
-                    f'feature=batch-submit-files, action=skip-previously-saved-file, xid={xid}'
+                futures.append(
+                    executor.submit(
+                        context.run, self._submit_file, xid, content_data, halt_on_error
+                    )
                 )
-                continue
 
-            # process the file content
-            content = content_data.get('fileContent')
-            if callable(content):
-                try:
-                    content_callable_name = getattr(content, '__name__', repr(content))
-                    self.log.trace(
-                        f'feature=batch-submit-files, method={content_callable_name}, xid={xid}'
-                    )
-                    content = content_data.get('fileContent')(xid)
-                except Exception as e:
-                    self.log.warning(f'feature=batch, event=file-download-exception, err="""{e}"""')
+            try:
+                for future in as_completed(futures):
+                    status, _ = future.result()
+                    if (
+                        status.get('uploaded') is True
+                        and self.debug
+                        and self.enable_saved_file
+                        and status.get('xid') not in self.saved_xids
+                    ):
+                        # save xid "if" successfully uploaded and not already saved
+                        self.saved_xids = status.get('xid')
+            except Exception:
+                # cancel any uploads that have not started
+                for future in futures:
+                    future.cancel()
+                raise
+
+        # the upload status is returned in the same order as the file data
+        results = [future.result() for future in futures]
+        upload_status = [status for status, _ in results]
+
+        elapsed = max(time.time() - start, 0.001)
+        size = sum(size for _, size in results)
+        self.log.info(
+            f'feature=batch, event=file-upload-complete, count={len(upload_status)}, '
+            f'''uploaded={len([s for s in upload_status if s.get('uploaded')])}, '''
+            f'bytes={size:,}, elapsed={elapsed:.2f}s, '
+            f'throughput={size / elapsed / 1_000_000:.2f}MB/s'
+        )
 
-            if content is None:
-                upload_status.append({'uploaded': False, 'xid': xid})
-                self.log.warning(f'feature=batch-submit-files, xid={xid}, event=content-null')
-                continue
+        return upload_status
 
-            api_branch = 'documents'
-            if content_data.get('type') == 'Report':
-                api_branch = 'reports'
+    def _submit_file(self, xid: str, content_data: dict, halt_on_error: bool) -> Tuple[dict, int]:
+        """Upload the file content for a single Document or Report.
 
-            if self.debug and content_data.get('fileName'):
-                # special code for debugging App using batchV2.
-                fqfn = os.path.join(
-                    self.debug_path_files,
-                    f'''{api_branch}--{xid}--{content_data.get('fileName').replace('/', ':')}''',
+        Args:
+            xid: The xid of the Document or Report.
+            content_data: The file data (fileContent, fileName, and type).
+            halt_on_error: If True any exception will raise an error.
+
+        Returns:
+            Tuple[dict, int]: The upload status and the number of bytes uploaded.
+        """
+        # process the file content
+        content = content_data.get('fileContent')
+        if callable(content):
+            try:
+                content_callable_name = getattr(content, '__name__', repr(content))
+                self.log.trace(
+                    f'feature=batch-submit-files, method={content_callable_name}, xid={xid}'
+                )
+                content = content_data.get('fileContent')(xid)
+            except Exception as e:
+                self.log.warning(f'feature=batch, event=file-download-exception, err="""{e}"""')
+                content = None
+
+        if content is None:
+            self.log.warning(f'feature=batch-submit-files, xid={xid}, event=content-null')
+            return {'uploaded': False, 'xid': xid}, 0
+
+        api_branch = 'documents'
+        if content_data.get('type') == 'Report':
+            api_branch = 'reports'
+
+        with self._file_content_rewindable(content) as content:
+            return self._submit_file_content(xid, content_data, content, api_branch, halt_on_error)
+
+    def _submit_file_content(
+        self,
+        xid: str,
+        content_data: dict,
+        content: Union[bytes, str, os.PathLike, BinaryIO],
+        api_branch: str,
+        halt_on_error: bool,
+    ) -> Tuple[dict, int]:
+        """Upload rewindable file content, retrying and falling back to PUT as required.
+
+        Args:
+            xid: The xid of the Document or Report.
+            content_data: The file data (fileContent, fileName, and type).
+            content: The file content, a path to the file, or a seekable binary file object.
+            api_branch: The API branch for the upload (documents or reports).
+            halt_on_error: If True any exception will raise an error.
+
+        Returns:
+            Tuple[dict, int]: The upload status and the number of bytes uploaded.
+        """
+        if self.debug and content_data.get('fileName'):
+            # special code for debugging App using batchV2.
+            fqfn = os.path.join(
+                self.debug_path_files,
+                f'''{api_branch}--{xid}--{content_data.get('fileName').replace('/', ':')}''',
+            )
+            if os.path.isdir(os.path.dirname(fqfn)):
+                self._file_content_save(content, fqfn)
+
+        # Post File
+        url = f'/v2/groups/{api_branch}/{xid}/upload'
+        headers = {'Content-Type': 'application/octet-stream'}
+        params = {'owner': self._owner, 'updateIfExists': 'true'}
+        method = 'POST'
+        retry = 0
+        size = 0
+        while True:
+            last_attempt = retry >= self.file_upload_retries
+            with self._file_content_body(content) as body:
+                size = super_len(body)
+                r = self.submit_file_content(
+                    method, url, body, headers, params, halt_on_error and last_attempt
                 )
-                if os.path.isdir(os.path.dirname(fqfn)):
-                    with open(fqfn, 'wb') as fh:
-                        if not isinstance(content, bytes):
-                            content = content.encode()
-                        fh.write(content)
-
-            # Post File
-            url = f'/v2/groups/{api_branch}/{xid}/upload'
-            headers = {'Content-Type': 'application/octet-stream'}
-            params = {'owner': self._owner, 'updateIfExists': 'true'}
-            r = self.submit_file_content('POST', url, content, headers, params, halt_on_error)
-            if r.status_code == 401:
+
+            if r is not None and r.status_code == 401 and method == 'POST':
                 # use PUT method if file already exists
                 self.log.info('feature=batch, event=401-from-post, action=switch-to-put')
-                r = self.submit_file_content('PUT', url, content, headers, params, halt_on_error)
-            if not r.ok:
-                status = False
-                handle_error(
-                    code=585,
-                    message_values=[r.status_code, r.text],
-                    raise_error=halt_on_error,
-                )
-            elif self.debug and self.enable_saved_file and xid not in self.saved_xids:
-                # save xid "if" successfully uploaded and not already saved
-                self.saved_xids = xid
+                method = 'PUT'
+                continue
 
-            self.log.info(
-                f'feature=batch, event=file-upload, status={r.status_code}, '
-                f'xid={xid}, remaining={len(file_data)}'
+            if last_attempt or (
+                r is not None and r.status_code not in self._file_upload_retry_status_codes
+            ):
+                break
+
+            # retry with exponential backoff
+            retry += 1
+            backoff = self._file_upload_backoff * 2 ** (retry - 1)
+            self.log.warning(
+                f'feature=batch, event=file-upload-retry, xid={xid}, retry={retry}, '
+                f'status={getattr(r, "status_code", None)}, backoff={backoff}'
+            )
+            time.sleep(backoff)
+
+        status = True
+        if r is None:
+            # the exception was handled by submit_file_content
+            status = False
+        elif not r.ok:
+            status = False
+            handle_error(
+                code=585,
+                message_values=[r.status_code, r.text],
+                raise_error=halt_on_error,
             )
-            upload_status.append({'uploaded': status, 'xid': xid})
 
-        return upload_status
+        self.log.info(
+            f'feature=batch, event=file-upload, status={getattr(r, "status_code", None)}, '
+            f'xid={xid}, bytes={size}'
+        )
+        return {'uploaded': status, 'xid': xid}, size if status else 0
 
     def submit_file_content(
         self,
@@ -1025,6 +1336,19 @@ class Batch(BatchWriter, BatchSubmit):
         self.log.debug(f'feature=batch, event=submit-job, status={data}')
         return data.get('data', {}).get('batchId')
 
+    def _append_file_thread(self, file_data: dict, halt_on_error: bool) -> None:
+        """Start a thread to submit file data, tracked so close() waits for it."""
+        t = self.submit_thread(
+            name='submit-files',
+            target=self.submit_files,
+            args=(
+                file_data,
+                halt_on_error,
+            ),
+        )
+        with self._file_threads_lock:
+            self._file_threads.append(t)
+
     def submit_thread(
         self,
         name: str,
@@ -1032,7 +1356,7 @@ class Batch(BatchWriter, BatchSubmit):
         args: Optional[tuple] = None,
         kwargs: Optional[dict] = None,
     ) -> None:
-        """Start a submit thread.
+        """Start a submit thread, in the context of the calling thread.
 
         Args:
             name: The name of the thread.
@@ -1041,10 +1365,12 @@ class Batch(BatchWriter, BatchSubmit):
             kwargs: Additional args.
         """
         self.log.info(f'feature=batch, event=submit-thread, name={name}')
-        args = args or ()
+        args = (target,) + tuple(args or ())
         t = None
         try:
-            t = threading.Thread(name=name, target=target, args=args, kwargs=kwargs, daemon=True)
+            t = threading.Thread(
+                name=name, target=ThreadContext().run, args=args, kwargs=kwargs, daemon=True
+            )
             t.start()
         except Exception:
             self.log.trace(traceback.format_exc())
@@ -1059,20 +1385,32 @@ class Batch(BatchWriter, BatchSubmit):
         if self.debug:
             if not errors:
                 errors = []
-            # get timestamp as a string without decimal place and consistent length
-            timestamp = str(int(time.time() * 10000000))
-            error_json_file = os.path.join(self.debug_path_batch, f'errors-{timestamp}.json.gz')
-            with gzip.open(error_json_file, mode='wt', encoding='utf-8') as fh:
-                json.dump(errors, fh)
+            # pipeline worker threads write errors concurrently, keep the file names unique
+            with self._error_json_lock:
+                # get timestamp as a string without decimal place and consistent length
+                timestamp = str(int(time.time() * 10000000))
+                error_json_file = os.path.join(self.debug_path_batch, f'errors-{timestamp}.json.gz')
+                with gzip.open(error_json_file, mode='wt', encoding='utf-8') as fh:
+                    json.dump(errors, fh)
+
+    def write_batch_json(self, content: Union[dict, BinaryIO]) -> None:
+        """Write batch json data to a file.
 
-    def write_batch_json(self, content: dict) -> None:
-        """Write batch json data to a file."""
+        Args:
+            content: The dict of groups and indicator data or a binary file object containing
+                the serialized batch JSON.
+        """
         if self.debug and content:
             # get timestamp as a string without decimal place and consistent length
             timestamp = str(int(time.time() * 10000000))
             batch_json_file = os.path.join(self.debug_path_batch, f'batch-{timestamp}.json.gz')
-            with gzip.open(batch_json_file, mode='wt', encoding='utf-8') as fh:
-                json.dump(content, fh)
+            if hasattr(content, 'read'):
+                content.seek(0)
+                with gzip.open(batch_json_file, mode='wb') as fh:
+                    shutil.copyfileobj(content, fh)
+            else:
+                with gzip.open(batch_json_file, mode='wt', encoding='utf-8') as fh:
+                    json.dump(content, fh)
 
     @property
     def group_len(self) -> int:
@@ -0,0 +1,115 @@
+"""ThreatConnect Batch Import Module"""
+# standard library
+import json
+from typing import BinaryIO, Optional, Union
+
+
+class BatchChunkWriter:
+    """ThreatConnect Batch Chunk Writer
+
+    Incrementally write batch JSON data ({"group": [...], "indicator": [...]}) to a binary
+    file handle. Each entity is written as soon as it is added, so only a single serialized
+    entity is held in memory regardless of the size of the chunk.
+
+    All groups must be added before any indicators.
+
+    Args:
+        fh: A writable binary file handle (e.g., gzip.open(fqfn, 'wb')).
+        max_count: The maximum number of entities for this chunk.
+        max_size: The maximum number of serialized bytes for this chunk.
+    """
+
+    __slots__ = ['_section', '_section_count', 'count', 'fh', 'max_count', 'max_size', 'size']
+
+    _sections = ['group', 'indicator']
+
+    def __init__(
+        self, fh: BinaryIO, max_count: Optional[int] = None, max_size: Optional[int] = None
+    ) -> None:
+        """Initialize Class Properties."""
+        self.fh = fh
+        self.max_count = max_count
+        self.max_size = max_size
+
+        # properties
+        self._section = None
+        self._section_count = 0
+        self.count = 0
+        self.size = 0
+
+    def _write(self, data: bytes) -> None:
+        """Write data to the file handle and track the size."""
+        self.fh.write(data)
+        self.size += len(data)
+
+    def _start_section(self, entity_type: str) -> None:
+        """Close the current section (if any) and open the section for the entity type.
+
+        Args:
+            entity_type: The entity type ("group" or "indicator").
+        """
+        if entity_type not in self._sections:
+            raise RuntimeError(f'Invalid batch entity type ({entity_type}).')
+
+        # sections are written in order, any skipped section is written as an empty array
+        start = 0 if self._section is None else self._sections.index(self._section) + 1
+        end = self._sections.index(entity_type)
+        if end < start:
+            raise RuntimeError('Groups must be added to a batch chunk before indicators.')
+
+        if self._section is not None:
+            # close the current section
+            self._write(b']')
+
+        for section in self._sections[start:end]:
+            self._open_section(section)
+            self._write(b']')
+        self._open_section(entity_type)
+
+    def _open_section(self, section: str) -> None:
+        """Write the opening of a section array."""
+        if self._section is None:
+            self._write(b'{')
+        else:
+            self._write(b', ')
+        self._write(f'"{section}": ['.encode())
+        self._section = section
+        self._section_count = 0
+
+    def add(self, entity_type: str, data: Union[bytes, dict]) -> None:
+        """Add a group or indicator to the chunk.
+
+        Args:
+            entity_type: The entity type ("group" or "indicator").
+            data: The entity dict or the already serialized (UTF-8) entity.
+        """
+        if isinstance(data, dict):
+            data = json.dumps(data).encode()
+
+        if entity_type != self._section:
+            self._start_section(entity_type)
+        elif self._section_count > 0:
+            self._write(b', ')
+
+        self._write(data)
+        self._section_count += 1
+        self.count += 1
+
+    def finish(self) -> None:
+        """Write the closing sections of the batch JSON data.
+
+        The file handle is not closed, that is the responsibility of the caller.
+        """
+        if self._section != self._sections[-1]:
+            self._start_section(self._sections[-1])
+        self._write(b']}')
+        self._section = None
+
+    @property
+    def full(self) -> bool:
+        """Return True if the chunk has reached the max count or max size."""
+        if self.max_count is not None and self.count >= self.max_count:
+            return True
+        if self.max_size is not None and self.size >= self.max_size:
+            return True
+        return False
@@ -0,0 +1,70 @@
+"""ThreatConnect Batch Import Module"""
+# standard library
+import binascii
+import os
+from typing import BinaryIO, Iterator, List, Tuple, Union
+
+
+class BatchMultipartEncoder:
+    """ThreatConnect Batch Multipart Encoder
+
+    A streaming multipart/form-data request body. File values are read in chunks while the
+    request is sent, so the body is never held in memory. The encoded parts match the
+    requests "files" parameter (the filename is the field name).
+
+    The body is re-read from the start each time it is iterated, so the same encoder can be
+    sent again when a request is retried.
+
+    Args:
+        fields: A list of (name, value) tuples, where value is bytes or a binary file object.
+        chunk_size: The number of bytes to read from file values at a time.
+    """
+
+    def __init__(
+        self, fields: List[Tuple[str, Union[bytes, BinaryIO]]], chunk_size: int = 65_536
+    ) -> None:
+        """Initialize Class Properties."""
+        self.boundary = binascii.hexlify(os.urandom(16)).decode('ascii')
+        self.chunk_size = chunk_size
+
+        # properties
+        self._parts = []
+        for name, value in fields:
+            self._parts.append(
+                (
+                    f'--{self.boundary}\r\n'
+                    f'Content-Disposition: form-data; name="{name}"; filename="{name}"\r\n\r\n'
+                ).encode()
+            )
+            if isinstance(value, bytes):
+                self._parts.append(value)
+            else:
+                value.seek(0, os.SEEK_END)
+                self._parts.append((value, value.tell()))
+            self._parts.append(b'\r\n')
+        self._parts.append(f'--{self.boundary}--\r\n'.encode())
+
+    @property
+    def content_type(self) -> str:
+        """Return the Content-Type header value for the body."""
+        return f'multipart/form-data; boundary={self.boundary}'
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Yield the encoded body in chunks."""
+        for part in self._parts:
+            if isinstance(part, bytes):
+                yield part
+                continue
+
+            fh, remaining = part
+            fh.seek(0)
+            while remaining > 0:
+                chunk = fh.read(min(self.chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+
+    def __len__(self) -> int:
+        """Return the length in bytes of the encoded body."""
+        return sum(len(part) if isinstance(part, bytes) else part[1] for part in self._parts)
@@ -0,0 +1,238 @@
+"""ThreatConnect Batch Import Module"""
+# standard library
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Optional
+
+
+class PollJob:
+    """ThreatConnect Batch Poll Job
+
+    The progress of a single batch job, passed to the poll strategy before each poll.
+
+    Args:
+        batch_id: The ID returned from the ThreatConnect API for the batch job.
+        batch_size: The number of groups and indicators in the batch job, if known.
+    """
+
+    __slots__ = [
+        'batch_id',
+        'batch_size',
+        'elapsed',
+        'poll_count',
+        'progress',
+        'start',
+        'wait_time',
+    ]
+
+    def __init__(self, batch_id: int, batch_size: Optional[int] = None) -> None:
+        """Initialize Class Properties."""
+        self.batch_id = batch_id
+        self.batch_size = batch_size
+
+        # properties
+        self.elapsed = 0.0
+        self.poll_count = 0
+        self.progress = []  # list of (elapsed seconds, processed count)
+        self.start = time.monotonic()  # the time (monotonic) polling started
+        self.wait_time = 0.0
+
+    def update(self, elapsed: float, batch_status: dict) -> None:
+        """Record the batch status returned by a poll.
+
+        Args:
+            elapsed: The number of seconds since the first poll started.
+            batch_status: The batchStatus data returned from the ThreatConnect API.
+        """
+        self.elapsed = elapsed
+        success_count = batch_status.get('successCount') or 0
+        error_count = batch_status.get('errorCount') or 0
+        unprocess_count = batch_status.get('unprocessCount')
+        if self.batch_size is None and unprocess_count is not None:
+            self.batch_size = success_count + error_count + unprocess_count
+        self.progress.append((elapsed, success_count + error_count))
+
+
+class PollStrategy(ABC):
+    """ThreatConnect Batch Poll Strategy
+
+    A poll strategy returns the number of seconds to wait before each batch status request.
+    Poll timing metrics for all completed batch jobs are available in the metrics property.
+    """
+
+    def __init__(self) -> None:
+        """Initialize Class Properties."""
+        self._lock = threading.Lock()
+        self._jobs = 0
+        self._polls = 0
+        self._poll_time = 0.0
+        self._wait_time = 0.0
+
+    def completed(self, job: PollJob) -> None:
+        """Record the poll metrics for a completed batch job.
+
+        Args:
+            job: The completed poll job.
+        """
+        with self._lock:
+            self._jobs += 1
+            self._polls += job.poll_count
+            self._poll_time += job.elapsed
+            self._wait_time += job.wait_time
+
+    @abstractmethod
+    def interval(self, job: PollJob) -> float:
+        """Return the number of seconds to wait before the next poll.
+
+        Args:
+            job: The poll job, job.poll_count is 0 before the first poll.
+        """
+
+    @property
+    def metrics(self) -> dict:
+        """Return poll timing metrics for all completed batch jobs."""
+        with self._lock:
+            jobs = max(self._jobs, 1)
+            return {
+                'jobs': self._jobs,
+                'polls': self._polls,
+                'poll_time': round(self._poll_time, 3),
+                'wait_time': round(self._wait_time, 3),
+                'average_polls': round(self._polls / jobs, 3),
+                'average_poll_time': round(self._poll_time / jobs, 3),
+            }
+
+
+class FixedPollStrategy(PollStrategy):
+    """Poll the batch status on a fixed interval.
+
+    Args:
+        interval: The number of seconds to wait before each poll.
+    """
+
+    def __init__(self, interval: Optional[float] = 15) -> None:
+        """Initialize Class Properties."""
+        super().__init__()
+        self._interval = interval
+
+    def interval(self, job: PollJob) -> float:
+        """Return the number of seconds to wait before the next poll."""
+        return self._interval
+
+
+class ExponentialPollStrategy(PollStrategy):
+    """Poll the batch status with an increasing interval.
+
+    Args:
+        initial_interval: The number of seconds to wait before the first poll.
+        retry_seconds: The base number of seconds used for retries when job is not completed.
+        back_off: A multiplier to use for backing off on each poll attempt.
+        max_interval: The max number of seconds to wait between polls.
+    """
+
+    def __init__(
+        self,
+        initial_interval: Optional[float] = 15,
+        retry_seconds: Optional[float] = 5,
+        back_off: Optional[float] = 2.5,
+        max_interval: Optional[float] = 20,
+    ) -> None:
+        """Initialize Class Properties."""
+        super().__init__()
+        self.back_off = back_off
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.retry_seconds = retry_seconds
+
+    def interval(self, job: PollJob) -> float:
+        """Return the number of seconds to wait before the next poll."""
+        if job.poll_count == 0:
+            return self.initial_interval
+        return min(self.retry_seconds + int(job.poll_count * self.back_off), self.max_interval)
+
+
+class AdaptivePollStrategy(PollStrategy):
+    """Poll the batch status based on the expected completion time of the batch job.
+
+    * Batches at or below sync_limit items are processed synchronously by ThreatConnect and
+      are polled immediately.
+    * The first interval is the expected duration of the batch job, using the seconds per
+      item learned from the last history_size completed jobs (most recent weighted higher).
+    * Subsequent intervals use the progress rate (successCount + errorCount) reported across
+      polls to estimate the time remaining, falling back to an exponential back off.
+
+    Args:
+        min_interval: The min number of seconds to wait between polls.
+        max_interval: The max number of seconds to wait between polls.
+        sync_limit: The max number of items in a batch processed synchronously.
+        history_size: The number of completed batch jobs used to learn the processing rate.
+    """
+
+    def __init__(
+        self,
+        min_interval: Optional[float] = 1,
+        max_interval: Optional[float] = 20,
+        sync_limit: Optional[int] = 1_000,
+        history_size: Optional[int] = 5,
+    ) -> None:
+        """Initialize Class Properties."""
+        super().__init__()
+        self.max_interval = max_interval
+        self.min_interval = min_interval
+        self.sync_limit = sync_limit
+
+        # properties
+        self._history = deque(maxlen=history_size)  # seconds per item of completed jobs
+
+    def _clamp(self, interval: float) -> float:
+        """Return the interval bounded by min and max interval."""
+        return min(max(interval, self.min_interval), self.max_interval)
+
+    def completed(self, job: PollJob) -> None:
+        """Record the poll metrics and processing rate for a completed batch job."""
+        super().completed(job)
+        if job.batch_size:
+            with self._lock:
+                self._history.append(job.elapsed / job.batch_size)
+
+    def interval(self, job: PollJob) -> float:
+        """Return the number of seconds to wait before the next poll."""
+        if job.poll_count == 0:
+            if job.batch_size is not None and job.batch_size <= self.sync_limit:
+                return 0
+
+            seconds_per_item = self.seconds_per_item
+            if job.batch_size is None or seconds_per_item is None:
+                # estimate roughly 300 items processed per second until a rate is learned
+                return self._clamp(math.ceil((job.batch_size or 0) / 300) or self.min_interval)
+            return self._clamp(job.batch_size * seconds_per_item)
+
+        if job.batch_size and len(job.progress) >= 2:
+            (start_time, start_count), (end_time, end_count) = job.progress[0], job.progress[-1]
+            if end_count > start_count and end_time > start_time:
+                rate = (end_count - start_count) / (end_time - start_time)
+                return self._clamp((job.batch_size - end_count) / rate)
+
+        return self._clamp(self.min_interval * 2**job.poll_count)
+
+    @property
+    def metrics(self) -> dict:
+        """Return poll timing metrics for all completed batch jobs."""
+        metrics = super().metrics
+        metrics['seconds_per_item'] = self.seconds_per_item
+        return metrics
+
+    @property
+    def seconds_per_item(self) -> Optional[float]:
+        """Return the weighted average seconds per item of recently completed batch jobs."""
+        with self._lock:
+            history = list(self._history)
+        if not history:
+            return None
+
+        # weights will be [1, 1.5, 2.25, 3.375, 5.0625], most recent job weighted highest
+        weights = [1.5**i for i in range(len(history))]
+        return sum(h * w for h, w in zip(history, weights)) / sum(weights)
@@ -0,0 +1,140 @@
+"""ThreatConnect Batch Import Module"""
+# standard library
+import heapq
+import itertools
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Optional
+
+# first-party
+from tcex.pleb.threading import ThreadContext
+
+if TYPE_CHECKING:  # pragma: no cover
+    # first-party
+    from tcex.api.tc.v2.batch.batch_submit import BatchSubmit
+
+# get tcex logger
+logger = logging.getLogger('tcex')
+
+
+class BatchPoller:
+    """ThreatConnect Batch Poller
+
+    Polls the status of all in flight batch jobs from a single thread, instead of each batch job
+    sleeping and polling in a thread of its own. Each batch job is polled when it is due, using
+    the poll strategy of the batch, and the batch status is returned through a future. The
+    batch jobs are polled in the context of the thread that created the poller, so in Service
+    Apps the token of that thread is used.
+
+    Args:
+        batch: The batch the batch jobs were submitted with.
+    """
+
+    def __init__(self, batch: 'BatchSubmit') -> None:
+        """Initialize Class Properties."""
+        self.batch = batch
+
+        # properties
+        self._condition = threading.Condition()
+        self._context = ThreadContext()
+        self._due = []  # heap of (due time, seq, poll)
+        self._seq = itertools.count()
+        self._stopped = False
+        self._thread = None
+        self.log = logger
+
+    def _run(self) -> None:
+        """Poll the batch jobs, failing the remaining batch jobs if the poller fails."""
+        try:
+            self._poll_jobs()
+        except Exception as ex:
+            self.log.error(f'feature=batch, event=batch-poller-failed, error={ex}')
+            with self._condition:
+                due, self._due = self._due, []
+                # the next batch job added starts a new poller thread
+                self._thread = None
+            for _, _, poll in due:
+                poll[1].set_exception(ex)
+
+    def _poll_jobs(self) -> None:
+        """Poll each batch job when due until the poller is stopped and no jobs remain."""
+        while True:
+            with self._condition:
+                while True:
+                    if self._due and self._due[0][0] <= time.monotonic():
+                        _, _, poll = heapq.heappop(self._due)
+                        break
+                    if self._stopped and not self._due:
+                        return
+                    timeout = self._due[0][0] - time.monotonic() if self._due else None
+                    self._condition.wait(timeout)
+
+            job, future, poll_strategy, timeout, data, halt_on_error = poll
+            try:
+                # pylint: disable=protected-access
+                data, done = self.batch._poll_status(
+                    job, poll_strategy, timeout, data, halt_on_error
+                )
+                if done:
+                    future.set_result(data)
+                else:
+                    # the poll strategy can raise when scheduling the next poll
+                    self._schedule((job, future, poll_strategy, timeout, data, halt_on_error))
+            except Exception as ex:  # the error is raised to the caller by the future
+                if not future.done():
+                    future.set_exception(ex)
+
+    def _schedule(self, poll: tuple) -> None:
+        """Schedule the next poll of the batch job using the poll strategy."""
+        job, _, poll_strategy = poll[:3]
+        interval = max(poll_strategy.interval(job), 0)
+        job.wait_time += interval
+        with self._condition:
+            heapq.heappush(self._due, (time.monotonic() + interval, next(self._seq), poll))
+            self._condition.notify()
+
+    def poll(
+        self,
+        batch_id: int,
+        timeout: Optional[int] = None,
+        halt_on_error: Optional[bool] = True,
+        batch_size: Optional[int] = None,
+    ) -> Future:
+        """Add a batch job to be polled until it is complete.
+
+        Args:
+            batch_id: The ID returned from the ThreatConnect API for the batch job.
+            timeout: The number of seconds before the poll should timeout.
+            halt_on_error: If True any exception will raise an error.
+            batch_size: The number of groups and indicators in the batch job. Defaults to the
+                size recorded when the batch job was submitted.
+
+        Returns:
+            Future: The future for the batch status returned from the ThreatConnect API.
+        """
+        # pylint: disable=protected-access
+        job, poll_strategy, timeout, halt_on_error = self.batch._poll_job(
+            batch_id, timeout=timeout, halt_on_error=halt_on_error, batch_size=batch_size
+        )
+        future = Future()
+        with self._condition:
+            if self._stopped:
+                raise RuntimeError('The batch poller is stopped.')
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._context.run, args=(self._run,), name='batch-poller', daemon=True
+                )
+                self._thread.start()
+        self._schedule((job, future, poll_strategy, timeout, {}, halt_on_error))
+        return future
+
+    def stop(self) -> None:
+        """Stop the poller once all batch jobs are complete."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
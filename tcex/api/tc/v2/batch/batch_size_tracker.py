@@ -0,0 +1,176 @@
+"""ThreatConnect Batch Import Module"""
+# standard library
+import io
+import json
+import threading
+from typing import BinaryIO, Optional
+
+# first-party
+from tcex.api.tc.v2.batch.batch_chunk_writer import BatchChunkWriter
+
+
+class BatchSizeTracker:
+    """ThreatConnect Batch Size Tracker
+
+    Each entity is serialized only once, when it is final (removed from the batch), and the
+    encoded bytes are cached so the batch JSON can be written without serializing the entity
+    a second time. Sizes are the exact number of UTF-8 encoded bytes.
+
+    Entities that have not been serialized yet (e.g., an Indicator that is still having
+    attributes and tags added) are estimated using the average size of all entities
+    serialized so far. Until sample_size entities have been serialized, the estimate is the
+    exact size of the entity when it is added, which calibrates the average. The sampled sizes
+    are tracked separately from the exact totals of the encoded (final) entities.
+
+    The tracker is thread safe, entities can be encoded by concurrent pipeline workers.
+
+    Cached bytes are released once used by dumps. If more than max_cache_size bytes are
+    cached the oldest entries are dropped and those entities are serialized again by dumps.
+
+    Args:
+        default_size: The estimated entity size in bytes used before any entity is serialized.
+        max_cache_size: The max number of encoded bytes to hold in the cache.
+        sample_size: The number of entities serialized when added to calibrate the average.
+    """
+
+    __slots__ = [
+        '_cache',
+        '_cache_size',
+        '_lock',
+        'count',
+        'default_size',
+        'max_cache_size',
+        'sample_size',
+        'sampled_count',
+        'sampled_size',
+        'size',
+    ]
+
+    def __init__(
+        self,
+        default_size: Optional[int] = 1_000,
+        max_cache_size: Optional[int] = 150_000_000,
+        sample_size: Optional[int] = 100,
+    ) -> None:
+        """Initialize Class Properties."""
+        self.default_size = default_size
+        self.max_cache_size = max_cache_size
+        self.sample_size = sample_size
+
+        # properties
+        self._cache = {}
+        self._cache_size = 0
+        self._lock = threading.Lock()
+        self.count = 0  # the number of encoded entities
+        self.sampled_count = 0  # the number of entities serialized for the estimate
+        self.sampled_size = 0  # the size in bytes of the entities serialized for the estimate
+        self.size = 0  # the size in bytes of the encoded entities
+
+    def _average_size(self) -> int:
+        """Return the average size in bytes of all serialized entities (lock must be held)."""
+        count = self.count + self.sampled_count
+        if count == 0:
+            return self.default_size
+        return max((self.size + self.sampled_size) // count, 1)
+
+    @property
+    def average_size(self) -> int:
+        """Return the average size in bytes of all serialized entities."""
+        with self._lock:
+            return self._average_size()
+
+    def cached(self, data: dict, release: Optional[bool] = False) -> Optional[bytes]:
+        """Return the cached encoded bytes for the entity data.
+
+        The cached value is only returned for the exact same entity data object that was
+        encoded, otherwise None is returned.
+
+        Args:
+            data: The group or indicator data.
+            release: If True, the cached value is removed from the cache.
+        """
+        xid = data.get('xid')
+        with self._lock:
+            entry = self._cache.get(xid)
+            if entry is None or entry[0] is not data:
+                return None
+            if release is True:
+                del self._cache[xid]
+                self._cache_size -= len(entry[1])
+        return entry[1]
+
+    def clear(self) -> None:
+        """Clear the encoded bytes cache."""
+        with self._lock:
+            self._cache.clear()
+            self._cache_size = 0
+
+    def dump(self, content: dict, fh: BinaryIO) -> None:
+        """Write the UTF-8 encoded batch JSON for the content to a binary file object.
+
+        Any entity previously encoded with cache enabled is written using the cached bytes,
+        which are then released from the cache.
+
+        Args:
+            content: The dict of groups and indicator data.
+            fh: The binary file object to write.
+        """
+        chunk = BatchChunkWriter(fh)
+        for entity_type in ['group', 'indicator']:
+            for data in content.get(entity_type) or []:
+                encoded = self.cached(data, release=True)
+                chunk.add(entity_type, data if encoded is None else encoded)
+        chunk.finish()
+
+    def dumps(self, content: dict) -> bytes:
+        """Return the UTF-8 encoded batch JSON for the content.
+
+        Args:
+            content: The dict of groups and indicator data.
+        """
+        fh = io.BytesIO()
+        self.dump(content, fh)
+        return fh.getvalue()
+
+    def estimate(self, data: dict) -> int:
+        """Return the estimated size in bytes of an entity that is not final yet.
+
+        Until sample_size entities have been serialized, the entity is serialized (without
+        caching, as it can still change) and its exact size is tracked and returned.
+
+        Args:
+            data: The group or indicator data.
+        """
+        with self._lock:
+            if self.count + self.sampled_count >= self.sample_size:
+                return self._average_size()
+
+        size = len(json.dumps(data).encode())
+        with self._lock:
+            self.sampled_count += 1
+            self.sampled_size += size
+        return size
+
+    def encode(self, data: dict, cache: Optional[bool] = False) -> bytes:
+        """Return the UTF-8 encoded JSON for the entity data and track the size.
+
+        Args:
+            data: The group or indicator data.
+            cache: If True, the encoded bytes will be cached for use in dumps.
+        """
+        encoded = json.dumps(data).encode()
+        with self._lock:
+            self.count += 1
+            self.size += len(encoded)
+            if cache is True:
+                previous = self._cache.pop(data.get('xid'), None)
+                if previous is not None:
+                    self._cache_size -= len(previous[1])
+                self._cache[data.get('xid')] = (data, encoded)
+                self._cache_size += len(encoded)
+
+                # drop the oldest entries once the cache is full
+                while self._cache_size > self.max_cache_size and len(self._cache) > 1:
+                    oldest = self._cache.pop(next(iter(self._cache)))
+                    self._cache_size -= len(oldest[1])
+        return encoded
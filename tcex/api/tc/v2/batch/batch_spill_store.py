@@ -0,0 +1,184 @@
+"""ThreatConnect Batch Import Module"""
+# standard library
+import mmap
+import os
+import pickle  # nosec
+import struct
+from collections.abc import MutableMapping
+from typing import Any, Iterator, Optional, Tuple
+
+
+class BatchSpillStore(MutableMapping):
+    """ThreatConnect Batch Spill Store
+
+    An append-only record file with an in-memory index used to spill group and indicator data
+    to disk. Each record is a fixed size header followed by the key and the pickled value.
+
+    * Membership checks (e.g., xid dedup) only use the in-memory index and never touch disk.
+    * Writes are buffered appends, deletes append a small tombstone record.
+    * Draining the store reads the records sequentially using a memory-mapped view of the file.
+
+    When the last entry is removed the file is truncated so space is reclaimed between batch
+    chunks. An existing file is indexed on open, allowing a saved file to be reused.
+
+    Args:
+        filename: The fully qualified filename for the spill file.
+    """
+
+    # record header: flag (1 = value, 0 = tombstone), key length, value length
+    _header = struct.Struct('<BII')
+
+    def __init__(self, filename: str) -> None:
+        """Initialize Class Properties."""
+        self.filename = filename
+
+        # properties
+        self._dirty = False
+        self._draining = 0
+        self._index = {}
+        self._reader = None
+        self._writer = None
+        self._size = 0
+
+        if os.path.isfile(self.filename):
+            self._load_index()
+
+        self._writer = open(self.filename, 'ab')  # pylint: disable=consider-using-with
+        self._reader = open(self.filename, 'rb')  # pylint: disable=consider-using-with
+
+    def _append(self, flag: int, key: str, value: bytes = b'') -> int:
+        """Append a record to the spill file and return the offset of the value.
+
+        Args:
+            flag: The record flag (1 = value, 0 = tombstone).
+            key: The record key.
+            value: The record value bytes.
+        """
+        key_bytes = key.encode()
+        self._writer.write(
+            b''.join([self._header.pack(flag, len(key_bytes), len(value)), key_bytes, value])
+        )
+        self._dirty = True
+
+        value_offset = self._size + self._header.size + len(key_bytes)
+        self._size = value_offset + len(value)
+        return value_offset
+
+    def _flush(self) -> None:
+        """Flush any buffered writes so they are visible to readers."""
+        if self._dirty is True:
+            self._writer.flush()
+            self._dirty = False
+
+    def _load_index(self) -> None:
+        """Build the in-memory index from an existing spill file."""
+        with open(self.filename, 'rb') as fh:
+            offset = 0
+            while True:
+                header = fh.read(self._header.size)
+                if len(header) < self._header.size:
+                    break
+                flag, key_length, value_length = self._header.unpack(header)
+                key = fh.read(key_length).decode()
+                value_offset = offset + self._header.size + key_length
+                fh.seek(value_length, os.SEEK_CUR)
+                if flag == 1:
+                    self._index[key] = (value_offset, value_length)
+                else:
+                    self._index.pop(key, None)
+                offset = value_offset + value_length
+        self._size = offset
+
+    def _read(self, offset: int, length: int) -> bytes:
+        """Return the value bytes at the provided offset."""
+        self._flush()
+        self._reader.seek(offset)
+        return self._reader.read(length)
+
+    def _remove(self, key: str) -> None:
+        """Remove the key from the index and reclaim the file once empty."""
+        del self._index[key]
+        if not self._index and self._draining == 0:
+            self._truncate()
+        else:
+            self._append(0, key)
+
+    def _truncate(self) -> None:
+        """Truncate the spill file to zero bytes."""
+        self._writer.flush()
+        self._writer.truncate(0)
+        self._dirty = False
+        self._size = 0
+
+    def close(self) -> None:
+        """Close the spill file."""
+        for fh in (self._writer, self._reader):
+            if fh is not None and not fh.closed:
+                fh.close()
+
+    def drain(self) -> Iterator[Tuple[str, Any]]:
+        """Yield and remove all entries, reading the spill file sequentially.
+
+        Entries are removed from the store as they are yielded, closing the generator early
+        leaves any remaining entries in the store.
+
+        Yields:
+            Tuple[str, Any]: The key and value for each entry.
+        """
+        if not self._index:
+            return
+
+        self._flush()
+        entries = sorted(self._index.items(), key=lambda item: item[1][0])
+        self._draining += 1
+        try:
+            with mmap.mmap(self._reader.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for key, location in entries:
+                    # skip entries that were updated or removed while draining
+                    if self._index.get(key) != location:
+                        continue
+                    offset, length = location
+                    value = pickle.loads(mm[offset : offset + length])  # nosec
+                    self._remove(key)
+                    yield key, value
+        finally:
+            self._draining -= 1
+            if not self._index and self._draining == 0:
+                self._truncate()
+
+    def get(self, key: str, default: Optional[Any] = None) -> Any:
+        """Return the value for the key, only reading from disk if the key exists."""
+        location = self._index.get(key)
+        if location is None:
+            return default
+        return pickle.loads(self._read(*location))  # nosec
+
+    def __contains__(self, key: object) -> bool:
+        """Return True if the key exists in the store."""
+        return key in self._index
+
+    def __delitem__(self, key: str) -> None:
+        """Remove the key from the store."""
+        if key not in self._index:
+            raise KeyError(key)
+        self._remove(key)
+
+    def __getitem__(self, key: str) -> Any:
+        """Return the value for the key."""
+        location = self._index.get(key)
+        if location is None:
+            raise KeyError(key)
+        return pickle.loads(self._read(*location))  # nosec
+
+    def __iter__(self) -> Iterator[str]:
+        """Return an iterator of the keys in the store."""
+        return iter(list(self._index))
+
+    def __len__(self) -> int:
+        """Return the number of entries in the store."""
+        return len(self._index)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Append the value for the key to the spill file."""
+        value_bytes = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        self._index[key] = (self._append(1, key, value_bytes), len(value_bytes))
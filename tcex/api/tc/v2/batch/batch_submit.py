@@ -3,15 +3,21 @@
 import gzip
 import json
 import logging
-import math
 import re
+import threading
 import time
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 # third-party
 from requests import Session
 
 # first-party
+from tcex.api.tc.v2.batch.batch_poll_strategy import (
+    AdaptivePollStrategy,
+    ExponentialPollStrategy,
+    PollJob,
+    PollStrategy,
+)
 from tcex.exit.error_codes import handle_error
 from tcex.input.input import Input
 
@@ -67,11 +73,24 @@ class BatchSubmit:
         self._halt_on_poll_error = None
 
         # default properties
-        self._batch_data_count = None
-        self._poll_interval = None
-        self._poll_interval_times = []
+        self._batch_sizes = {}  # batch size by batch id, used by the poll strategy
+        self._batch_sizes_lock = threading.Lock()
+        self._poll_strategy = AdaptivePollStrategy()
         self._poll_timeout = 3600
 
+    def _batch_size_record(self, batch_id: Optional[int], content: dict) -> None:
+        """Record the number of groups and indicators submitted for the batch job.
+
+        Args:
+            batch_id: The ID returned from the ThreatConnect API for the batch job.
+            content: The dict of groups and indicator data.
+        """
+        if batch_id is not None and isinstance(content, dict):
+            with self._batch_sizes_lock:
+                self._batch_sizes[batch_id] = len(content.get('group') or []) + len(
+                    content.get('indicator') or []
+                )
+
     @property
     def _critical_failures(self) -> List[str]:  # pragma: no cover
         """Return Batch critical failure messages."""
@@ -255,6 +274,7 @@ class BatchSubmit:
         back_off: Optional[float] = None,
         timeout: Optional[int] = None,
         halt_on_error: Optional[bool] = True,
+        batch_size: Optional[int] = None,
     ) -> dict:
         """Poll Batch status to ThreatConnect API.
 
@@ -273,6 +293,9 @@ class BatchSubmit:
                 }
             }
 
+        The time between polls is controlled by the poll_strategy. When retry_seconds or
+        back_off is provided an ExponentialPollStrategy is used for this batch job instead.
+
         Args:
             batch_id: The ID returned from the ThreatConnect API for the current batch job.
             retry_seconds: The base number of seconds used for retries when job is not completed.
@@ -280,98 +303,142 @@ class BatchSubmit:
                 each poll attempt when job has not completed.
             timeout: The number of seconds before the poll should timeout.
             halt_on_error: If True any exception will raise an error.
+            batch_size: The number of groups and indicators in the batch job. Defaults to the
+                size recorded when the batch job was submitted.
 
         Returns:
             dict: The batch status returned from the ThreatConnect API.
         """
+        job, poll_strategy, timeout, halt_on_error = self._poll_job(
+            batch_id, retry_seconds, back_off, timeout, halt_on_error, batch_size
+        )
+        data = {}
+        while True:
+            interval = poll_strategy.interval(job)
+            if interval > 0:
+                job.wait_time += interval
+                time.sleep(interval)
+
+            data, done = self._poll_status(job, poll_strategy, timeout, data, halt_on_error)
+            if done:
+                return data
+
+    def _poll_job(
+        self,
+        batch_id: int,
+        retry_seconds: Optional[int] = None,
+        back_off: Optional[float] = None,
+        timeout: Optional[int] = None,
+        halt_on_error: Optional[bool] = True,
+        batch_size: Optional[int] = None,
+    ) -> Tuple[PollJob, PollStrategy, int, bool]:
+        """Return the poll job, poll strategy, timeout, and halt_on_error for a batch job.
+
+        Args:
+            batch_id: The ID returned from the ThreatConnect API for the current batch job.
+            retry_seconds: The base number of seconds used for retries when job is not completed.
+            back_off: A multiplier to use for backing off on each poll attempt.
+            timeout: The number of seconds before the poll should timeout.
+            halt_on_error: If True any exception will raise an error.
+            batch_size: The number of groups and indicators in the batch job.
+        """
         # check global setting for override
         if self.halt_on_poll_error is not None:
             halt_on_error = self.halt_on_poll_error
 
-        # initial poll interval
-        if self._poll_interval is None and self._batch_data_count is not None:
-            # calculate poll_interval base off the number of entries in the batch data
-            # with a minimum value of 5 seconds.
-            self._poll_interval = max(math.ceil(self._batch_data_count / 300), 5)
-        elif self._poll_interval is None:
-            # if not able to calculate poll_interval default to 15 seconds
-            self._poll_interval = 15
-
-        # poll retry back_off factor
-        poll_interval_back_off = float(2.5 if back_off is None else back_off)
-
-        # poll retry seconds
-        poll_retry_seconds = int(5 if retry_seconds is None else retry_seconds)
+        poll_strategy = self.poll_strategy
+        if retry_seconds is not None or back_off is not None:
+            poll_strategy = ExponentialPollStrategy(
+                retry_seconds=int(5 if retry_seconds is None else retry_seconds),
+                back_off=float(2.5 if back_off is None else back_off),
+            )
 
         # poll timeout
         if timeout is None:
             timeout = self.poll_timeout
         else:
             timeout = int(timeout)
-        params = {'includeAdditional': 'true'}
 
-        poll_count = 0
-        poll_time_total = 0
-        data = {}
-        while True:
-            poll_count += 1
-            poll_time_total += self._poll_interval
-            time.sleep(self._poll_interval)
-            self.log.info(f'feature=batch, event=progress, poll-time={poll_time_total}')
-            try:
-                # retrieve job status
-                r = self.session_tc.get(f'/v2/batch/{batch_id}', params=params)
-                if not r.ok or 'application/json' not in r.headers.get('content-type', ''):
-                    handle_error(
-                        code=545,
-                        message_values=[r.status_code, r.text],
-                        raise_error=halt_on_error,
-                    )
-                    return data
-                data = r.json()
-                if data.get('status') != 'Success':
-                    handle_error(
-                        code=545,
-                        message_values=[r.status_code, r.text],
-                        raise_error=halt_on_error,
-                    )
-            except Exception as e:
-                handle_error(code=540, message_values=[e], raise_error=halt_on_error)
-
-            if data.get('data', {}).get('batchStatus', {}).get('status') == 'Completed':
-                # store last 5 poll times to use in calculating average poll time
-                modifier = poll_time_total * 0.7
-                self._poll_interval_times = self._poll_interval_times[-4:] + [modifier]
-
-                weights = [1]
-                poll_interval_time_weighted_sum = 0
-                for poll_interval_time in self._poll_interval_times:
-                    poll_interval_time_weighted_sum += poll_interval_time * weights[-1]
-                    # weights will be [1, 1.5, 2.25, 3.375, 5.0625] for all 5 poll times depending
-                    # on how many poll times are available.
-                    weights.append(weights[-1] * 1.5)
-
-                # pop off the last weight so its not added in to the sum
-                weights.pop()
-
-                # calculate the weighted average of the last 5 poll times
-                self._poll_interval = math.floor(poll_interval_time_weighted_sum / sum(weights))
-
-                if poll_count == 1:
-                    # if completed on first poll, reduce poll interval.
-                    self._poll_interval = self._poll_interval * 0.85
-
-                self.log.debug(f'feature=batch, poll-time={poll_time_total}, status={data}')
-                return data
+        with self._batch_sizes_lock:
+            batch_size = self._batch_sizes.pop(batch_id, batch_size)
+        return PollJob(batch_id, batch_size), poll_strategy, timeout, halt_on_error
+
+    def _poll_status(
+        self,
+        job: PollJob,
+        poll_strategy: PollStrategy,
+        timeout: int,
+        data: dict,
+        halt_on_error: bool,
+    ) -> Tuple[dict, bool]:
+        """Retrieve the batch job status once.
 
-            # update poll_interval for retry with max poll time of 20 seconds
-            self._poll_interval = min(
-                poll_retry_seconds + int(poll_count * poll_interval_back_off), 20
+        Args:
+            job: The poll job.
+            poll_strategy: The poll strategy of the batch job.
+            timeout: The number of seconds before the poll should timeout.
+            data: The batch status returned by the previous poll.
+            halt_on_error: If True any exception will raise an error.
+
+        Returns:
+            Tuple[dict, bool]: The batch status and True if polling is done.
+        """
+        batch_id = job.batch_id
+        job.poll_count += 1
+        self.log.info(
+            f'feature=batch, event=progress, batch-id={batch_id}, '
+            f'poll-time={time.monotonic() - job.start:.1f}'
+        )
+        try:
+            # retrieve job status
+            r = self.session_tc.get(f'/v2/batch/{batch_id}', params={'includeAdditional': 'true'})
+            if not r.ok or 'application/json' not in r.headers.get('content-type', ''):
+                handle_error(
+                    code=545,
+                    message_values=[r.status_code, r.text],
+                    raise_error=halt_on_error,
+                )
+                return data, True
+            data = r.json()
+            if data.get('status') != 'Success':
+                handle_error(
+                    code=545,
+                    message_values=[r.status_code, r.text],
+                    raise_error=halt_on_error,
+                )
+        except Exception as e:
+            handle_error(code=540, message_values=[e], raise_error=halt_on_error)
+
+        batch_status = data.get('data', {}).get('batchStatus', {})
+        job.update(time.monotonic() - job.start, batch_status)
+        if batch_status.get('status') == 'Completed':
+            poll_strategy.completed(job)
+            self.log.debug(
+                f'feature=batch, event=poll-complete, batch-id={batch_id}, '
+                f'batch-size={job.batch_size}, polls={job.poll_count}, '
+                f'poll-time={job.elapsed:.1f}, wait-time={job.wait_time:.1f}, status={data}'
             )
+            return data, True
+
+        # time out poll to prevent App running indefinitely
+        if job.elapsed >= timeout:
+            handle_error(code=550, message_values=[timeout], raise_error=True)
+        return data, False
 
-            # time out poll to prevent App running indefinitely
-            if poll_time_total >= timeout:
-                handle_error(code=550, message_values=[timeout], raise_error=True)
+    @property
+    def poll_metrics(self) -> dict:
+        """Return poll timing metrics for all batch jobs polled with the poll strategy."""
+        return self.poll_strategy.metrics
+
+    @property
+    def poll_strategy(self) -> PollStrategy:
+        """Return the poll strategy used to time batch status polls."""
+        return self._poll_strategy
+
+    @poll_strategy.setter
+    def poll_strategy(self, poll_strategy: PollStrategy) -> None:
+        """Set the poll strategy used to time batch status polls."""
+        self._poll_strategy = poll_strategy
 
     @property
     def poll_timeout(self) -> int:
@@ -448,7 +515,9 @@ class BatchSubmit:
                     message_values=[r.status_code, r.text],
                     raise_error=halt_on_error,
                 )
-            return r.json()
+            data = r.json()
+            self._batch_size_record(data.get('data', {}).get('batchStatus', {}).get('id'), content)
+            return data
         except Exception as e:
             handle_error(code=10505, message_values=[e], raise_error=halt_on_error)
 
@@ -487,6 +556,7 @@ class BatchSubmit:
                     message_values=[r.status_code, r.text],
                     raise_error=halt_on_error,
                 )
+            self._batch_size_record(batch_id, content)
             return r.json()
         except Exception as e:
             handle_error(code=10520, message_values=[e], raise_error=halt_on_error)
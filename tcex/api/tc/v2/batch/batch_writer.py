@@ -6,18 +6,19 @@ import json
 import logging
 import os
 import re
-import shelve  # nosec
-import sys
 import time
 import uuid
 from collections import deque
-from typing import Optional, Tuple, Union
+from typing import Any, Iterator, Optional, Tuple, Union
 
 # third-party
 from requests import Session
 
 # first-party
 from tcex.api.tc.utils.threat_intel_utils import ThreatIntelUtils
+from tcex.api.tc.v2.batch.batch_chunk_writer import BatchChunkWriter
+from tcex.api.tc.v2.batch.batch_size_tracker import BatchSizeTracker
+from tcex.api.tc.v2.batch.batch_spill_store import BatchSpillStore
 from tcex.api.tc.v2.batch.group import (
     Adversary,
     AttackPattern,
@@ -104,6 +105,12 @@ class BatchWriter:
         inputs: The App inputs.
         session_tc: The ThreatConnect API session.
         output_dir: The directory to write the batch JSON data.
+        batch_max_chunk (kwargs: int): The max number of entities per batch JSON file
+            (stream mode only).
+        batch_max_size (kwargs: int): The max size in bytes of serialized data per batch JSON
+            file (stream mode only).
+        stream (kwargs: bool): If True, batch JSON data is written incrementally to multiple
+            files bounded by batch_max_chunk and batch_max_size.
     """
 
     def __init__(self, inputs: Input, session_tc: Session, output_dir: str, **kwargs) -> None:
@@ -112,14 +119,16 @@ class BatchWriter:
         self.output_dir = output_dir
         self.output_extension = kwargs.get('output_extension')
         self.session_tc = session_tc
+        self.stream = kwargs.get('stream', False)
         self.write_callback = kwargs.get('write_callback')
         self.write_callback_kwargs = kwargs.get('write_callback_kwargs', {})
 
         # properties
         self._batch_files = []
-        self._batch_max_chunk = 100_000
+        self._batch_max_chunk = kwargs.get('batch_max_chunk', 100_000)
         self._batch_size = 0  # track current batch size
-        self._batch_max_size = 75_000_000  # max size in bytes
+        self._batch_max_size = kwargs.get('batch_max_size', 75_000_000)  # max size in bytes
+        self._size_tracker = BatchSizeTracker()
         self.log = logger
         self.tic = ThreatIntelUtils(self.session_tc)
         self.utils = Utils()
@@ -137,6 +146,53 @@ class BatchWriter:
         # build custom indicator classes
         self._gen_indicator_class()
 
+    def _batch_json_fqfn(self) -> str:
+        """Return a new unique fully qualified filename for a batch json file."""
+        while True:
+            # get timestamp as a string without decimal place and consistent length
+            filename = f'{str(round(time.time() * 10000000))}.json.gz'
+            if self.output_extension is not None:
+                # add any additional extension provided
+                filename += self.output_extension
+
+            # streamed chunks can be written faster than the timestamp resolution
+            if filename not in self._batch_files:
+                break
+
+        # track the filename so the next streamed chunk gets a unique filename
+        self._batch_files.append(filename)
+        return os.path.join(self.output_dir, filename)
+
+    @staticmethod
+    def _drain(entities: Union[dict, BatchSpillStore]) -> Iterator[Tuple[str, Any]]:
+        """Yield and remove each entry from the in memory dict or spill file.
+
+        Args:
+            entities: The dict or spill store of group/indicator data.
+        """
+        if isinstance(entities, BatchSpillStore):
+            # sequential read of the spill file
+            yield from entities.drain()
+        else:
+            for xid in list(entities.keys()):
+                yield xid, entities.pop(xid)
+
+    def _dump_stream_close(self, chunk: BatchChunkWriter, fh: gzip.GzipFile, fqfn: str) -> None:
+        """Finish and close a streamed batch JSON file.
+
+        Args:
+            chunk: The chunk writer for the current file.
+            fh: The file handle for the current file.
+            fqfn: The fully qualified filename of the current file.
+        """
+        chunk.finish()
+        fh.close()
+        self.log.info(
+            f'feature=batch, event=dump-stream, filename={os.path.basename(fqfn)}, '
+            f'count={chunk.count:,}, size={chunk.size:,}'
+        )
+        self._write_callback(fqfn)
+
     def _gen_indicator_class(self) -> None:  # pragma: no cover
         """Generate Custom Indicator Classes."""
         for entry in self.tic.indicator_types_data.values():
@@ -224,18 +280,19 @@ class BatchWriter:
         if self.groups.get(xid) is not None:
             # return existing group from memory
             group_data = self.groups.get(xid)
-        elif self.groups_shelf.get(xid) is not None:
+        elif xid in self.groups_shelf:
             # return existing group from shelf
             group_data = self.groups_shelf.get(xid)
         else:
             # store new group
             self.groups[xid] = group_data
 
-            # track total batch job data size as TI gets added
-            if isinstance(group_data, dict):
-                self._batch_size += sys.getsizeof(json.dumps(group_data))
-            else:
-                self._batch_size += sys.getsizeof(json.dumps(group_data.data))
+            # track estimated batch job data size as TI gets added. the entity is only
+            # serialized until the size estimate is calibrated, since TI objects are typically
+            # still being updated (e.g., attributes and tags) after being added.
+            self._batch_size += self._size_tracker.estimate(
+                group_data if isinstance(group_data, dict) else group_data.data
+            )
 
             # max size hit, dump TI to disk
             if self._batch_size > self._batch_max_size:
@@ -264,18 +321,19 @@ class BatchWriter:
         if self.indicators.get(xid) is not None:
             # return existing indicator from memory
             indicator_data = self.indicators.get(xid)
-        elif self.indicators_shelf.get(xid) is not None:
+        elif xid in self.indicators_shelf:
             # return existing indicator from shelf
             indicator_data = self.indicators_shelf.get(xid)
         else:
             # store new indicators
             self.indicators[xid] = indicator_data
 
-            # track total batch job data size as TI gets added
-            if isinstance(indicator_data, dict):
-                self._batch_size += sys.getsizeof(json.dumps(indicator_data))
-            else:
-                self._batch_size += sys.getsizeof(json.dumps(indicator_data.data))
+            # track estimated batch job data size as TI gets added. the entity is only
+            # serialized until the size estimate is calibrated, since TI objects are typically
+            # still being updated (e.g., attributes and tags) after being added.
+            self._batch_size += self._size_tracker.estimate(
+                indicator_data if isinstance(indicator_data, dict) else indicator_data.data
+            )
 
             # max size hit, dump TI to disk
             if self._batch_size > self._batch_max_size:
@@ -315,6 +373,11 @@ class BatchWriter:
 
         return indicator_list
 
+    def _write_callback(self, fqfn: str) -> None:
+        """Send the batch json filename to the write callback."""
+        if callable(self.write_callback):
+            self.write_callback(fqfn, **self.write_callback_kwargs)
+
     def add_group(self, group_data: dict, **kwargs) -> Union[dict, GroupType]:
         """Add a group to Batch Job.
 
@@ -694,11 +757,10 @@ class BatchWriter:
             bool: True if max values have been hit, else False.
         """
         # process the indicator
-        for xid, indicator_data in list(indicators.items()):
+        for _, indicator_data in self._drain(indicators):
             if not isinstance(indicator_data, dict):
                 indicator_data = indicator_data.data
             data['indicator'].append(indicator_data)
-            del indicators[xid]
 
             # update entity trackers
             tracker['count'] += 1
@@ -712,6 +774,33 @@ class BatchWriter:
 
         return False
 
+    def data_stream(self) -> Iterator[Tuple[str, list]]:
+        """Yield the batch group and indicator data to be written to batch JSON files.
+
+        Groups are yielded along with all associated groups so that an association chain is
+        always written to the same batch JSON file. All groups are yielded before indicators.
+
+        This method will remove the group/indicator from memory and/or shelf.
+
+        Yields:
+            Tuple[str, list]: The entity type ("group" or "indicator") and a list of the UTF-8
+                encoded entity data.
+        """
+        tracker = {'count': 0, 'bytes': 0}
+
+        for groups in (self.groups, self.groups_shelf):
+            for xid in list(groups.keys()):
+                data = {'file': {}, 'group': [], 'indicator': []}
+                self.data_group_association(data, tracker, xid)
+                if data['group']:
+                    yield 'group', [self._size_tracker.encode(g) for g in data['group']]
+
+        for indicators in (self.indicators, self.indicators_shelf):
+            for _, indicator_data in self._drain(indicators):
+                if not isinstance(indicator_data, dict):
+                    indicator_data = indicator_data.data
+                yield 'indicator', [self._size_tracker.encode(indicator_data)]
+
     def document(self, name: str, file_name: str, **kwargs) -> Document:
         """Add Document data to Batch.
 
@@ -735,6 +824,10 @@ class BatchWriter:
 
     def dump(self) -> None:
         """Process Batch request to ThreatConnect API."""
+        if self.stream is True:
+            self.dump_stream()
+            return
+
         content = self.data
         content.pop('file', {})
         if not content.get('group') and not content.get('indicator'):
@@ -756,6 +849,34 @@ class BatchWriter:
         # reset batch size after dump
         self._batch_size = 0
 
+    def dump_stream(self) -> None:
+        """Write batch data incrementally to batch JSON files.
+
+        Each file is bounded by batch_max_chunk entities and batch_max_size serialized bytes.
+        Entities are written one at a time so memory usage does not grow with the feed size.
+        """
+        chunk = None
+        fh = None
+        fqfn = None
+        for entity_type, entities in self.data_stream():
+            if chunk is None:
+                fqfn = self._batch_json_fqfn()
+                fh = gzip.open(fqfn, mode='wb')
+                chunk = BatchChunkWriter(fh, self._batch_max_chunk, self._batch_max_size)
+
+            for entity_data in entities:
+                chunk.add(entity_type, entity_data)
+
+            if chunk.full:
+                self._dump_stream_close(chunk, fh, fqfn)
+                chunk = None
+
+        if chunk is not None:
+            self._dump_stream_close(chunk, fh, fqfn)
+
+        # reset batch size after dump
+        self._batch_size = 0
+
     def email(self, name: str, subject: str, header: str, body: str, **kwargs) -> Email:
         """Add Email data to Batch.
 
@@ -905,10 +1026,10 @@ class BatchWriter:
         return self._groups
 
     @property
-    def groups_shelf(self) -> shelve.DbfilenameShelf:
-        """Return dictionary of all Groups data."""
+    def groups_shelf(self) -> BatchSpillStore:
+        """Return dictionary of all Groups data spilled to disk."""
         if self._groups_shelf is None:
-            self._groups_shelf = shelve.open(self.group_shelf_fqfn, writeback=False)  # nosec
+            self._groups_shelf = BatchSpillStore(self.group_shelf_fqfn)
         return self._groups_shelf
 
     def host(self, hostname: str, **kwargs) -> Host:
@@ -993,12 +1114,10 @@ class BatchWriter:
         return self._indicators
 
     @property
-    def indicators_shelf(self) -> shelve.DbfilenameShelf:
-        """Return dictionary of all Indicator data."""
+    def indicators_shelf(self) -> BatchSpillStore:
+        """Return dictionary of all Indicator data spilled to disk."""
         if self._indicators_shelf is None:
-            self._indicators_shelf = shelve.open(  # nosec
-                self.indicator_shelf_fqfn, writeback=False
-            )
+            self._indicators_shelf = BatchSpillStore(self.indicator_shelf_fqfn)
         return self._indicators_shelf
 
     def intrusion_set(self, name: str, **kwargs) -> IntrusionSet:
@@ -1096,7 +1215,7 @@ class BatchWriter:
         return self._group(group_obj, kwargs.get('store', True))
 
     def save(self, resource: Union[dict, GroupType, IndicatorType]) -> None:
-        """Save group|indicator dict, GroupType, or IndicatorTypes to shelve.
+        """Save group|indicator dict, GroupType, or IndicatorTypes to the spill file.
 
         Best effort to save group/indicator data to disk.  If for any reason the save fails
         the data will still be accessible from list in memory.
@@ -1280,17 +1399,9 @@ class BatchWriter:
     def write_batch_json(self, content: dict) -> None:
         """Write batch json data to a file."""
         if content:
-            # get timestamp as a string without decimal place and consistent length
-            filename = f'{str(round(time.time() * 10000000))}.json.gz'
-            if self.output_extension is not None:
-                # add any additional extension provided
-                filename += self.output_extension
-            # TODO: is this needed
-            self._batch_files.append(filename)
-            fqfn = os.path.join(self.output_dir, filename)
+            fqfn = self._batch_json_fqfn()
             with gzip.open(fqfn, mode='wt', encoding='utf-8') as fh:
                 json.dump(content, fh)
 
             # send callback the filename
-            if callable(self.write_callback):
-                self.write_callback(fqfn, **self.write_callback_kwargs)
+            self._write_callback(fqfn)
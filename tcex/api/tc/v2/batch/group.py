@@ -1,6 +1,7 @@
 """ThreatConnect Batch Import Module"""
 # standard library
 import json
+import os
 import uuid
 from typing import Any, Callable, Optional, Union
 
@@ -73,7 +74,9 @@ class Group:
         }
 
     def add_file(
-        self, filename: str, file_content: Union[bytes, Callable[[str], Any], str]
+        self,
+        filename: str,
+        file_content: Union[bytes, Callable[[str], Any], os.PathLike, str],
     ) -> None:
         """Add a file for Document and Report types.
 
@@ -84,7 +87,8 @@ class Group:
 
         Args:
             filename: The name of the file.
-            file_content: The contents of the file or callback to get contents.
+            file_content: The contents of the file, a path to the file (streamed on upload),
+                or callback to get contents.
         """
         self._group_data['fileName'] = filename
         self._file_content = file_content
@@ -244,12 +244,12 @@ class Indicator:
         # add file actions
         if self._file_actions:
             self._indicator_data.setdefault('fileAction', {})
-            self._indicator_data['fileAction'].setdefault('children', [])
+            self._indicator_data['fileAction']['children'] = []
             for action in self._file_actions:
                 self._indicator_data['fileAction']['children'].append(action.data)
         # add file occurrences
         if self._occurrences:
-            self._indicator_data.setdefault('fileOccurrence', [])
+            self._indicator_data['fileOccurrence'] = []
             for occurrence in self._occurrences:
                 self._indicator_data['fileOccurrence'].append(occurrence.data)
         # add security labels
@@ -715,8 +715,9 @@ class FileAction:
     def data(self) -> dict:
         """Return File Occurrence data."""
         if self._children:
+            self._action_data['children'] = []
             for child in self._children:
-                self._action_data.setdefault('children', []).append(child.data)
+                self._action_data['children'].append(child.data)
         return self._action_data
 
     def action(self, relationship) -> None:
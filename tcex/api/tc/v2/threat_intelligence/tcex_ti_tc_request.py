@@ -1,7 +1,10 @@
 """ThreatConnect Threat Intelligence Module"""
 # standard library
+import collections
 import hashlib
+import itertools
 import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from functools import lru_cache
 from typing import Optional
 from urllib.parse import quote
@@ -11,6 +14,7 @@ from requests import Session
 
 # first-party
 from tcex.exit.error_codes import TcExErrorCodes
+from tcex.pleb.threading import ThreadContext
 
 # import local modules for dynamic reference
 module = __import__(__name__)
@@ -28,6 +32,10 @@ class TiTcRequest:
 
         # properties
         self.log = logger
+        # the max number of pages requested concurrently when iterating (1 is sequential)
+        self.max_workers = 1
+        # if False, pages requested concurrently are yielded as they complete
+        self.ordered = True
         self.result_limit = 10000
 
     def _delete(self, url, params=None):
@@ -37,13 +45,15 @@ class TiTcRequest:
 
         r = self.session.delete(url, params=params)
         self.log.debug(
-            f'Method: ({r.request.method.upper()}), '
-            f'Params: ({params}), '
-            f'Status Code: {r.status_code}, '
-            f'URL: ({r.url})'
+            'Method: (%s), Params: (%s), Status Code: %s, URL: (%s)',
+            r.request.method.upper(),
+            params,
+            r.status_code,
+            r.url,
         )
-        if len(r.content) < 500:
-            self.log.trace(f'response: {r.text}')
+        # only decode the response body when TRACE logging is enabled
+        if self.log.isEnabledFor(logging.TRACE) and len(r.content) < 500:  # pylint: disable=E1101
+            self.log.trace('response: %s', r.text)
         if not r.ok:
             err = r.text or r.reason
             self.log.error(f'Error deleting data ({err}')
@@ -63,13 +73,15 @@ class TiTcRequest:
         r = self.session.get(url, params=params)
 
         self.log.debug(
-            f'Method: ({r.request.method.upper()}), '
-            f'Params: ({params}), '
-            f'Status Code: {r.status_code}, '
-            f'URL: ({r.url})'
+            'Method: (%s), Params: (%s), Status Code: %s, URL: (%s)',
+            r.request.method.upper(),
+            params,
+            r.status_code,
+            r.url,
         )
-        if len(r.content) < 500:
-            self.log.trace(f'response: {r.text}')
+        # only decode the response body when TRACE logging is enabled
+        if self.log.isEnabledFor(logging.TRACE) and len(r.content) < 500:  # pylint: disable=E1101
+            self.log.trace('response: %s', r.text)
         if not r.ok:
             err = r.text or r.reason
             self.log.error(f'Error getting data ({err}')
@@ -105,7 +117,11 @@ class TiTcRequest:
             raise RuntimeError(code, message)
 
     def _iterate(self, url, params, api_entity):
-        """Iterate over API pagination."""
+        """Iterate over API pagination.
+
+        When max_workers is greater than 1 and the first page includes the resultCount, the
+        remaining pages are requested concurrently (see _iterate_parallel).
+        """
         safe_params = params.copy()
         safe_params['resultLimit'] = self.result_limit
 
@@ -118,20 +134,84 @@ class TiTcRequest:
             self.log.error('Invalid ResultStart Param. Starting at 0')
         while should_iterate:
             safe_params['resultStart'] = result_start
-            r = self._get(url, params=safe_params)
-            if not self.success(r):
-                err = r.text or r.reason
-                self._handle_error(950, [r.status_code, err, r.url])
-            data = r.json().get('data', {})
-            if api_entity:
-                data = data.get(api_entity, [])
+            data, result_count = self._iterate_page(url, safe_params, api_entity)
 
             if len(data) < self.result_limit:
                 should_iterate = False
             result_start += self.result_limit
 
+            if should_iterate and self.max_workers > 1 and result_count is not None:
+                yield from self._iterate_parallel(
+                    url, safe_params, api_entity, data, result_start, result_count
+                )
+                return
+
             yield from data
 
+    def _iterate_page(self, url, params, api_entity):
+        """Return the data and resultCount (if available) of a page."""
+        r = self._get(url, params=params)
+        if not self.success(r):
+            err = r.text or r.reason
+            self._handle_error(950, [r.status_code, err, r.url])
+        data = r.json().get('data', {})
+
+        result_count = None
+        if isinstance(data, dict):
+            result_count = data.get('resultCount')
+        if api_entity:
+            data = data.get(api_entity, [])
+        return data, result_count
+
+    def _iterate_parallel(self, url, params, api_entity, data, result_start, result_count):
+        """Yield the first page and the remaining pages requested by a pool of threads.
+
+        The offsets of the remaining pages are calculated from the resultCount of the first page,
+        so results added after the first page is requested are not returned. At most
+        max_workers * 2 pages are requested ahead of the consumer. When ordered is True the
+        results are yielded in offset order, otherwise the pages are yielded as they complete.
+        The pages are requested in the context of the calling thread, so in Service Apps the
+        token of the calling thread (e.g., by trigger id) is used.
+        """
+        context = ThreadContext()
+        offsets = iter(range(result_start, result_count, self.result_limit))
+        max_in_flight = self.max_workers * 2
+        pending = collections.deque()
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix='ti-iterate'
+        ) as executor:
+
+            def _submit():
+                for offset in itertools.islice(offsets, max_in_flight - len(pending)):
+                    page_params = dict(params, resultStart=offset)
+                    pending.append(
+                        executor.submit(
+                            context.run, self._iterate_page, url, page_params, api_entity
+                        )
+                    )
+
+            try:
+                _submit()
+                yield from data
+
+                while pending:
+                    if self.ordered:
+                        done = [pending.popleft()]
+                    else:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            pending.remove(future)
+
+                    for future in done:
+                        page, _ = future.result()
+                        _submit()
+                        yield from page
+            finally:
+                # cancel the pages that have not been requested when the consumer stops early
+                for future in pending:
+                    future.cancel()
+
     def _post(self, url, data, params=None):
         """Post data to API."""
         params = params or {}
@@ -139,15 +219,17 @@ class TiTcRequest:
 
         r = self.session.post(url, data=data, params=params)
         self.log.debug(
-            f'Method: ({r.request.method.upper()}), '
-            f'Params: ({params}), '
-            f'Status Code: {r.status_code}, '
-            f'URL: ({r.url})'
+            'Method: (%s), Params: (%s), Status Code: %s, URL: (%s)',
+            r.request.method.upper(),
+            params,
+            r.status_code,
+            r.url,
         )
         if len(data) < 50 and not isinstance(data, bytes):
-            self.log.trace(f'body: {data}')
-        if len(r.content) < 500:
-            self.log.trace(f'response: {r.text}')
+            self.log.trace('body: %s', data)
+        # only decode the response body when TRACE logging is enabled
+        if self.log.isEnabledFor(logging.TRACE) and len(r.content) < 500:  # pylint: disable=E1101
+            self.log.trace('response: %s', r.text)
         if not r.ok:
             err = r.text or r.reason
             self.log.error(f'Error posting data ({err}')
@@ -160,14 +242,16 @@ class TiTcRequest:
 
         r = self.session.post(url, json=json_data, params=params)
         self.log.debug(
-            f'Method: ({r.request.method.upper()}), '
-            f'Params: ({params}), '
-            f'Status Code: {r.status_code}, '
-            f'URL: ({r.url})'
+            'Method: (%s), Params: (%s), Status Code: %s, URL: (%s)',
+            r.request.method.upper(),
+            params,
+            r.status_code,
+            r.url,
         )
-        self.log.trace(f'body: {json_data}')
-        if len(r.content) < 500:
-            self.log.trace(f'response: {r.text}')
+        self.log.trace('body: %s', json_data)
+        # only decode the response body when TRACE logging is enabled
+        if self.log.isEnabledFor(logging.TRACE) and len(r.content) < 500:  # pylint: disable=E1101
+            self.log.trace('response: %s', r.text)
         if not r.ok:
             err = r.text or r.reason
             self.log.error(f'Error posting data ({err}')
@@ -180,15 +264,17 @@ class TiTcRequest:
 
         r = self.session.put(url, json=json_data, params=params)
         self.log.debug(
-            f'Method: ({r.request.method.upper()}), '
-            f'Params: ({params}), '
-            f'Status Code: {r.status_code}, '
-            f'URL: ({r.url})'
+            'Method: (%s), Params: (%s), Status Code: %s, URL: (%s)',
+            r.request.method.upper(),
+            params,
+            r.status_code,
+            r.url,
         )
         if len(json_data) < 50 and not isinstance(json_data, bytes):
-            self.log.trace(f'body: {json_data}')
-        if len(r.content) < 500:
-            self.log.trace(f'response: {r.text}')
+            self.log.trace('body: %s', json_data)
+        # only decode the response body when TRACE logging is enabled
+        if self.log.isEnabledFor(logging.TRACE) and len(r.content) < 500:  # pylint: disable=E1101
+            self.log.trace('response: %s', r.text)
         if not r.ok:
             err = r.text or r.reason
             self.log.error(f'Error updating data ({err}')
@@ -790,8 +876,8 @@ class TiTcRequest:
         url = f'/v2/{main_type}/{sub_type}/{unique_id}/falsePositive'
 
         r = self._post(url, {}, params)
-        self.log.debug(f'status code: {r.status_code}')
-        self.log.trace(f'url: {r.request.url}')
+        self.log.debug('status code: %s', r.status_code)
+        self.log.trace('url: %s', r.request.url)
         return r
 
     def owners(self, main_type, sub_type, unique_id, owner=None):
@@ -803,8 +889,8 @@ class TiTcRequest:
             url = f'/v2/{main_type}/{sub_type}/{unique_id}/owners'
 
         r = self._get(url, params=params)
-        self.log.debug(f'status code: {r.status_code}')
-        self.log.trace(f'url: {r.request.url}')
+        self.log.debug('status code: %s', r.status_code)
+        self.log.trace('url: %s', r.request.url)
         return r
 
     def add_observations(self, main_type, sub_type, unique_id, data, owner=None):
@@ -813,8 +899,8 @@ class TiTcRequest:
 
         url = f'/v2/{main_type}/{sub_type}/{unique_id}/observations'
         r = self._post_json(url, data, params)
-        self.log.debug(f'status code: {r.status_code}')
-        self.log.trace(f'url: {r.request.url}')
+        self.log.debug('status code: %s', r.status_code)
+        self.log.trace('url: %s', r.request.url)
         return r
 
     def observation_count(self, main_type, sub_type, unique_id, owner=None):
@@ -827,8 +913,8 @@ class TiTcRequest:
             url = f'/v2/{main_type}/{sub_type}/{unique_id}/observationCount'
 
         r = self._get(url, params)
-        self.log.debug(f'status code: {r.status_code}')
-        self.log.trace(f'url: {r.request.url}')
+        self.log.debug('status code: %s', r.status_code)
+        self.log.trace('url: %s', r.request.url)
         return r
 
     def observations(self, main_type, sub_type, unique_id, owner=None, params=None):
@@ -844,8 +930,8 @@ class TiTcRequest:
             url = f'/v2/{type}/{sub_type}/{unique_id}/observations'
 
         r = self._get(url, params)
-        self.log.debug(f'status code: {r.status_code}')
-        self.log.trace(f'url: {r.request.url}')
+        self.log.debug('status code: %s', r.status_code)
+        self.log.trace('url: %s', r.request.url)
         return r
 
     def dns_resolution(self, main_type, sub_type, unique_id, owner=None):
@@ -858,8 +944,8 @@ class TiTcRequest:
             url = f'/v2/{main_type}/{sub_type}/{unique_id}/dnsResolution'
 
         r = self._get(url, params)
-        self.log.debug(f'status code: {r.status_code}')
-        self.log.trace(f'url: {r.request.url}')
+        self.log.debug('status code: %s', r.status_code)
+        self.log.trace('url: %s', r.request.url)
         return r
 
     def set_dns_resolution(self, main_type, sub_type, unique_id, value, owner=None):
@@ -878,8 +964,8 @@ class TiTcRequest:
             url = f'/v2/{main_type}/{sub_type}/{unique_id}'
 
         r = self._put_json(url, data, params)
-        self.log.debug(f'status code: {r.status_code}')
-        self.log.trace(f'url: {r.request.url}')
+        self.log.debug('status code: %s', r.status_code)
+        self.log.trace('url: %s', r.request.url)
         return r
 
     def set_whois(self, main_type, sub_type, unique_id, value, owner=None):
@@ -898,8 +984,8 @@ class TiTcRequest:
             url = f'/v2/{main_type}/{sub_type}/{unique_id}'
 
         r = self._put_json(url, data, params)
-        self.log.debug(f'status code: {r.status_code}')
-        self.log.trace(f'url: {r.request.url}')
+        self.log.debug('status code: %s', r.status_code)
+        self.log.trace('url: %s', r.request.url)
         return r
 
     @staticmethod
@@ -1167,8 +1253,8 @@ class TiTcRequest:
             self.log.error('associations error')
 
         if r is not None:
-            self.log.debug(f'status code: {r.status_code}')
-            self.log.trace(f'url: {r.request.url}')
+            self.log.debug('status code: %s', r.status_code)
+            self.log.trace('url: %s', r.request.url)
         return r
 
     def victim(self, main_type, sub_type, unique_id, victim_id, params=None):
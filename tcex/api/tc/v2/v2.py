@@ -103,7 +103,13 @@ class V2:
 
         Args:
             output_dir: Deprecated input, will not be used.
+            batch_max_chunk (kwargs: int): The max number of entities per batch JSON file
+                (stream mode only).
+            batch_max_size (kwargs: int): The max size in bytes per batch JSON file
+                (stream mode only).
             output_extension (kwargs: str): Append this extension to output files.
+            stream (kwargs: bool): If True, write batch JSON data incrementally to multiple
+                size bounded files.
             write_callback (kwargs: Callable): A callback method to call when a batch json file
                 is written. The callback will be passed the fully qualified name of the written
                 file.
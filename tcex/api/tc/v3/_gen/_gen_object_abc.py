@@ -62,6 +62,8 @@ class GenerateObjectABC(GenerateABC, ABC):
                 kwargs.pop('params', None)
             )
             self._model = ArtifactsModel(**kwargs)
+            self.type_ = 'artifacts'
+            self._base_class = Artifact
         """
         # add method import requirement
         classes = [
@@ -83,6 +85,7 @@ class GenerateObjectABC(GenerateABC, ABC):
                 f'''{self.i2})''',
                 f'''{self.i2}self._model = {self.type_.plural().pascal_case()}Model(**kwargs)''',
                 f'''{self.i2}self.type_ = \'{self.type_.plural()}\'''',
+                f'''{self.i2}self._base_class = {self.type_.singular().pascal_case()}''',
                 '',
                 '',
             ]
@@ -33,6 +33,7 @@ class ArtifactTypes(ObjectCollectionABC):
         )
         self._model = ArtifactTypesModel(**kwargs)
         self.type_ = 'artifact_types'
+        self._base_class = ArtifactType
 
     def __iter__(self) -> 'ArtifactType':
         """Iterate over CM objects."""
@@ -42,6 +42,7 @@ class Artifacts(ObjectCollectionABC):
         )
         self._model = ArtifactsModel(**kwargs)
         self.type_ = 'artifacts'
+        self._base_class = Artifact
 
     def __iter__(self) -> 'Artifact':
         """Iterate over CM objects."""
@@ -36,6 +36,7 @@ class AttributeTypes(ObjectCollectionABC):
         )
         self._model = AttributeTypesModel(**kwargs)
         self.type_ = 'attribute_types'
+        self._base_class = AttributeType
 
     def __iter__(self) -> 'AttributeType':
         """Iterate over CM objects."""
@@ -36,6 +36,7 @@ class CaseAttributes(ObjectCollectionABC):
         )
         self._model = CaseAttributesModel(**kwargs)
         self.type_ = 'case_attributes'
+        self._base_class = CaseAttribute
 
     def __iter__(self) -> 'CaseAttribute':
         """Iterate over CM objects."""
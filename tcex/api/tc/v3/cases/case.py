@@ -52,6 +52,7 @@ class Cases(ObjectCollectionABC):
         )
         self._model = CasesModel(**kwargs)
         self.type_ = 'cases'
+        self._base_class = Case
 
     def __iter__(self) -> 'Case':
         """Iterate over CM objects."""
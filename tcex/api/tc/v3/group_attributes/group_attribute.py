@@ -36,6 +36,7 @@ class GroupAttributes(ObjectCollectionABC):
         )
         self._model = GroupAttributesModel(**kwargs)
         self.type_ = 'group_attributes'
+        self._base_class = GroupAttribute
 
     def __iter__(self) -> 'GroupAttribute':
         """Iterate over CM objects."""
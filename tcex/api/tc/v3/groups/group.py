@@ -54,6 +54,7 @@ class Groups(ObjectCollectionABC):
         )
         self._model = GroupsModel(**kwargs)
         self.type_ = 'groups'
+        self._base_class = Group
 
     def __iter__(self) -> 'Group':
         """Iterate over CM objects."""
@@ -36,6 +36,7 @@ class IndicatorAttributes(ObjectCollectionABC):
         )
         self._model = IndicatorAttributesModel(**kwargs)
         self.type_ = 'indicator_attributes'
+        self._base_class = IndicatorAttribute
 
     def __iter__(self) -> 'IndicatorAttribute':
         """Iterate over CM objects."""
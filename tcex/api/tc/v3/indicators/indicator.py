@@ -50,6 +50,7 @@ class Indicators(ObjectCollectionABC):
         )
         self._model = IndicatorsModel(**kwargs)
         self.type_ = 'indicators'
+        self._base_class = Indicator
 
     def __iter__(self) -> 'Indicator':
         """Iterate over CM objects."""
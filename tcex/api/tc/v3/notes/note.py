@@ -33,6 +33,7 @@ class Notes(ObjectCollectionABC):
         )
         self._model = NotesModel(**kwargs)
         self.type_ = 'notes'
+        self._base_class = Note
 
     def __iter__(self) -> 'Note':
         """Iterate over CM objects."""
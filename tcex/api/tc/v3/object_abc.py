@@ -108,7 +108,7 @@ class ObjectABC(ABC):
             self.request = self._session.request(
                 method, url, data=body, headers=headers, params=params
             )
-            self.log.debug(f'feature=api-tc-v3, request-body={self.request.request.body}')
+            self.log.debug('feature=api-tc-v3, request-body=%s', self.request.request.body)
         except (ConnectionError, ProxyError, RetryError):  # pragma: no cover
             handle_error(
                 code=951,
@@ -260,10 +260,14 @@ class ObjectABC(ABC):
 
     def log_response_text(self, response: Response) -> None:
         """Log the response text."""
+        if not self.log.isEnabledFor(logging.DEBUG):
+            # decoding the response text is expensive, skip it when it won't be logged
+            return
+
         response_text = 'response text: (text to large to log)'
         if len(response.content) < 5000:  # check size of content for performance
             response_text = response.text
-        self.log.debug(f'feature=api-tc-v3, response-body={response_text}')
+        self.log.debug('feature=api-tc-v3, response-body=%s', response_text)
 
     @property
     def model(self) -> 'V3Type':
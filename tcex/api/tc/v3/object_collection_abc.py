@@ -1,17 +1,22 @@
 """Case Management Collection Abstract Base Class"""
 # standard library
 import logging
+import queue
+import threading
 from abc import ABC
-from typing import TYPE_CHECKING, Optional, Union
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, NamedTuple, Optional, Union
 
 # third-party
 from requests import Response
 from requests.exceptions import ProxyError, RetryError
 
 # first-party
+from tcex.api.tc.v3.object_abc import ObjectABC
 from tcex.api.tc.v3.tql.tql import Tql
 from tcex.backports import cached_property
 from tcex.exit.error_codes import handle_error
+from tcex.pleb.threading import ThreadContext
 from tcex.utils import Utils
 
 if TYPE_CHECKING:
@@ -40,6 +45,25 @@ if TYPE_CHECKING:
 logger = logging.getLogger('tcex')
 
 
+class BulkResult(NamedTuple):
+    """The result of a single object in a bulk create or update.
+
+    Args:
+        index: The position of the item in the provided items.
+        obj: The object that was written (None if the object could not be built).
+        error: The error raised while writing the object (None on success).
+    """
+
+    index: int
+    obj: Optional[ObjectABC]
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        """Return True if the object was written."""
+        return self.error is None
+
+
 class ObjectCollectionABC(ABC):
     """Case Management Collection Abstract Base Class
 
@@ -57,6 +81,7 @@ class ObjectCollectionABC(ABC):
     ) -> None:
         """Initialize class properties."""
         self._params = params or {}
+        self._prefetch = 0
         self._tql_filters = tql_filters or []
 
         # properties
@@ -64,6 +89,7 @@ class ObjectCollectionABC(ABC):
         self.log = logger
         self.request = None
         self.tql = Tql()
+        self._base_class = None  # defined in child class
         self._model = None
         self.type_ = None  # defined in child class
         self.utils = Utils()
@@ -113,7 +139,7 @@ class ObjectCollectionABC(ABC):
             self.request = self._session.request(
                 method, url, data=body, headers=headers, params=params
             )
-            self.log.debug(f'feature=api-tc-v3, request-body={self.request.request.body}')
+            self.log.debug('feature=api-tc-v3, request-body=%s', self.request.request.body)
         except (ConnectionError, ProxyError, RetryError):  # pragma: no cover
             handle_error(
                 code=951,
@@ -140,6 +166,159 @@ class ObjectCollectionABC(ABC):
         # log content for debugging
         self.log_response_text(self.request)
 
+    def _bulk_object(self, item: Union[ObjectABC, 'BaseModel', dict]) -> ObjectABC:
+        """Return the object for an item of a bulk create or update."""
+        if isinstance(item, ObjectABC):
+            return item
+
+        if isinstance(item, dict):
+            return self._base_class(session=self._session, **item)  # pylint: disable=not-callable
+
+        obj = self._base_class(session=self._session)  # pylint: disable=not-callable
+        obj.model = item
+        return obj
+
+    def _bulk_write(
+        self,
+        items: Iterable[Union[ObjectABC, 'BaseModel', dict]],
+        method: str,
+        max_workers: int,
+        rate_limiter: Optional[Any],
+        **kwargs,
+    ) -> Iterator[BulkResult]:
+        """Write the objects using a pool of threads, yielding the results as they complete.
+
+        At most max_workers * 2 objects are in flight, so the items are consumed as the results
+        are yielded instead of being loaded up front. The objects are written in the context of
+        the calling thread, so in Service Apps the token of the calling thread is used.
+        """
+        context = ThreadContext()
+
+        def _write(obj: ObjectABC) -> None:
+            if rate_limiter is not None:
+                rate_limiter.acquire()
+            getattr(obj, method)(**kwargs)
+
+        def _result(future: Future) -> BulkResult:
+            index, obj = in_flight.pop(future)
+            return BulkResult(index, obj, future.exception())
+
+        in_flight = {}
+        max_in_flight = max_workers * 2
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f'bulk-{method}'
+        ) as executor:
+            for index, item in enumerate(items):
+                if len(in_flight) >= max_in_flight:
+                    # wait for an object to be written before submitting the next item
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield _result(future)
+
+                try:
+                    obj = self._bulk_object(item)
+                except Exception as ex:
+                    # invalid items (e.g., model validation errors) are reported in the results
+                    yield BulkResult(index, None, ex)
+                    continue
+
+                in_flight[executor.submit(context.run, _write, obj)] = (index, obj)
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield _result(future)
+
+    def create_many(
+        self,
+        items: Iterable[Union[ObjectABC, 'BaseModel', dict]],
+        max_workers: Optional[int] = 10,
+        params: Optional[dict] = None,
+        rate_limiter: Optional[Any] = None,
+    ) -> Iterator[BulkResult]:
+        """Create the objects, yielding the result of each object as it completes.
+
+        The objects are created concurrently over the shared session. The connection pool of the
+        session should allow at least max_workers connections to reuse the connections.
+
+        Args:
+            items: The objects, models, or dicts of the objects to create.
+            max_workers: The max number of concurrent requests.
+            params: Additional query params for each request.
+            rate_limiter: An object with an acquire() method that is called before each
+                request (e.g., to throttle the requests).
+        """
+        return self._bulk_write(items, 'create', max_workers, rate_limiter, params=params)
+
+    def _fetch_pages(self, url: str, params: dict) -> Iterator[list]:
+        """Yield the data of each page, following the next url of the responses."""
+        while True:
+            self._request(
+                'GET',
+                body=None,
+                url=url,
+                headers={'content-type': 'application/json'},
+                params=params,
+            )
+
+            # reset some vars
+            params = {}
+
+            response = self.request.json()
+            url = response.pop('next', None)
+            yield response.get('data', [])
+
+            # break out of pagination if no next url present in results
+            if not url:
+                break
+
+    @staticmethod
+    def _prefetch_pages(pages: Iterator[list], prefetch: int) -> Iterator[list]:
+        """Yield the pages fetched by a background thread, up to prefetch pages ahead.
+
+        The fetch thread is stopped when the generator is closed (e.g., the consumer breaks out of
+        the loop), after any in progress request completes. The pages are fetched in the context
+        of the consumer thread, so in Service Apps the token of the consumer thread is used.
+        """
+        context = ThreadContext()
+        done = object()
+        pages_queue = queue.Queue(maxsize=prefetch)
+        stop_event = threading.Event()
+
+        def _put(item: tuple) -> bool:
+            while not stop_event.is_set():
+                try:
+                    pages_queue.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def _fetch() -> None:
+            try:
+                for page in pages:
+                    if not _put((page, None)):
+                        return
+            except Exception as ex:
+                # errors (e.g., failed requests) are raised in the consumer
+                _put((None, ex))
+                return
+            _put((done, None))
+
+        threading.Thread(
+            target=context.run, args=(_fetch,), name='iterate-prefetch', daemon=True
+        ).start()
+        try:
+            while True:
+                page, error = pages_queue.get()
+                if error is not None:
+                    raise error
+                if page is done:
+                    break
+                yield page
+        finally:
+            stop_event.set()
+
     @property
     def filter(self) -> None:  # pragma: no cover
         """Return filter method."""
@@ -147,10 +326,14 @@ class ObjectCollectionABC(ABC):
 
     def log_response_text(self, response: Response) -> None:
         """Log the response text."""
+        if not self.log.isEnabledFor(logging.DEBUG):
+            # decoding the response text is expensive, skip it when it won't be logged
+            return
+
         response_text = 'response text: (text to large to log)'
         if len(response.content) < 5000:  # check size of content for performance
             response_text = response.text
-        self.log.debug(f'feature=api-tc-v3, response-body={response_text}')
+        self.log.debug('feature=api-tc-v3, response-body=%s', response_text)
 
     @property
     def model(self):
@@ -166,9 +349,19 @@ class ObjectCollectionABC(ABC):
         base_class: 'BaseModel',
         api_endpoint: Optional[str] = None,
         params: Optional[dict] = None,
+        prefetch: Optional[int] = None,
     ) -> 'CaseManagementType':
-        """Iterate over CM/TI objects."""
+        """Iterate over CM/TI objects.
+
+        Args:
+            base_class: The object class of the results.
+            api_endpoint: The API endpoint, defaults to the endpoint of the collection.
+            params: The query params, defaults to the params of the collection.
+            prefetch: The max number of pages fetched ahead of the consumer on a background
+                thread, defaults to the prefetch of the collection (0 disables prefetching).
+        """
         url = api_endpoint or self._api_endpoint
+        prefetch = self.prefetch if prefetch is None else prefetch
         params = params or self.params
 
         # special parameter for indicators to enable the return the the indicator fields
@@ -186,29 +379,14 @@ class ObjectCollectionABC(ABC):
         if tql_string:
             params['tql'] = tql_string
 
-        while True:
-            self._request(
-                'GET',
-                body=None,
-                url=url,
-                headers={'content-type': 'application/json'},
-                params=params,
-            )
-
-            # reset some vars
-            params = {}
-
-            response = self.request.json()
-            data = response.get('data', [])
-            url = response.pop('next', None)
+        pages = self._fetch_pages(url, params)
+        if prefetch:
+            pages = self._prefetch_pages(pages, prefetch)
 
+        for data in pages:
             for result in data:
                 yield base_class(session=self._session, **result)
 
-            # break out of pagination if no next url present in results
-            if not url:
-                break
-
     # @staticmethod
     # def list_as_dict(added_items: 'CaseManagementType') -> dict:
     #     """Return the dict representation of the case management collection object."""
@@ -227,6 +405,21 @@ class ObjectCollectionABC(ABC):
         """Set the parameters of the case management object collection."""
         self._params = params
 
+    @property
+    def prefetch(self) -> int:
+        """Return the number of pages fetched ahead when iterating the collection.
+
+        Pages are fetched on a background thread while the consumer processes the current page.
+        At most prefetch pages are held in memory ahead of the consumer (each page holds up to
+        result_limit objects).
+        """
+        return self._prefetch
+
+    @prefetch.setter
+    def prefetch(self, prefetch: int) -> None:
+        """Set the number of pages fetched ahead when iterating the collection."""
+        self._prefetch = prefetch
+
     @staticmethod
     def success(r: Response) -> bool:
         """Validate the response is valid.
@@ -271,3 +464,28 @@ class ObjectCollectionABC(ABC):
     def tql_keywords(self):
         """Return supported TQL keywords."""
         return [to.get('keyword') for to in self.tql_options]
+
+    def update_many(
+        self,
+        items: Iterable[Union[ObjectABC, 'BaseModel', dict]],
+        mode: Optional[str] = None,
+        max_workers: Optional[int] = 10,
+        params: Optional[dict] = None,
+        rate_limiter: Optional[Any] = None,
+    ) -> Iterator[BulkResult]:
+        """Update the objects, yielding the result of each object as it completes.
+
+        The objects are updated concurrently over the shared session. The connection pool of the
+        session should allow at least max_workers connections to reuse the connections.
+
+        Args:
+            items: The objects, models, or dicts of the objects to update.
+            mode: The mode for nested objects (e.g., append, delete, replace).
+            max_workers: The max number of concurrent requests.
+            params: Additional query params for each request.
+            rate_limiter: An object with an acquire() method that is called before each
+                request (e.g., to throttle the requests).
+        """
+        return self._bulk_write(
+            items, 'update', max_workers, rate_limiter, mode=mode, params=params
+        )
@@ -33,6 +33,7 @@ class OwnerRoles(ObjectCollectionABC):
         )
         self._model = OwnerRolesModel(**kwargs)
         self.type_ = 'owner_roles'
+        self._base_class = OwnerRole
 
     def __iter__(self) -> 'OwnerRole':
         """Iterate over CM objects."""
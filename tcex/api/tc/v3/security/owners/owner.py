@@ -33,6 +33,7 @@ class Owners(ObjectCollectionABC):
         )
         self._model = OwnersModel(**kwargs)
         self.type_ = 'owners'
+        self._base_class = Owner
 
     def __iter__(self) -> 'Owner':
         """Iterate over CM objects."""
@@ -33,6 +33,7 @@ class SystemRoles(ObjectCollectionABC):
         )
         self._model = SystemRolesModel(**kwargs)
         self.type_ = 'system_roles'
+        self._base_class = SystemRole
 
     def __iter__(self) -> 'SystemRole':
         """Iterate over CM objects."""
@@ -33,6 +33,7 @@ class UserGroups(ObjectCollectionABC):
         )
         self._model = UserGroupsModel(**kwargs)
         self.type_ = 'user_groups'
+        self._base_class = UserGroup
 
     def __iter__(self) -> 'UserGroup':
         """Iterate over CM objects."""
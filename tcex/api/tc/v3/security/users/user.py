@@ -33,6 +33,7 @@ class Users(ObjectCollectionABC):
         )
         self._model = UsersModel(**kwargs)
         self.type_ = 'users'
+        self._base_class = User
 
     def __iter__(self) -> 'User':
         """Iterate over CM objects."""
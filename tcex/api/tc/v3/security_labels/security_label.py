@@ -37,6 +37,7 @@ class SecurityLabels(ObjectCollectionABC):
         )
         self._model = SecurityLabelsModel(**kwargs)
         self.type_ = 'security_labels'
+        self._base_class = SecurityLabel
 
     def __iter__(self) -> 'SecurityLabel':
         """Iterate over CM objects."""
@@ -34,6 +34,7 @@ class Tags(ObjectCollectionABC):
         )
         self._model = TagsModel(**kwargs)
         self.type_ = 'tags'
+        self._base_class = Tag
 
     def __iter__(self) -> 'Tag':
         """Iterate over CM objects."""
@@ -42,6 +42,7 @@ class Tasks(ObjectCollectionABC):
         )
         self._model = TasksModel(**kwargs)
         self.type_ = 'tasks'
+        self._base_class = Task
 
     def __iter__(self) -> 'Task':
         """Iterate over CM objects."""
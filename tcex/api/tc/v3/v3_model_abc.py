@@ -30,9 +30,11 @@ class V3ModelABC(BaseModel, ABC):
     """V3 Base Model"""
 
     _associated_type = PrivateAttr(False)
+    _body_plans = {}  # (class, method, mode, nested, id state, shared type) -> body plan
     _cm_type = PrivateAttr(False)
-    _dict_hash: str = PrivateAttr()
+    _dirty: dict = PrivateAttr(default_factory=dict)  # field name -> value before first change
     _log = logger
+    _nested_sizes: dict = PrivateAttr(default_factory=dict)  # field name -> len(value.data)
     _shared_type = PrivateAttr(False)
     _staged = PrivateAttr(False)
     id: int = None
@@ -47,8 +49,56 @@ class V3ModelABC(BaseModel, ABC):
         if kwargs and hasattr(self, 'id') and self.id is None:  # pylint: disable=no-member
             self._staged = True
 
-        # store initial dict hash of model
-        self._dict_hash = self.gen_model_hash(self.json(sort_keys=True))
+        # store the initial size of nested data arrays (e.g., tags), changes to the fields
+        # are tracked in __setattr__ so the model is not serialized on construction.
+        for name, value in self.__dict__.items():
+            data = getattr(value, 'data', None) if isinstance(value, BaseModel) else None
+            if isinstance(data, list):
+                self._nested_sizes[name] = len(data)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Track the fields changed after construction."""
+        if name in self.__fields__ and name not in self._dirty:
+            self._dirty[name] = self.__dict__.get(name)
+        super().__setattr__(name, value)
+
+    def _body_plan(self, method: str, mode: str, nested: bool) -> dict:
+        """Return the body plan for the current model class.
+
+        The plan maps each field name to its body key, schema property, and whether the field
+        is included when it has a value (None for fields not found in the schema). The inclusion
+        rules only depend on the class, method, mode, nested flag, id, and shared type, so the
+        plan is built once per combination and cached on the class.
+        """
+        # pylint: disable=no-member
+        plan_key = (
+            self.__class__,
+            method,
+            mode,
+            nested,
+            self.id is None,
+            not self.id,
+            self._shared_type,
+        )
+        plan = self._body_plans.get(plan_key)
+        if plan is None:
+            plan = {}
+            schema_properties = self._properties()
+            for name in self.__fields__:
+                property_ = schema_properties.get(name)
+                if property_ is None:
+                    plan[name] = None
+                    continue
+
+                key = property_.get('title')
+                # a field without a value is never included, so the rules are evaluated once
+                # with a value and the value is checked when the body is generated.
+                include = self._calculate_field_inclusion(
+                    key, method, mode, nested, property_, True
+                )
+                plan[name] = (key, property_, include)
+            self._body_plans[plan_key] = plan
+        return plan
 
     def _calculate_field_inclusion(
         self, field: str, method: str, mode: str, nested: bool, property_: dict, value: Any
@@ -336,14 +386,14 @@ class V3ModelABC(BaseModel, ABC):
         but should be added for a PUT on a nested object.
         """
         _body = {}
-        schema_properties = self._properties()
+        plan = self._body_plan(method, mode, nested)
         for name, value in self:
             if exclude_none is True and value is None:
                 continue
 
-            # get the current field from the schema to us in validating method membership.
-            property_ = schema_properties.get(name)
-            if property_ is None:
+            # get the current field from the plan to us in validating method membership.
+            field_plan = plan.get(name)
+            if field_plan is None:
                 # a field not being available does not indicate a failure, it could simple
                 # be the incorrect field was passed to the object, which will be dropped.
                 self._log.warning(
@@ -352,7 +402,7 @@ class V3ModelABC(BaseModel, ABC):
                 )
                 continue
 
-            key = property_.get('title')
+            key, property_, include = field_plan
             if isinstance(value, BaseModel) and property_.get('read_only') is False:
                 # Handle nested models that should be included in the body (non-read-only).
 
@@ -387,7 +437,7 @@ class V3ModelABC(BaseModel, ABC):
                         if _data:
                             _body[key] = _data
 
-            elif self._calculate_field_inclusion(key, method, mode, nested, property_, value):
+            elif include and value:
                 # Handle non-nested fields and their values based on well defined rules.
                 _body[key] = value
 
@@ -415,4 +465,22 @@ class V3ModelABC(BaseModel, ABC):
     @property
     def updated(self):
         """Return True if model values have changed, else False."""
-        return self._dict_hash != self.gen_model_hash(self.json(sort_keys=True))
+        # fields set to a different value
+        for name, value in self._dirty.items():
+            if getattr(self, name) != value:
+                return True
+
+        # nested models updated or nested data arrays with added/removed models
+        for name, value in self.__dict__.items():
+            if isinstance(value, V3ModelABC) and value.updated:  # pylint: disable=no-member
+                return True
+
+            data = getattr(value, 'data', None) if isinstance(value, BaseModel) else None
+            if isinstance(data, V3ModelABC) and data.updated:
+                return True
+            if isinstance(data, list):
+                if len(data) != self._nested_sizes.get(name, 0):
+                    return True
+                if any(isinstance(m, V3ModelABC) and m.updated for m in data):
+                    return True
+        return False
@@ -38,6 +38,7 @@ class VictimAssets(ObjectCollectionABC):
         )
         self._model = VictimAssetsModel(**kwargs)
         self.type_ = 'victim_assets'
+        self._base_class = VictimAsset
 
     def __iter__(self) -> 'VictimAsset':
         """Iterate over CM objects."""
@@ -36,6 +36,7 @@ class VictimAttributes(ObjectCollectionABC):
         )
         self._model = VictimAttributesModel(**kwargs)
         self.type_ = 'victim_attributes'
+        self._base_class = VictimAttribute
 
     def __iter__(self) -> 'VictimAttribute':
         """Iterate over CM objects."""
@@ -45,6 +45,7 @@ class Victims(ObjectCollectionABC):
         )
         self._model = VictimsModel(**kwargs)
         self.type_ = 'victims'
+        self._base_class = Victim
 
     def __iter__(self) -> 'Victim':
         """Iterate over CM objects."""
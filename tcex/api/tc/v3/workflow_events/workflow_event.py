@@ -41,6 +41,7 @@ class WorkflowEvents(ObjectCollectionABC):
         )
         self._model = WorkflowEventsModel(**kwargs)
         self.type_ = 'workflow_events'
+        self._base_class = WorkflowEvent
 
     def __iter__(self) -> 'WorkflowEvent':
         """Iterate over CM objects."""
@@ -36,6 +36,7 @@ class WorkflowTemplates(ObjectCollectionABC):
         )
         self._model = WorkflowTemplatesModel(**kwargs)
         self.type_ = 'workflow_templates'
+        self._base_class = WorkflowTemplate
 
     def __iter__(self) -> 'WorkflowTemplate':
         """Iterate over CM objects."""
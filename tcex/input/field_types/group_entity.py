@@ -6,10 +6,9 @@ from typing import TYPE_CHECKING, Dict, List
 from pydantic import validator
 
 # first-party
-from tcex.api.tc.utils.threat_intel_utils import ThreatIntelUtils
+from tcex.api.tc.utils.entity_type_registry import entity_type_registry
 from tcex.input.field_types.exception import InvalidEmptyValue, InvalidEntityType
 from tcex.input.field_types.tc_entity import TCEntity
-from tcex.pleb.registry import registry
 
 if TYPE_CHECKING:  # pragma: no cover
     # third-party
@@ -29,8 +28,7 @@ class GroupEntity(TCEntity):
         if isinstance(value, str) and value.replace(' ', '') == '':
             raise InvalidEmptyValue(field_name=field.name)
 
-        ti_utils = ThreatIntelUtils(session_tc=registry.session_tc)
-        if value not in ti_utils.group_types:
+        if value not in entity_type_registry.group_types:
             raise InvalidEntityType(field_name=field.name, entity_type='Group', value=value)
         return value
 
@@ -38,6 +36,8 @@ class GroupEntity(TCEntity):
 def group_entity(group_types: List[str] = None) -> type:
     """Return custom model for Group Entity."""
 
+    types_lower = frozenset(i.lower() for i in group_types or [])
+
     class CustomGroupEntity(GroupEntity):
         """Group Entity Field (Model) Type"""
 
@@ -51,7 +51,8 @@ def group_entity(group_types: List[str] = None) -> type:
         @validator('type', allow_reuse=True)
         def is_type(cls, value: str, field: 'ModelField') -> Dict[str, str]:
             """Validate that the entity is of a specific Group type."""
-            if value.lower() not in [i.lower() for i in group_types]:
+            # without group types the model can be created, but no entity is valid
+            if group_types is None or value.lower() not in types_lower:
                 raise InvalidEntityType(
                     field_name=field.name, entity_type=str(group_types), value=value
                 )
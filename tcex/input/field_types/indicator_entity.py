@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, List
 from pydantic import validator
 
 # first-party
-from tcex.api.tc.utils.threat_intel_utils import ThreatIntelUtils
+from tcex.api.tc.utils.entity_type_registry import entity_type_registry
 from tcex.input.field_types.exception import InvalidEmptyValue, InvalidEntityType
 from tcex.input.field_types.tc_entity import TCEntity
 from tcex.pleb.registry import registry
@@ -30,8 +30,7 @@ class IndicatorEntity(TCEntity):
     @validator('type')
     def is_type(cls, value: str, field: 'ModelField') -> str:
         """Validate that the entity is of Indicator type."""
-        ti_utils = ThreatIntelUtils(session_tc=registry.session_tc)
-        if value not in ti_utils.indicator_types:
+        if value not in entity_type_registry.indicator_types(registry.session_tc):
             raise InvalidEntityType(field_name=field.name, entity_type='Indicator', value=value)
         return value
 
@@ -39,6 +38,8 @@ class IndicatorEntity(TCEntity):
 def indicator_entity(indicator_types: List[str] = None) -> type:
     """Return custom model for Indicator Entity."""
 
+    types_lower = frozenset(i.lower() for i in indicator_types or [])
+
     class CustomIndicatorEntity(IndicatorEntity):
         """Indicator Entity Field (Model) Type"""
 
@@ -52,7 +53,8 @@ def indicator_entity(indicator_types: List[str] = None) -> type:
         @validator('type', allow_reuse=True)
         def is_type(cls, value: str, field: 'ModelField') -> str:
             """Validate that the entity is of a specific Indicator type."""
-            if value.lower() not in [i.lower() for i in indicator_types]:
+            # without indicator types the model can be created, but no entity is valid
+            if indicator_types is None or value.lower() not in types_lower:
                 raise InvalidEntityType(
                     field_name=field.name, entity_type=str(indicator_types), value=value
                 )
@@ -1,30 +1,103 @@
 """API Handler Class"""
 # standard library
+import collections
+import gzip
+import json
 import logging
 import threading
 import time
 
 
 class ApiHandler(logging.Handler):
-    """Logger handler for ThreatConnect Exchange API logging."""
-
-    def __init__(self, session, flush_limit=100):
+    """Logger handler for ThreatConnect Exchange API logging.
+
+    Log events are formatted and added to a bounded buffer on the logging thread. A background
+    shipper thread sends the events to the API when flush_limit events are buffered, an ERROR
+    event is logged, or flush_interval seconds have passed, so logging never waits on HTTP. When
+    the buffer is full the oldest events are dropped (counted in dropped).
+    """
+
+    def __init__(
+        self,
+        session,
+        flush_limit=100,
+        flush_interval=5,
+        max_entries=10_000,
+        compress=False,
+        retries=3,
+        backoff_factor=0.5,
+    ):
         """Initialize Class properties.
 
         Args:
             session (Request.Session): The preconfigured instance of Session for ThreatConnect API.
             flush_limit (int): The limit to flush batch logs to the API.
+            flush_interval (int): The max number of seconds between flushes to the API.
+            max_entries (int): The max number of log events to buffer.
+            compress (bool): If True, the log events are gzip compressed. Compression is
+                disabled for the handler if the API rejects a compressed payload.
+            retries (int): The number of retries for a failed post to the API.
+            backoff_factor (float): The backoff factor between retries.
         """
         super().__init__()
         self.session = session
+        self.backoff_factor = backoff_factor
+        self.compress = compress
+        self.flush_interval = flush_interval
         self.flush_limit = flush_limit
-        self._entries = []
+        self.retries = retries
+
+        # properties
+        self._entries = collections.deque(maxlen=max_entries)
         self._entries_lock = threading.Lock()
+        self._flush_event = threading.Event()
+        self._shipper = None
+        self._shipper_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self.dropped = 0
         self.in_token_renewal = False
 
-    def flush(self):
-        """Close the logger and flush entries."""
-        self.log_to_api(self.entries)  # pragma: no cover
+    def _post(self, entries):
+        """Post the log events to the API, returning True on success."""
+        headers = {'Content-Type': 'application/json'}
+        data = json.dumps(entries).encode()
+        if self.compress:
+            headers['Content-Encoding'] = 'gzip'
+            data = gzip.compress(data)
+
+        r = self.session.post('/v2/logs/app', data=data, headers=headers)
+        if self.compress and 400 <= r.status_code < 500 and r.status_code not in (401, 429):
+            # the server does not accept compressed payloads, send uncompressed from now on
+            self.compress = False
+            return self._post(entries)
+        # client errors (other than rate limiting) will not succeed on retry
+        return r.ok or (r.status_code < 500 and r.status_code != 429)
+
+    def _ship(self):
+        """Send the buffered log events to the API until the handler is closed."""
+        while not self._stop_event.is_set():
+            self._flush_event.wait(self.flush_interval)
+            self._flush_event.clear()
+            if not self.in_token_renewal:
+                self.log_to_api(self.entries)
+
+    def _start_shipper(self):
+        """Start the shipper thread on the first log event."""
+        with self._shipper_lock:
+            if self._shipper is None and not self._stop_event.is_set():
+                self._shipper = threading.Thread(
+                    target=self._ship, name='api-log-shipper', daemon=True
+                )
+                self._shipper.start()
+
+    def close(self):
+        """Stop the shipper thread and send the remaining log events."""
+        self._stop_event.set()
+        self._flush_event.set()
+        if self._shipper is not None and self._shipper is not threading.current_thread():
+            self._shipper.join(timeout=self.flush_interval + 5)
+        self.log_to_api(self.entries)
+        super().close()
 
     def emit(self, record):
         """Emit a record.
@@ -32,52 +105,59 @@ class ApiHandler(logging.Handler):
         Args:
             record (obj): The record to be logged.
         """
-        # TODO: [low] switch this after testing
-        # if not threading.current_thread() is threading.main_thread():  # pragma: no cover
-        if threading.current_thread().name != 'MainThread':  # pragma: no cover
+        if threading.current_thread() is self._shipper:
+            # don't ship events logged while shipping (e.g., by the session)
             return
 
-        # queue log events
-        self._entries.append(self.format(record))
+        if self._shipper is None:
+            self._start_shipper()
 
-        # flush queue once limit is hit token module is currently renewing token
-        if (
-            len(self._entries) > self.flush_limit or record.levelname == 'ERROR'
-        ) and not self.in_token_renewal:
-            self.log_to_api(self.entries)
+        # queue log events
+        entry = self.format(record)
+        with self._entries_lock:
+            if len(self._entries) == self._entries.maxlen:
+                self.dropped += 1
+            self._entries.append(entry)
+            count = len(self._entries)
 
-    def handle(self, record):
-        """Override base handle method to add logic that prevents threading deadlocks"""
-        # append log entries from child threads to _entries to avoid deadlocks within handle method.
-        # Otherwise, token monitor thread would try to acquire I/O lock within super().handle
-        # when attempting to log messages (meaning token barrier is enabled in tokens.py).
-        # if the main thread currently has the I/O lock from within super().handle and is trying
-        # to retrieve a token from tokens.py to log to API, then a deadlock occurs because the
-        # main thread is waiting for the barrier to be disabled, and the token thread is waiting
-        # for the I/O lock from super().handle.
-        if threading.current_thread().name != 'MainThread':
-            with self._entries_lock:
-                self._entries.append(record)
-        else:
-            super().handle(record)
+        # flush queue once limit is hit or on error
+        if count >= self.flush_limit or record.levelno >= logging.ERROR:
+            self._flush_event.set()
 
     @property
     def entries(self):
         """Return a copy and clear self._entries."""
         with self._entries_lock:
             entries = list(self._entries)
-            self._entries = []
+            self._entries.clear()
             return entries
 
+    def flush(self):
+        """Send the buffered log events to the API."""
+        if self._shipper is None or self._stop_event.is_set():
+            self.log_to_api(self.entries)
+        else:
+            self._flush_event.set()
+
     def log_to_api(self, entries):
         """Send log events to the ThreatConnect API"""
-        if entries:
+        if not entries:
+            return
+
+        for attempt in range(self.retries + 1):
             try:
-                headers = {'Content-Type': 'application/json'}
-                self.session.post('/v2/logs/app', headers=headers, json=entries)
+                if self._post(entries):
+                    return
             except Exception:  # nosec; pragma: no cover
                 pass
 
+            if attempt < self.retries:
+                # wait on the stop event, so closing the handler isn't delayed by the backoff
+                self._stop_event.wait(self.backoff_factor * (2**attempt))
+
+        with self._entries_lock:
+            self.dropped += len(entries)
+
 
 class ApiHandlerFormatter(logging.Formatter):
     """Logger formatter for ThreatConnect Exchange API logging."""
@@ -102,6 +182,6 @@ class ApiHandlerFormatter(logging.Formatter):
         """
         return {
             'timestamp': int(float(record.created or time.time()) * 1000),
-            'message': record.msg or '',
+            'message': record.getMessage() or '',
             'level': record.levelname or 'DEBUG',
         }
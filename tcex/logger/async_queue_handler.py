@@ -0,0 +1,188 @@
+"""Async Queue Handler Class"""
+# standard library
+import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+# first-party
+from tcex.logger.thread_routing_file_handler import ThreadRoutingFileHandler
+
+
+class AsyncQueueListener(QueueListener):
+    """Logger queue listener that dispatches records to the handlers on a writer thread.
+
+    The ThreadFileHandler, PatternFileHandler and ApiHandler route records using the current
+    thread (name and thread_key attribute). Before dispatching a record the writer thread takes
+    on the name and thread_key attributes of the thread that logged it, so these handlers run
+    behind the queue unchanged.
+    """
+
+    def __init__(self, log_queue: queue.Queue, *handlers: logging.Handler) -> None:
+        """Initialize Class properties.
+
+        Args:
+            log_queue: The queue of log records.
+            handlers: The handlers to dispatch the records to.
+        """
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+
+    def enqueue_sentinel(self) -> None:
+        """Put the stop sentinel on the queue, waiting for space when the queue is full."""
+        self.queue.put(self._sentinel)
+
+    @property
+    def thread_keys(self) -> set:
+        """Return the thread attributes used by the handlers to route records."""
+        thread_keys = set()
+        for h in self.handlers:
+            if getattr(h, 'thread_key', None):
+                thread_keys.add(h.thread_key)
+            thread_keys.update(getattr(h, 'thread_keys', ()))
+        return thread_keys
+
+    def handle(self, record: logging.LogRecord) -> None:
+        """Dispatch the record to the handlers in the context of the logging thread.
+
+        Args:
+            record: The record to be logged.
+        """
+        thread = threading.current_thread()
+        name = thread.name
+        context = getattr(record, 'thread_context', {})
+        try:
+            thread.name = record.threadName or name
+            for key, value in context.items():
+                setattr(thread, key, value)
+            super().handle(record)
+        finally:
+            thread.name = name
+            for key in context:
+                delattr(thread, key)
+
+
+class AsyncQueueHandler(QueueHandler):
+    """Logger handler for non-blocking logging.
+
+    Records are put on a bounded queue and written by the handlers of the listener on a
+    dedicated writer thread, so logging on the calling thread is a single enqueue. The level
+    of the handler is the lowest level of the handlers of the listener, so records no handler
+    would write are never prepared or queued. When the queue is full the overflow policy is
+    applied:
+
+    * block - wait for space on the queue (no records are lost).
+    * drop-debug - drop DEBUG and TRACE records, wait for space for all other records.
+    * sample - keep one of every sample_rate INFO and lower records, wait for space for those
+      and all other records.
+
+    Args:
+        queue_size: The maximum number of records on the queue.
+        overflow: The overflow policy (block, drop-debug, or sample).
+        sample_rate: The sample rate for the sample overflow policy.
+    """
+
+    overflow_policies = ['block', 'drop-debug', 'sample']
+
+    def __init__(
+        self,
+        queue_size: Optional[int] = 10_000,
+        overflow: Optional[str] = 'block',
+        sample_rate: Optional[int] = 10,
+    ):
+        """Initialize Class properties."""
+        if overflow not in self.overflow_policies:
+            raise ValueError(
+                f'Invalid overflow policy ({overflow}), must be one of {self.overflow_policies}.'
+            )
+        super().__init__(queue.Queue(maxsize=queue_size))
+        self.overflow = overflow
+        self.sample_rate = max(1, sample_rate)
+
+        # properties
+        self._lock = threading.Lock()
+        self._overflow_count = 0
+        self.dropped = 0
+        self.listener = AsyncQueueListener(self.queue)
+
+    def _drop(self, record: logging.LogRecord) -> bool:
+        """Return True if the record should be dropped for the overflow policy."""
+        if self.overflow == 'drop-debug':
+            return record.levelno <= logging.DEBUG
+
+        if self.overflow == 'sample' and record.levelno <= logging.INFO:
+            with self._lock:
+                self._overflow_count += 1
+                return self._overflow_count % self.sample_rate != 0
+
+        return False
+
+    def close(self) -> None:
+        """Write all queued records and stop the writer thread."""
+        self.stop()
+        super().close()
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Put the record on the queue applying the overflow policy when the queue is full.
+
+        Args:
+            record: The record to be logged.
+        """
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if self._drop(record):
+                with self._lock:
+                    self.dropped += 1
+                return
+            self.queue.put(record)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Prepare the record to be processed on the writer thread.
+
+        The message is merged with the args, so that args modified after the log call don't
+        change the message, and the routing attributes of the logging thread are captured.
+
+        Args:
+            record: The record to be logged.
+        """
+        record.msg = record.getMessage()
+        record.args = None
+        thread = threading.current_thread()
+        record.thread_context = {
+            key: getattr(thread, key) for key in self.listener.thread_keys if hasattr(thread, key)
+        }
+        return record
+
+    def set_handlers(self, handlers: list) -> None:
+        """Set the handlers the writer thread dispatches records to.
+
+        Args:
+            handlers: The handlers to dispatch the records to.
+        """
+        # the listener iterates the handlers on the writer thread, so replace (not mutate) them
+        self.listener.handlers = tuple(handlers)
+        self.update_level()
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        if self.listener._thread is None:  # pylint: disable=protected-access
+            self.listener.start()
+            self.listener._thread.name = 'tcex-log-writer'  # pylint: disable=protected-access
+
+    def update_level(self) -> None:
+        """Set the level to the lowest level of the handlers of the listener.
+
+        This method must be called when the level of one of the handlers changes.
+        """
+        levels = []
+        for h in self.listener.handlers:
+            level = h.route_level if isinstance(h, ThreadRoutingFileHandler) else h.level
+            if level is not None:
+                levels.append(level)
+        self.setLevel(min(levels) if levels else logging.NOTSET)
+
+    def stop(self) -> None:
+        """Write all queued records and stop the writer thread."""
+        if self.listener._thread is not None:  # pylint: disable=protected-access
+            self.listener.stop()
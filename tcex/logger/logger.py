@@ -5,16 +5,19 @@ import os
 import pathlib
 import platform
 import sys
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 # first-party
 # pylint: disable=no-name-in-module
 from tcex.app_config.install_json import InstallJson
 from tcex.logger.api_handler import ApiHandler, ApiHandlerFormatter
+from tcex.logger.async_queue_handler import AsyncQueueHandler
 from tcex.logger.cache_handler import CacheHandler
 from tcex.logger.pattern_file_handler import PatternFileHandler
 from tcex.logger.rotating_file_handler_custom import RotatingFileHandlerCustom
+from tcex.logger.sensitive_filter import SensitiveFilter
 from tcex.logger.thread_file_handler import ThreadFileHandler
+from tcex.logger.thread_routing_file_handler import ThreadRoutingFileHandler
 from tcex.logger.trace_logger import TraceLogger
 
 if TYPE_CHECKING:
@@ -33,6 +36,59 @@ class Logger:
         # properties
         self.ij = InstallJson()
 
+    def _add_handler(self, handler: logging.Handler) -> None:
+        """Add a handler to the logger (or the async writer thread when enabled)."""
+        async_handler = self._async_handler
+        if async_handler is None:
+            self._logger.addHandler(handler)
+        else:
+            async_handler.set_handlers(self._handlers + [handler])
+        SensitiveFilter.handlers_changed()
+
+    @property
+    def _async_handler(self) -> Optional[AsyncQueueHandler]:
+        """Return the async queue handler if async logging is enabled."""
+        for h in self._logger.handlers:
+            if isinstance(h, AsyncQueueHandler):
+                return h
+        return None
+
+    def _update_async_level(self) -> None:
+        """Update the level of the async queue handler after a handler level changed."""
+        async_handler = self._async_handler
+        if async_handler is not None:
+            async_handler.update_level()
+        SensitiveFilter.handlers_changed()
+
+    @property
+    def _handlers(self) -> List[logging.Handler]:
+        """Return the handlers that write the log events."""
+        async_handler = self._async_handler
+        if async_handler is None:
+            return list(self._logger.handlers)
+        return list(async_handler.listener.handlers)
+
+    def _remove_handler(self, handler: logging.Handler) -> None:
+        """Remove a handler from the logger (or the async writer thread when enabled)."""
+        async_handler = self._async_handler
+        if async_handler is None:
+            self._logger.removeHandler(handler)
+        else:
+            async_handler.set_handlers([h for h in self._handlers if h is not handler])
+        SensitiveFilter.handlers_changed()
+
+    @property
+    def _thread_file_router(self) -> ThreadRoutingFileHandler:
+        """Return the thread routing file handler, adding it on first use."""
+        for h in self._handlers:
+            if isinstance(h, ThreadRoutingFileHandler):
+                return h
+
+        router = ThreadRoutingFileHandler()
+        router.set_name('thread-file-router')
+        self._add_handler(router)
+        return router
+
     @property
     def _logger(self) -> logging.Logger:
         """Return the logger. The inputs.model property is not available in init."""
@@ -59,6 +115,52 @@ class Logger:
         )
         return logging.Formatter(tx_format)
 
+    def disable_async(self) -> None:
+        """Disable async logging, writing all queued events and restoring the handlers."""
+        async_handler = self._async_handler
+        if async_handler is None:
+            return
+
+        async_handler.stop()
+        handlers = self._handlers
+        self._logger.removeHandler(async_handler)
+        async_handler.close()
+        for h in handlers:
+            self._logger.addHandler(h)
+        SensitiveFilter.handlers_changed()
+
+    def enable_async(
+        self,
+        queue_size: Optional[int] = 10_000,
+        overflow: Optional[str] = 'block',
+        sample_rate: Optional[int] = 10,
+    ) -> None:
+        """Enable async logging.
+
+        This mode is intended for service Apps where the logging thread is the thread serving
+        the request. Log events are put on a bounded queue and the current (and any later
+        added) handlers write them on a dedicated writer thread.
+
+        Args:
+            queue_size: The maximum number of log events on the queue.
+            overflow: The policy when the queue is full (block, drop-debug, or sample).
+            sample_rate: The rate debug/info events are kept with the sample overflow policy.
+        """
+        if self._async_handler is not None:
+            return
+
+        async_handler = AsyncQueueHandler(
+            queue_size=queue_size, overflow=overflow, sample_rate=sample_rate
+        )
+        async_handler.set_name('async')
+        handlers = self._handlers
+        async_handler.set_handlers(handlers)
+        async_handler.start()
+        for h in handlers:
+            self._logger.removeHandler(h)
+        self._logger.addHandler(async_handler)
+        SensitiveFilter.handlers_changed()
+
     def handler_exist(self, handler_name: str) -> bool:
         """Remove a file handler by name.
 
@@ -68,9 +170,11 @@ class Logger:
         Returns:
             bool: True if handler current exists
         """
-        for h in self._logger.handlers:
+        for h in self._handlers:
             if h.get_name() == handler_name:
                 return True
+            if isinstance(h, ThreadRoutingFileHandler) and h.has_route(handler_name):
+                return True
         return False
 
     @property
@@ -97,17 +201,21 @@ class Logger:
         Args:
             handler_name: The handler name to remove.
         """
-        for h in self._logger.handlers:
+        for h in self._handlers:
             if h.get_name() == handler_name:
-                self._logger.removeHandler(h)
+                self._remove_handler(h)
+                break
+            if isinstance(h, ThreadRoutingFileHandler) and h.has_route(handler_name):
+                h.remove_route(handler_name)
+                self._update_async_level()
                 break
 
     def replay_cached_events(self, handler_name: Optional[str] = 'cache') -> None:
         """Replay cached log events and remove handler."""
-        for h in self._logger.handlers:
+        for h in self._handlers:
             if h.get_name() == handler_name:
                 events = h.events
-                self._logger.removeHandler(h)
+                self._remove_handler(h)
                 for event in events:
                     self._logger.handle(event)
                 break
@@ -121,8 +229,10 @@ class Logger:
         Args:
             handler_name (str): The handler name to remove.
         """
+        self.disable_async()
         for h in self._logger.handlers:
             self._logger.removeHandler(h)
+        SensitiveFilter.handlers_changed()
 
     def update_handler_level(self, level: str) -> None:
         """Update all handlers log level.
@@ -133,8 +243,9 @@ class Logger:
         level = self.log_level(level)
 
         # update all handler logging levels
-        for h in self._logger.handlers:
+        for h in self._handlers:
             h.setLevel(level)
+        self._update_async_level()
 
     #
     # handlers
@@ -155,7 +266,7 @@ class Logger:
         api.set_name(name)
         api.setLevel(self.log_level(level))
         api.setFormatter(ApiHandlerFormatter())
-        self._logger.addHandler(api)
+        self._add_handler(api)
 
     def add_cache_handler(self, name: str) -> None:
         """Add cache logging handler.
@@ -170,7 +281,7 @@ class Logger:
         # be only those that happen before args are processed
         cache.setLevel(self.log_level('trace'))
         cache.setFormatter(self._formatter)
-        self._logger.addHandler(cache)
+        self._add_handler(cache)
 
     def add_pattern_file_handler(
         self,
@@ -212,7 +323,7 @@ class Logger:
         # add keys for halder emit method conditional
         fh.handler_key = handler_key
         fh.thread_key = thread_key
-        self._logger.addHandler(fh)
+        self._add_handler(fh)
 
     def add_rotating_file_handler(
         self,
@@ -247,7 +358,7 @@ class Logger:
         fh.set_name(name)
         fh.setFormatter(formatter)
         fh.setLevel(self.log_level(level))
-        self._logger.addHandler(fh)
+        self._add_handler(fh)
 
     def add_stream_handler(
         self,
@@ -269,7 +380,7 @@ class Logger:
         sh.set_name(name)
         sh.setFormatter(formatter)
         sh.setLevel(self.log_level(level))
-        self._logger.addHandler(sh)
+        self._add_handler(sh)
 
     def add_thread_file_handler(
         self,
@@ -313,7 +424,9 @@ class Logger:
         # add keys for halder emit method conditional
         fh.handler_key = handler_key
         fh.thread_key = thread_key
-        self._logger.addHandler(fh)
+        # a single routing handler dispatches each event to the file of the current thread
+        self._thread_file_router.add_route(name, fh)
+        self._update_async_level()
 
     #
     # App info logging
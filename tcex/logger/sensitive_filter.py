@@ -1,24 +1,171 @@
 """TcEx logging filter module"""
 # standard library
 import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterable, Optional
 
 
 class SensitiveFilter(logging.Filter):
-    """Sensitive Log Filter"""
+    """Sensitive Log Filter
 
-    def __init__(self, name=''):
+    The registered sensitive values are compiled into a single pattern that masks all values
+    in one pass over the message. The pattern is recompiled on the next filtered record after
+    values are added or evicted. Values registered with an expiration (e.g., API tokens) are
+    evicted expire_grace seconds after they expire. An evicted value that is added again
+    without an expiration (e.g., wrapped in Sensitive again) keeps its original expiration.
+
+    The lowest handler level for each logger is cached, handlers_changed() must be called
+    when a handler is added or removed, or the level of a handler changes.
+
+    Args:
+        name: The name of the filter.
+        expire_grace: The number of seconds an expired value is still masked.
+        max_evicted: The max number of evicted values to keep the expiration of.
+    """
+
+    # incremented when the handlers change, invalidating the cached handler levels
+    _handlers_version = 0
+
+    def __init__(
+        self,
+        name: Optional[str] = '',
+        expire_grace: Optional[int] = 3_600,
+        max_evicted: Optional[int] = 10_000,
+    ):
         """Plug in a new filter to an existing formatter"""
         super().__init__(name)
-        self._sensitive_registry = set()
+        self.expire_grace = expire_grace
+        self.max_evicted = max_evicted
+
+        # properties
+        self._evicted = OrderedDict()  # evicted value -> expiration
+        self._handler_levels = (None, {})  # (handlers version, logger name -> level)
+        self._lock = threading.Lock()
+        self._next_eviction = None
+        self._pattern = None
+        self._pattern_stale = False
+        self._sensitive_registry = {}  # value -> expiration (None for values that don't expire)
+
+    def _compile(self) -> None:
+        """Compile the registered values into a single pattern."""
+        with self._lock:
+            if not self._pattern_stale:
+                return
+
+            # longer values first, so a value containing another value is masked as a whole
+            values = sorted(self._sensitive_registry, key=len, reverse=True)
+            self._pattern = re.compile('|'.join(map(re.escape, values))) if values else None
+            self._pattern_stale = False
+
+    def _evict(self, now: float) -> None:
+        """Evict the values that expired more than expire_grace seconds ago."""
+        with self._lock:
+            for value, expires in list(self._sensitive_registry.items()):
+                if expires is not None and expires + self.expire_grace <= now:
+                    del self._sensitive_registry[value]
+                    self._pattern_stale = True
+
+                    # keep the expiration in case the value is added again
+                    self._evicted[value] = expires
+                    self._evicted.move_to_end(value)
+                    while len(self._evicted) > self.max_evicted:
+                        self._evicted.popitem(last=False)
+            self._update_next_eviction()
+
+    def _handler_level(self, record: logging.LogRecord) -> int:
+        """Return the lowest level of the handlers the record would be written by."""
+        version = SensitiveFilter._handlers_version
+        cache = self._handler_levels
+        if cache[0] != version:
+            # a level computed with the previous handlers is stored in the discarded dict
+            cache = self._handler_levels = (version, {})
+
+        level = cache[1].get(record.name)
+        if level is None:
+            level = cache[1][record.name] = self._logger_handler_level(record.name)
+        return level
 
-    def add(self, value: str) -> None:
-        """Add sensitive value to registry."""
+    @staticmethod
+    def _logger_handler_level(name: str) -> int:
+        """Return the lowest level of the handlers of the logger and its parents."""
+
+        def _min_level(handlers: Iterable[logging.Handler]) -> Optional[int]:
+            levels = []
+            for h in handlers:
+                # handlers that dispatch to other handlers (e.g., the async queue handler)
+                nested = getattr(getattr(h, 'listener', None), 'handlers', None)
+                if nested is None:
+                    levels.append(h.level)
+                else:
+                    nested_level = _min_level(nested)
+                    if nested_level is not None:
+                        levels.append(max(h.level, nested_level))
+            return min(levels) if levels else None
+
+        logger = logging.root.manager.loggerDict.get(name)
+        levels = []
+        while isinstance(logger, logging.Logger):
+            level = _min_level(logger.handlers)
+            if level is not None:
+                levels.append(level)
+            logger = logger.parent if logger.propagate else None
+        return min(levels) if levels else logging.lastResort.level
+
+    def _update_next_eviction(self) -> None:
+        """Update the time of the next eviction (the lock must be held)."""
+        expirations = [e for e in self._sensitive_registry.values() if e is not None]
+        self._next_eviction = min(expirations) + self.expire_grace if expirations else None
+
+    def add(self, value: str, expires: Optional[int] = None) -> None:
+        """Add sensitive value to registry.
+
+        Args:
+            value: The sensitive value.
+            expires: The expiration timestamp of the value, the value is evicted expire_grace
+                seconds after this time. Defaults to the expiration of an evicted value.
+        """
         if value:
             # don't add empty string
-            self._sensitive_registry.add(str(value))
+            value = str(value)
+            with self._lock:
+                evicted_expires = self._evicted.pop(value, None)
+                if expires is None:
+                    expires = evicted_expires
+
+                if value not in self._sensitive_registry:
+                    self._sensitive_registry[value] = expires
+                    self._pattern_stale = True
+                elif expires is not None:
+                    self._sensitive_registry[value] = expires
+                self._update_next_eviction()
+
+    def expire(self, value: str, expires: Optional[int] = None) -> None:
+        """Set the expiration of a registered sensitive value.
+
+        Args:
+            value: The sensitive value.
+            expires: The expiration timestamp of the value, defaults to now.
+        """
+        value = str(value)
+        with self._lock:
+            if value in self._sensitive_registry:
+                self._sensitive_registry[value] = expires or int(time.time())
+                self._update_next_eviction()
+
+    @classmethod
+    def handlers_changed(cls) -> None:
+        """Refresh the cached handler levels after the handlers or their levels changed."""
+        cls._handlers_version += 1
 
     def filter(self, record: logging.LogRecord) -> bool:
         """Filter the record"""
+        if record.levelno < self._handler_level(record):
+            # the record will not be written by any handler
+            return True
+
         # have to sniff the msg and args values of the LogRecord
         record.msg = self.replace(record.getMessage())
         record.args = {}
@@ -26,6 +173,14 @@ class SensitiveFilter(logging.Filter):
 
     def replace(self, obj: str):
         """Replace any sensitive data in the object if its a string"""
-        for replacement in self._sensitive_registry:
-            obj = obj.replace(replacement, '***')
+        if self._next_eviction is not None:
+            now = time.time()
+            if now >= self._next_eviction:
+                self._evict(now)
+        if self._pattern_stale:
+            self._compile()
+
+        pattern = self._pattern
+        if pattern is not None:
+            obj = pattern.sub('***', obj)
         return obj
@@ -0,0 +1,154 @@
+"""Thread Routing File Handler Class"""
+# standard library
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+# first-party
+from tcex.logger.thread_file_handler import ThreadFileHandler
+
+_missing = object()
+
+
+class ThreadRoutingFileHandler(logging.Handler):
+    """Logger handler for ThreatConnect Exchange per thread File logging.
+
+    A single handler that routes each record to the file handler registered for the thread_key
+    attribute of the current thread (e.g., trigger_id), instead of offering the record to one
+    ThreadFileHandler per trigger. At most max_open_files log files are kept open, the least
+    recently used file is closed when the limit is reached and reopened (in append mode) on the
+    next write.
+
+    Args:
+        max_open_files: The maximum number of log files to keep open.
+    """
+
+    def __init__(self, max_open_files: Optional[int] = 128):
+        """Initialize Class properties."""
+        super().__init__()
+        self.max_open_files = max(1, max_open_files)
+
+        # properties
+        self._open_files = OrderedDict()  # name -> handler (LRU order)
+        self._routes: Dict[tuple, List[str]] = {}  # (thread_key, handler_key) -> names
+        self._routes_lock = threading.Lock()
+        self.handlers: Dict[str, ThreadFileHandler] = {}  # name -> handler
+        self.thread_keys = ()
+
+    def _close_file(self, handler: ThreadFileHandler) -> None:
+        """Close the log file of the handler, it will be reopened on the next write."""
+        handler.acquire()
+        try:
+            if handler.stream is not None:
+                handler.stream.close()
+                handler.stream = None
+        finally:
+            handler.release()
+
+    def _use_file(self, name: str, handler: ThreadFileHandler) -> None:
+        """Mark the log file as most recently used, closing the least recently used files."""
+        with self._routes_lock:
+            self._open_files[name] = handler
+            self._open_files.move_to_end(name)
+            evict = []
+            while len(self._open_files) > self.max_open_files:
+                evict.append(self._open_files.popitem(last=False)[1])
+
+        for h in evict:
+            self._close_file(h)
+
+    def add_route(self, name: str, handler: ThreadFileHandler) -> None:
+        """Add a file handler for the handler_key/thread_key of the handler.
+
+        Args:
+            name: The name of the route.
+            handler: The file handler.
+        """
+        self.remove_route(name)
+        with self._routes_lock:
+            self.handlers[name] = handler
+            self._routes.setdefault((handler.thread_key, handler.handler_key), []).append(name)
+            self.thread_keys = tuple({k for k, _ in self._routes})
+
+        if handler.stream is not None:
+            # the file is already open (not delayed), reopening after eviction must append
+            handler.mode = 'a'
+            self._use_file(name, handler)
+
+    def close(self) -> None:
+        """Close all file handlers."""
+        for name in list(self.handlers):
+            self.remove_route(name)
+        super().close()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Emit a record to the file of the current thread.
+
+        Args:
+            record: The record to be logged.
+        """
+        thread = threading.current_thread()
+        for thread_key in self.thread_keys:
+            handler_key = getattr(thread, thread_key, _missing)
+            if handler_key is _missing:
+                continue
+
+            for name in self._routes.get((thread_key, handler_key), ()):
+                handler = self.handlers.get(name)
+                if handler is None or record.levelno < handler.level:
+                    continue
+
+                self._use_file(name, handler)
+                handler.handle(record)
+                # the first write may truncate the file, reopening after eviction must append
+                handler.mode = 'a'
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        """Filter and emit the record.
+
+        The file handlers lock each file, so no handler wide lock is acquired.
+        """
+        rv = self.filter(record)
+        if rv:
+            self.emit(record)
+        return rv
+
+    def has_route(self, name: str) -> bool:
+        """Return True if a route exists for the name."""
+        return name in self.handlers
+
+    def remove_route(self, name: str) -> None:
+        """Remove the route and close its log file.
+
+        Args:
+            name: The name of the route.
+        """
+        with self._routes_lock:
+            handler = self.handlers.pop(name, None)
+            if handler is None:
+                return
+
+            self._open_files.pop(name, None)
+            route_key = (handler.thread_key, handler.handler_key)
+            names = [n for n in self._routes.get(route_key, []) if n != name]
+            if names:
+                self._routes[route_key] = names
+            else:
+                self._routes.pop(route_key, None)
+            self.thread_keys = tuple({k for k, _ in self._routes})
+        handler.close()
+
+    @property
+    def route_level(self) -> Optional[int]:
+        """Return the lowest level of the file handlers, None if there are no routes."""
+        levels = [handler.level for handler in list(self.handlers.values())]
+        return min(levels) if levels else None
+
+    def setLevel(self, level: int) -> None:
+        """Set the level of all file handlers.
+
+        The routing handler itself doesn't filter on level, each file handler has its own level.
+        """
+        for handler in list(self.handlers.values()):
+            handler.setLevel(level)
@@ -1,7 +1,7 @@
 """Trace Logger Class"""
 # standard library
 import logging
-from inspect import getframeinfo, stack
+import sys
 
 # Create trace logging level
 logging.TRACE = logging.DEBUG - 5
@@ -23,16 +23,16 @@ class TraceLogger(logging.Logger):
         Returns:
             tuple: The caller stack information.
         """
-        caller = None
+        # walk the frames directly, inspect.stack() reads the source lines for every frame
+        # frame 0 is this method, 1 is Logger._log, 2 is the Logger method (e.g., debug, log)
         depth = 3
-        while True:
+        frame = sys._getframe(depth)  # pylint: disable=protected-access
+        while frame.f_code.co_name == 'trace' and depth < 6 and frame.f_back is not None:
             # search for the correct calling method
-            caller = getframeinfo(stack()[depth][0])
-            if caller.function != 'trace' or depth >= 6:
-                break
+            frame = frame.f_back
             depth += 1
 
-        return (caller.filename, caller.lineno, caller.function, None)
+        return (frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name, None)
 
     def trace(self, msg, *args, **kwargs):
         """Set trace logging level
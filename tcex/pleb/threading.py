@@ -2,6 +2,7 @@
 # standard library
 import logging
 import threading
+from typing import Any, Callable
 
 logger = logging.getLogger('tcex')
 
@@ -23,3 +24,48 @@ class ExceptionThread(threading.Thread):
             logger.exception(f'Unexpected exception occurred in thread with name: {self.name}')
             # let exception logic continue as normal
             raise ex
+
+
+class ThreadContext:
+    """The context (name, session_id, and trigger_id) of the thread that created the instance.
+
+    Service Apps resolve the token (Tokens.key) and the log routing of a request from the name
+    and trigger_id of the current thread. Work run on behalf of a thread in a worker thread
+    (e.g., a thread pool) is run in the context of that thread, so the same token is used.
+    """
+
+    __slots__ = ['attributes', 'name']
+
+    # the thread attributes set by the service message threads
+    _attribute_names = ('session_id', 'trigger_id')
+
+    def __init__(self) -> None:
+        """Initialize Class Properties."""
+        thread = threading.current_thread()
+        self.attributes = {
+            name: getattr(thread, name) for name in self._attribute_names if hasattr(thread, name)
+        }
+        self.name = thread.name
+
+    def apply(self) -> None:
+        """Apply the context to the current thread."""
+        thread = threading.current_thread()
+        thread.name = self.name
+        for name in self._attribute_names:
+            if name in self.attributes:
+                setattr(thread, name, self.attributes[name])
+            elif hasattr(thread, name):
+                delattr(thread, name)
+
+    def run(self, target: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run the target in the context, restoring the context of the current thread after.
+
+        Args:
+            target: The method to run.
+        """
+        previous = ThreadContext()
+        self.apply()
+        try:
+            return target(*args, **kwargs)
+        finally:
+            previous.apply()
@@ -0,0 +1,141 @@
+"""ThreatConnect asyncio HTTPX Session for external requests"""
+# standard library
+import asyncio
+from typing import Callable, Dict, Optional, Union
+
+# third-party
+import httpx
+
+# first-party
+from tcex.sessions.async_session import AsyncSession
+from tcex.sessions.external_session import default_too_many_requests_handler
+
+
+class AsyncExternalSession(AsyncSession):
+    """ThreatConnect asyncio HTTPX Session for external requests
+
+    The asyncio equivalent of ExternalSession, e.g.:
+
+    async with tcex.get_session_external_async() as session:
+        responses = await asyncio.gather(*[session.get(url) for url in urls])
+
+    Args:
+        base_url: The base URL for all requests.
+        proxies: The proxy settings.
+        verify: The SSL verification setting.
+        max_connections: The max number of connections to keep open.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        proxies: Optional[Dict[str, str]] = None,
+        verify: Optional[Union[bool, str]] = True,
+        max_connections: Optional[int] = 100,
+        **kwargs,
+    ):
+        """Initialize the Class properties."""
+        super().__init__(
+            base_url=base_url,
+            max_connections=max_connections,
+            proxies=proxies,
+            verify=verify,
+            **kwargs,
+        )
+
+        # properties
+        self._mask_body = False
+        self._mask_headers = True
+        self._mask_patterns = None
+        self._too_many_requests_handler = None
+
+    @property
+    def mask_body(self) -> bool:
+        """Return property"""
+        return self._mask_body
+
+    @mask_body.setter
+    def mask_body(self, mask_bool: bool):
+        """Set property"""
+        self._mask_body = mask_bool
+
+    @property
+    def mask_headers(self) -> bool:
+        """Return property"""
+        return self._mask_headers
+
+    @mask_headers.setter
+    def mask_headers(self, mask_bool: bool):
+        """Set property"""
+        self._mask_headers = mask_bool
+
+    @property
+    def mask_patterns(self) -> list:
+        """Return property"""
+        return self._mask_patterns
+
+    @mask_patterns.setter
+    def mask_patterns(self, patterns: list):
+        """Set property"""
+        self._mask_patterns = patterns
+
+    @property
+    def too_many_requests_handler(self) -> Callable[[httpx.Response], float]:
+        """Get the too_many_requests_handler.
+
+        The too_many_requests_handler is responsible for determining how long to sleep (in seconds)
+        on a 429 response.  The default returns the value in the `Retry-After` header.
+        """
+        if not self._too_many_requests_handler:
+            self._too_many_requests_handler = default_too_many_requests_handler
+        return self._too_many_requests_handler
+
+    @too_many_requests_handler.setter
+    def too_many_requests_handler(
+        self, too_many_requests_handler: Callable[[httpx.Response], float]
+    ):
+        """Set the too_many_requests_handler.
+
+        Args:
+            too_many_requests_handler: callable that returns the number of seconds to wait on a
+                429 response.
+        """
+        self._too_many_requests_handler = too_many_requests_handler
+
+    async def request(  # pylint: disable=arguments-differ
+        self, method: str, url: str, **kwargs
+    ) -> httpx.Response:
+        """Send the request, waiting and retrying once on a 429 response.
+
+        Args:
+            method: The HTTP method
+            url: The URL or path for the request.
+
+        Returns:
+            The HTTPX Response object.
+        """
+        # this kwargs value is used to signal 429 handling that this is a retry
+        tc_is_retry = kwargs.pop('tc_is_retry', False)
+
+        response = await self._request(method, url, **kwargs)
+
+        if response.status_code == 429 and not tc_is_retry:
+            # only the task that received the 429 waits, other requests continue on the loop
+            await asyncio.sleep(self.too_many_requests_handler(response))
+            return await self.request(method, url, tc_is_retry=True, **kwargs)
+
+        # APP-79 - adding logging of request as curl commands
+        if response.is_error or self.log_curl:
+            self._curl(
+                response,
+                mask_body=self.mask_body,
+                mask_headers=self.mask_headers,
+                mask_patterns=self.mask_patterns,
+            )
+
+        self.log.debug(
+            f'feature=external-session-async, request-url={response.url}, '
+            f'status_code={response.status_code}, elapsed={response.elapsed}'
+        )
+
+        return response
@@ -0,0 +1,100 @@
+"""ThreatConnect asyncio HTTPX Session"""
+# standard library
+import logging
+from typing import TYPE_CHECKING, Dict, Optional, Union
+
+# third-party
+import httpx
+
+# first-party
+from tcex.sessions.async_session import AsyncSession
+
+if TYPE_CHECKING:
+    # first-party
+    from tcex.sessions.auth.hmac_auth import HmacAuth
+    from tcex.sessions.auth.tc_auth import TcAuth
+    from tcex.sessions.auth.token_auth import TokenAuth
+
+
+class AsyncTcSession(AsyncSession):
+    """ThreatConnect REST API asyncio HTTPX Session
+
+    The asyncio equivalent of TcSession, e.g.:
+
+    async with tcex.get_session_tc_async() as session:
+        responses = await asyncio.gather(*[session.get(url) for url in urls])
+    """
+
+    def __init__(
+        self,
+        auth: Union['HmacAuth', 'TokenAuth', 'TcAuth'],
+        base_url: str = None,
+        log_curl: Optional[bool] = False,
+        proxies: Optional[Dict[str, str]] = None,
+        proxies_enabled: Optional[bool] = False,
+        user_agent: Optional[dict] = None,
+        verify: Optional[Union[bool, str]] = True,
+        max_connections: Optional[int] = 100,
+    ):
+        """Initialize the Class properties.
+
+        Args:
+            auth: The auth for the ThreatConnect API.
+            base_url: The base URL of the ThreatConnect API.
+            log_curl: If True, the curl command of each request is logged.
+            proxies: The proxy settings.
+            proxies_enabled: If True, the proxy settings are used.
+            user_agent: The User-Agent header.
+            verify: The SSL verification setting.
+            max_connections: The max number of connections to keep open.
+        """
+        super().__init__(
+            auth=auth,
+            base_url=base_url.strip('/'),
+            headers=user_agent,
+            log_curl=log_curl,
+            max_connections=max_connections,
+            proxies=proxies if proxies_enabled else None,
+            verify=verify,
+        )
+
+    def _log_curl(self, response: httpx.Response) -> None:
+        """Log the curl equivalent command."""
+
+        # don't show curl message for logging commands
+        if self.log.isEnabledFor(logging.DEBUG) and '/v2/logs/app' not in str(response.url):
+
+            # APP-79 - adding logging of request as curl commands
+            if response.is_error or self.log_curl:
+                self._curl(response)
+
+    async def request(  # pylint: disable=arguments-differ
+        self, method: str, url: str, **kwargs
+    ) -> httpx.Response:
+        """Send the request, retrying once on a token renewal race condition."""
+        response = await self._request(method, url, **kwargs)
+
+        # retry request in case we encountered a race condition with token renewal monitor
+        if response.status_code == 401:
+            self.log.debug(
+                'Unexpected response received while attempting to send a request using internal '
+                'session object. Retrying request. feature=tc-session-async, '
+                'request-url=%s, status-code=%s',
+                response.url,
+                response.status_code,
+            )
+            response = await self._request(method, url, **kwargs)
+
+        # optionally log the curl command
+        self._log_curl(response)
+
+        # log request and response data
+        self.log.debug(
+            'feature=tc-session-async, method=%s, request-url=%s, status-code=%s, elapsed=%s',
+            method,
+            response.url,
+            response.status_code,
+            response.elapsed,
+        )
+
+        return response
@@ -15,7 +15,11 @@ if TYPE_CHECKING:  # pragma: no cover
 
 
 class HmacAuth(auth.AuthBase):
-    """ThreatConnect HMAC Authorization"""
+    """ThreatConnect HMAC Authorization
+
+    The HMAC object is keyed with the secret key once and copied for each request, and the
+    timestamp string is cached for the current second.
+    """
 
     def __init__(self, tc_api_access_id: str, tc_api_secret_key: 'Sensitive') -> None:
         """Initialize the Class properties."""
@@ -24,22 +28,46 @@ class HmacAuth(auth.AuthBase):
         self.tc_api_access_id = tc_api_access_id
         self.tc_api_secret_key = tc_api_secret_key
 
+        # properties
+        self._hmac = (None, None)  # (secret key, HMAC object keyed with the secret key)
+        self._timestamp = (None, None)  # (timestamp, timestamp string)
+
     def _hmac_header(self, r: 'request', timestamp: 'time.time'):
         """Return HMAC Authorization header value."""
         # define the signature using "full" path, HTTP method, and current timestamp
         signature = f'{r.path_url}:{r.method}:{timestamp}'
 
-        # generate the sha256 signature using the tc secret key, encoded signature
-        hmac_signature = hmac.new(
-            self.tc_api_secret_key.value.encode(), signature.encode(), digestmod=sha256
-        ).digest()
+        # generate the sha256 signature using a copy of the keyed HMAC, encoded signature
+        hmac_ = self._keyed_hmac.copy()
+        hmac_.update(signature.encode())
+        hmac_signature = hmac_.digest()
 
         # return the header value with access_id and b64 signature value
         return f'TC {self.tc_api_access_id}:{b64encode(hmac_signature).decode()}'
 
+    @property
+    def _keyed_hmac(self) -> hmac.HMAC:
+        """Return the HMAC object keyed with the current secret key."""
+        secret_key, hmac_ = self._hmac
+        if secret_key is not self.tc_api_secret_key:
+            # deriving the key is only required on the first request or when the key is changed
+            secret_key = self.tc_api_secret_key
+            hmac_ = hmac.new(secret_key.value.encode(), digestmod=sha256)
+            self._hmac = (secret_key, hmac_)
+        return hmac_
+
+    def _timestamp_str(self) -> str:
+        """Return the current timestamp string (cached for the current second)."""
+        now = int(time.time())
+        timestamp, timestamp_str = self._timestamp
+        if timestamp != now:
+            timestamp_str = str(now)
+            self._timestamp = (now, timestamp_str)
+        return timestamp_str
+
     def __call__(self, r: 'request') -> request:
         """Add the authorization headers to the request."""
-        timestamp = int(time.time())
+        timestamp = self._timestamp_str()
 
         # Add required headers to auth.
         r.headers['Authorization'] = self._hmac_header(r, timestamp)
@@ -1,6 +1,5 @@
 """ThreatConnect Requests Session"""
 # standard library
-import time
 from typing import TYPE_CHECKING, Callable, Optional, Union
 
 # first-party
@@ -29,7 +28,7 @@ class TcAuth(HmacAuth, TokenAuth):
 
     def __call__(self, r):
         """Add the authorization headers to the request."""
-        timestamp = int(time.time())
+        timestamp = self._timestamp_str()
         if self.tc_api_access_id is not None and self.tc_api_secret_key is not None:
             r.headers['Authorization'] = self._hmac_header(r, timestamp)
         elif self.tc_token is not None:
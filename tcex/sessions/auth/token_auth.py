@@ -19,6 +19,9 @@ class TokenAuth(auth.AuthBase):
         auth.AuthBase.__init__(self)
         self.tc_token = tc_token
 
+        # properties
+        self._token_header_cache = (None, None)  # (token, header)
+
     def _token_header(self):
         """Return HMAC Authorization header value."""
         _token = None
@@ -36,8 +39,12 @@ class TokenAuth(auth.AuthBase):
             # String - A string type was passed. Likely no support for renewal.
             _token = self.tc_token
 
-        # Return formatted token
-        return f'TC-Token {_token}'
+        # Return formatted token, the header is cached until the token is rotated
+        token, header = self._token_header_cache
+        if _token is not token and _token != token:
+            header = f'TC-Token {_token}'
+            self._token_header_cache = (_token, header)
+        return header
 
     def __call__(self, r: request) -> request:
         """Add the authorization headers to the request."""
@@ -83,19 +83,25 @@ class CustomAdapter(adapters.HTTPAdapter):
             self.rate_limit_handler.pre_send(request)
 
         try:
-            response = super().send(request, stream, timeout, verify, cert, proxies)
-        except exceptions.RetryError:
-            # store current retries configuration
-            max_retries = self.max_retries
-
-            # temporarily disable retries and make one last request
-            self.max_retries = Retry(0, read=False)
-
-            # make request with max_retries turned off
-            response = super().send(request, stream, timeout, verify, cert, proxies)
-
-            # reset retries configuration
-            self.max_retries = max_retries
+            try:
+                response = super().send(request, stream, timeout, verify, cert, proxies)
+            except exceptions.RetryError:
+                # store current retries configuration
+                max_retries = self.max_retries
+
+                # temporarily disable retries and make one last request
+                self.max_retries = Retry(0, read=False)
+
+                try:
+                    # make request with max_retries turned off
+                    response = super().send(request, stream, timeout, verify, cert, proxies)
+                finally:
+                    # reset retries configuration
+                    self.max_retries = max_retries
+        except Exception:
+            if self.rate_limit_handler:
+                self.rate_limit_handler.send_error(request)
+            raise
 
         if self.rate_limit_handler:
             self.rate_limit_handler.post_send(response)
@@ -2,9 +2,10 @@
 
 See https://tools.ietf.org/id/draft-polli-ratelimit-headers-00.html for implementation details.
 """
+
 # standard library
 import time
-from typing import Optional
+from typing import Optional, Union
 
 # third-party
 from requests import PreparedRequest, Response
@@ -13,6 +14,36 @@ from requests import PreparedRequest, Response
 from tcex.utils import Utils
 
 
+def seconds_until(value: Union[float, int, str]) -> float:
+    """Return the number of seconds until the provided reset/retry value.
+
+    The value can be a delta in seconds, an epoch timestamp, or a date (e.g., an IMF-fixdate).
+
+    Args:
+        value: The header value.
+
+    Returns:
+        The number of seconds to wait, never negative.
+    """
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        number = None
+
+    if number is not None:
+        # a numeric value is an epoch timestamp or, when not in the future, a delta in seconds.
+        # large values are never a delta (e.g., a timestamp in the past due to clock skew).
+        seconds = number - time.time()
+        if seconds < 0 and number < 10**9:
+            seconds = number
+    else:
+        try:
+            seconds = Utils().any_to_datetime(value).timestamp() - time.time()
+        except RuntimeError:
+            seconds = 0
+    return max(float(seconds), 0.0)
+
+
 class RateLimitHandler:
     """Rate-limiting implementation using X-RateLimit-<X> headers."""
 
@@ -96,6 +127,13 @@ class RateLimitHandler:
             )
             self._last_limit_reset_value = response.headers.get(self.limit_reset_header)
 
+    def send_error(self, request: PreparedRequest) -> None:
+        """Call when the request could not be sent or no response was received.
+
+        Args:
+            request: The request that failed.
+        """
+
     def pre_send(self, request: PreparedRequest) -> None:
         """Call before request is sent and provides an opportunity to pause for rate limiting.
 
@@ -120,11 +158,4 @@ class RateLimitHandler:
         Args:
             request:  The request that will be sent.
         """
-        utils = Utils()
-        wait_until = self.last_limit_reset_value
-        try:
-            seconds = utils.any_to_datetime(wait_until).timestamp() - time.time()
-        except RuntimeError:
-            seconds = wait_until
-
-        time.sleep(float(seconds))
+        time.sleep(seconds_until(self.last_limit_reset_value))
@@ -1,11 +1,14 @@
 """ThreatConnect Requests Session"""
 # standard library
 import logging
+import threading
 from typing import TYPE_CHECKING, Dict, Optional, Union
 
 # third-party
 import urllib3
 from requests import Session, adapters
+from urllib3 import PoolManager
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
 from urllib3.util.retry import Retry
 
 # first-party
@@ -27,6 +30,128 @@ logger = logging.getLogger('tcex')
 # disable ssl warning message
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# the default max number of connections per host, sized for the concurrency of service Apps and
+# threaded Apps (e.g., batch file uploads and the TC session of each thread) sharing one pool.
+# connections are only opened when required, so a larger pool doesn't cost idle connections.
+DEFAULT_POOL_MAXSIZE = 100
+
+
+class TcAdapter(adapters.HTTPAdapter):
+    """HTTP Adapter for the ThreatConnect API that tracks connection reuse.
+
+    The connection pool of an adapter can be shared by multiple sessions (e.g., the TC session of
+    each thread, token renewal, and the API log handler) using share(), so connections are reused
+    across the sessions instead of each session opening (and TLS handshaking) its own.
+
+    Args:
+        pool_connections: The number of connection pools (one per host) to cache.
+        pool_maxsize: The max number of connections to keep open per host. This should be at
+            least the number of threads sending requests concurrently, otherwise connections
+            over the limit are discarded ("Connection pool is full") after each request. The
+            default is DEFAULT_POOL_MAXSIZE (100).
+        pool_block: If True, requests wait for a free connection when pool_maxsize connections
+            are in use, otherwise a new connection is opened and discarded after the request.
+        max_retries: The retry configuration for requests.
+        poolmanager: The pool manager of another adapter to share, instead of creating one.
+    """
+
+    def __init__(
+        self,
+        pool_connections: Optional[int] = adapters.DEFAULT_POOLSIZE,
+        pool_maxsize: Optional[int] = DEFAULT_POOL_MAXSIZE,
+        pool_block: Optional[bool] = adapters.DEFAULT_POOLBLOCK,
+        max_retries: Optional[Union[int, Retry]] = adapters.DEFAULT_RETRIES,
+        poolmanager: Optional[PoolManager] = None,
+    ):
+        """Initialize the Class properties."""
+        self._metrics = {'connections': 0, 'requests': 0, 'tls_handshakes': 0}
+        self._metrics_lock = threading.Lock()
+        self._shared_poolmanager = poolmanager
+        super().__init__(pool_connections, pool_maxsize, max_retries, pool_block)
+
+    def _count(self, *names: str) -> None:
+        """Increment the provided metrics."""
+        with self._metrics_lock:
+            for name in names:
+                self._metrics[name] += 1
+
+    @property
+    def _pool_classes(self) -> dict:
+        """Return the connection pool classes that count new connections."""
+        count = self._count
+
+        class _HTTPConnectionPool(HTTPConnectionPool):
+            def _new_conn(self):
+                count('connections')
+                return super()._new_conn()
+
+        class _HTTPSConnectionPool(HTTPSConnectionPool):
+            def _new_conn(self):
+                # every new HTTPS connection requires a TLS handshake
+                count('connections', 'tls_handshakes')
+                return super()._new_conn()
+
+        return {'http': _HTTPConnectionPool, 'https': _HTTPSConnectionPool}
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        """Initialize the pool manager using the counting connection pools."""
+        shared_poolmanager = getattr(self, '_shared_poolmanager', None)
+        if shared_poolmanager is not None:
+            # the pool manager (and its counting connection pools) of another adapter is used
+            self.poolmanager = shared_poolmanager
+            return
+
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = self._pool_classes
+
+    @property
+    def metrics(self) -> dict:
+        """Return the connection metrics of the pool.
+
+        * connections: The number of connections opened.
+        * requests: The number of requests sent.
+        * reuse_ratio: The ratio of requests sent using an already open connection.
+        * tls_handshakes: The number of HTTPS connections opened (each requires a TLS handshake).
+        """
+        with self._metrics_lock:
+            metrics = dict(self._metrics)
+
+        reuse_ratio = 0.0
+        if metrics['requests']:
+            reuse_ratio = max(0.0, 1 - metrics['connections'] / metrics['requests'])
+        metrics['reuse_ratio'] = round(reuse_ratio, 4)
+        return metrics
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        """Return the proxy manager using the counting connection pools."""
+        manager = super().proxy_manager_for(proxy, **proxy_kwargs)
+        if not proxy.lower().startswith('socks'):
+            manager.pool_classes_by_scheme = self._pool_classes
+        return manager
+
+    def send(self, request, *args, **kwargs):  # pylint: disable=arguments-differ
+        """Send the request, counting the requests sent."""
+        self._count('requests')
+        return super().send(request, *args, **kwargs)
+
+    def share(self, max_retries: Optional[Union[int, Retry]] = 0) -> 'TcAdapter':
+        """Return an adapter that shares this connection pool and its metrics.
+
+        Args:
+            max_retries: The retry configuration of the returned adapter.
+        """
+        adapter = TcAdapter(
+            self._pool_connections,
+            self._pool_maxsize,
+            self._pool_block,
+            max_retries,
+            poolmanager=self.poolmanager,
+        )
+        adapter.proxy_manager = self.proxy_manager
+        adapter._metrics = self._metrics
+        adapter._metrics_lock = self._metrics_lock
+        return adapter
+
 
 class TcSession(Session):
     """ThreatConnect REST API Requests Session"""
@@ -40,9 +165,22 @@ class TcSession(Session):
         proxies_enabled: Optional[bool] = False,
         user_agent: Optional[dict] = None,
         verify: Optional[Union[bool, str]] = True,
+        adapter: Optional[TcAdapter] = None,
     ):
-        """Initialize the Class properties."""
+        """Initialize the Class properties.
+
+        Args:
+            auth: The auth for the ThreatConnect API.
+            base_url: The base URL of the ThreatConnect API.
+            log_curl: If True, the curl command of each request is logged.
+            proxies: The proxy settings.
+            proxies_enabled: If True, the proxy settings are used.
+            user_agent: The User-Agent header.
+            verify: The SSL verification setting.
+            adapter: The adapter whose connection pool is shared with other sessions.
+        """
         super().__init__()
+        self.adapter = adapter or TcAdapter()
         self.base_url = base_url.strip('/')
         self.log = logger
         self.log_curl = log_curl
@@ -72,7 +210,7 @@ class TcSession(Session):
         """Log the curl equivalent command."""
 
         # don't show curl message for logging commands
-        if '/v2/logs/app' not in response.request.url:
+        if self.log.isEnabledFor(logging.DEBUG) and '/v2/logs/app' not in response.request.url:
 
             # APP-79 - adding logging of request as curl commands
             if not response.ok or self.log_curl:
@@ -85,6 +223,11 @@ class TcSession(Session):
                 except Exception:  # nosec
                     pass  # logging curl command is best effort
 
+    @property
+    def metrics(self) -> dict:
+        """Return the connection metrics of the (shared) connection pool."""
+        return self.adapter.metrics
+
     def request(self, method, url, **kwargs):  # pylint: disable=arguments-differ
         """Override request method disabling verify on token renewal if disabled on session."""
         response = super().request(method, self.url(url), **kwargs)
@@ -92,9 +235,11 @@ class TcSession(Session):
         # retry request in case we encountered a race condition with token renewal monitor
         if response.status_code == 401:
             self.log.debug(
-                f'Unexpected response received while attempting to send a request using internal '
-                f'session object. Retrying request. feature=tc-session, '
-                f'request-url={response.request.url}, status-code={response.status_code}'
+                'Unexpected response received while attempting to send a request using internal '
+                'session object. Retrying request. feature=tc-session, '
+                'request-url=%s, status-code=%s',
+                response.request.url,
+                response.status_code,
             )
             response = super().request(method, self.url(url), **kwargs)
 
@@ -103,8 +248,11 @@ class TcSession(Session):
 
         # log request and response data
         self.log.debug(
-            f'feature=tc-session, method={method}, request-url={response.request.url}, '
-            f'status-code={response.status_code}, elapsed={response.elapsed}'
+            'feature=tc-session, method=%s, request-url=%s, status-code=%s, elapsed=%s',
+            method,
+            response.request.url,
+            response.status_code,
+            response.elapsed,
         )
 
         return response
@@ -121,8 +269,8 @@ class TcSession(Session):
             backoff_factor=backoff_factor,
             status_forcelist=status_forcelist,
         )
-        # mount all https requests
-        self.mount('https://', adapters.HTTPAdapter(max_retries=retries))
+        # mount all https requests, using the shared connection pool
+        self.mount('https://', self.adapter.share(max_retries=retries))
 
     def url(self, url: str) -> str:
         """Return appropriate URL string.
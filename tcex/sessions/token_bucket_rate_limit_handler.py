@@ -0,0 +1,253 @@
+"""The TokenBucketRateLimitHandler implements proactive, thread-safe request throttling.
+
+Requests are spaced by a token bucket per host that is calibrated from the X-RateLimit-<X>
+and Retry-After response headers, so that concurrent threads share the upstream limit instead
+of each reacting to it after the fact.
+"""
+# standard library
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+# third-party
+from requests import PreparedRequest, Response
+
+# first-party
+from tcex.sessions.rate_limit_handler import RateLimitHandler, seconds_until
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Callers wait on a condition until a token is available, re-checking whenever the bucket is
+    calibrated or paused, so waiting threads are released one token at a time instead of all at
+    once when a pause or window ends.
+    """
+
+    def __init__(self, rate: Optional[float] = None, capacity: Optional[float] = None):
+        """Initialize the Class properties.
+
+        Args:
+            rate: The number of tokens added per second, None to only honor pauses.
+            capacity: The maximum number of tokens (burst size), defaults to the rate.
+        """
+        self._condition = threading.Condition()
+        self.capacity = max(capacity or rate or 1, 1)
+        self.rate = rate
+        self.tokens = float(self.capacity)
+        # the time the tokens value applies to, in the future while the bucket is paused
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        """Add the tokens accumulated since the last update."""
+        if now > self.updated:
+            if self.rate:
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+    def acquire(self, tokens: int = 1) -> float:
+        """Wait until the requested tokens are available.
+
+        Args:
+            tokens: The number of tokens to take.
+
+        Returns:
+            The number of seconds waited.
+        """
+        start = time.monotonic()
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+
+                if now < self.updated:
+                    # the bucket is paused
+                    wait = self.updated - now
+                elif not self.rate:
+                    return now - start
+                elif self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return now - start
+                else:
+                    wait = (tokens - self.tokens) / self.rate
+                self._condition.wait(wait)
+
+    def calibrate(
+        self, remaining: float, reset: float, limit: Optional[float] = None, in_flight: int = 0
+    ):
+        """Calibrate the bucket from the upstream rate limit state.
+
+        Args:
+            remaining: The number of requests remaining in the current window.
+            reset: The number of seconds until the current window resets.
+            limit: The number of requests allowed per window.
+            in_flight: The number of requests sent that are not accounted for in remaining.
+        """
+        with self._condition:
+            now = time.monotonic()
+            self._refill(now)
+
+            available = remaining - in_flight
+            if available <= 0:
+                self._pause(now, reset)
+            else:
+                # spread the available requests evenly over the rest of the window, tokens only
+                # accumulate (up to the limit) while no requests are being sent
+                if reset > 0:
+                    self.rate = available / reset
+                self.capacity = max(limit or self.capacity, 1)
+                self.tokens = min(self.tokens, 0.0)
+            self._condition.notify_all()
+
+    def _pause(self, now: float, seconds: float):
+        """Pause the bucket, must be called with the lock held."""
+        self.tokens = min(self.tokens, 0.0)
+        self.updated = max(self.updated, now + seconds)
+
+    def pause(self, seconds: float):
+        """Don't release any tokens for the provided number of seconds.
+
+        Args:
+            seconds: The number of seconds to pause.
+        """
+        with self._condition:
+            now = time.monotonic()
+            self._refill(now)
+            self._pause(now, seconds)
+            self._condition.notify_all()
+
+
+class TokenBucketRateLimitHandler(RateLimitHandler):
+    """Proactive rate-limiting implementation using a token bucket per host.
+
+    A single instance can be shared by multiple threads and ExternalSession instances.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        capacity: Optional[float] = None,
+        per_host: Optional[bool] = True,
+        limit_header: Optional[str] = 'X-RateLimit-Limit',
+        limit_remaining_header: Optional[str] = 'X-RateLimit-Remaining',
+        limit_reset_header: Optional[str] = 'X-RateLimit-Reset',
+        remaining_threshold: Optional[int] = 0,
+        retry_after_header: Optional[str] = 'Retry-After',
+    ):
+        """Proactive rate-limiting implementation using a token bucket per host.
+
+        Requests take a token from the bucket for their host before being sent.  The bucket
+        starts at the provided rate (or unlimited) and is calibrated from every response, using
+        X-RateLimit-Remaining less the remaining_threshold and the requests still in flight, and
+        X-RateLimit-Reset to spread the remaining requests evenly over the rest of the window.
+        A Retry-After header pauses the bucket, so other threads stop sending until the upstream
+        server is ready.
+
+        Args:
+            rate: The initial number of requests per second, None until calibrated.
+            capacity: The maximum burst of requests, defaults to the rate.
+            per_host: If True, each host has its own bucket, otherwise one bucket is shared.
+            limit_header: Name of the header that has the limit value.
+            limit_remaining_header: Name of the header that has the limit remaining value.
+            limit_reset_header: Name of the header that contains the limit reset value.
+            remaining_threshold: Number of remaining requests to keep in reserve.
+            retry_after_header: Name of the header that contains the retry after value.
+        """
+        super().__init__(limit_remaining_header, limit_reset_header, remaining_threshold)
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._capacity = capacity
+        self._in_flight: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._rate = rate
+        self.limit_header = limit_header
+        self.per_host = per_host
+        self.retry_after_header = retry_after_header
+
+    def _key(self, url: Optional[str]) -> str:
+        """Return the bucket key for the provided URL."""
+        if self.per_host and url:
+            return urlsplit(url).netloc
+        return ''
+
+    def acquire(self, url: Optional[str] = None) -> float:
+        """Wait until a request to the provided URL is allowed.
+
+        Args:
+            url: The URL of the request, None for the default bucket.
+
+        Returns:
+            The number of seconds waited.
+        """
+        return self.bucket(url).acquire()
+
+    def bucket(self, url: Optional[str] = None) -> TokenBucket:
+        """Return the bucket for the provided URL, creating it when required.
+
+        Args:
+            url: The URL of the request, None for the default bucket.
+        """
+        key = self._key(url)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(self._rate, self._capacity)
+            return bucket
+
+    def post_send(self, response: Response) -> None:
+        """Calibrate the bucket for the host from the response headers.
+
+        Args:
+            response: The response from the request.  Should almost-never be modified.
+        """
+        url = response.request.url if response.request is not None else response.url
+        key = self._key(url)
+        with self._lock:
+            in_flight = self._in_flight[key] = max(self._in_flight.get(key, 0) - 1, 0)
+
+        headers = response.headers
+        bucket = self.bucket(url)
+        if self.retry_after_header in headers and response.status_code in (429, 503):
+            bucket.pause(seconds_until(headers.get(self.retry_after_header)))
+
+        if self.limit_remaining_header in headers and self.limit_reset_header in headers:
+            try:
+                remaining = int(headers.get(self.limit_remaining_header))
+            except (TypeError, ValueError):
+                return
+
+            try:
+                # the limit can contain a quota policy (e.g., "100, 100;w=60")
+                limit = int(str(headers.get(self.limit_header)).split(',', maxsplit=1)[0])
+            except ValueError:
+                limit = 0
+
+            self._last_limit_remaining_value = remaining
+            self._last_limit_reset_value = headers.get(self.limit_reset_header)
+            bucket.calibrate(
+                remaining=remaining - self.remaining_threshold,
+                reset=seconds_until(self._last_limit_reset_value),
+                limit=max(limit - self.remaining_threshold, 0) or None,
+                in_flight=in_flight,
+            )
+
+    def send_error(self, request: PreparedRequest) -> None:
+        """Release the in-flight request for the host when no response was received.
+
+        Args:
+            request: The request that failed.
+        """
+        key = self._key(request.url)
+        with self._lock:
+            self._in_flight[key] = max(self._in_flight.get(key, 0) - 1, 0)
+
+    def pre_send(self, request: PreparedRequest) -> None:
+        """Wait for a token from the bucket for the host before the request is sent.
+
+        Args:
+            request: The request to be sent.  Should not be modified in any way.
+        """
+        key = self._key(request.url)
+        self.bucket(request.url).acquire()
+        with self._lock:
+            self._in_flight[key] = self._in_flight.get(key, 0) + 1
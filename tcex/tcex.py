@@ -33,13 +33,15 @@ from tcex.services.common_service_trigger import CommonServiceTrigger
 from tcex.services.webhook_trigger_service import WebhookTriggerService
 from tcex.sessions.auth.tc_auth import TcAuth
 from tcex.sessions.external_session import ExternalSession
-from tcex.sessions.tc_session import TcSession
+from tcex.sessions.tc_session import TcAdapter, TcSession
 from tcex.tokens import Tokens
 from tcex.utils import Utils
 from tcex.utils.file_operations import FileOperations
 
 if TYPE_CHECKING:
     # first-party
+    from tcex.sessions.async_external_session import AsyncExternalSession
+    from tcex.sessions.async_tc_session import AsyncTcSession
     from tcex.sessions.auth.hmac_auth import HmacAuth
     from tcex.sessions.auth.token_auth import TokenAuth
 
@@ -220,6 +222,7 @@ class TcEx:
         proxies: Optional[Dict[str, str]] = None,  # pylint: disable=redefined-outer-name
         proxies_enabled: Optional[bool] = False,
         verify: Optional[Union[bool, str]] = True,
+        adapter: Optional[TcAdapter] = None,
     ) -> TcSession:
         """Return an instance of Requests Session configured for the ThreatConnect API.
 
@@ -227,6 +230,9 @@ class TcEx:
 
         This method allows for getting a new instance of TC Session instance. This can be
         very useful when connecting between multiple TC instances (e.g., migrating data).
+
+        Unless an adapter is provided, the session uses the shared connection pool of the
+        session_tc_adapter property.
         """
         auth = auth or TcAuth(
             tc_api_access_id=self.inputs.model_unresolved.tc_api_access_id,
@@ -242,6 +248,41 @@ class TcEx:
             proxies_enabled=proxies_enabled or self.inputs.model_unresolved.tc_proxy_tc,
             user_agent=self._user_agent,
             verify=verify or self.inputs.model_unresolved.tc_verify,
+            adapter=adapter or self.session_tc_adapter,
+        )
+
+    def get_session_tc_async(
+        self,
+        auth: Optional[Union['HmacAuth', 'TokenAuth', 'TcAuth']] = None,
+        base_url: Optional[str] = None,
+        log_curl: Optional[bool] = False,
+        proxies: Optional[Dict[str, str]] = None,  # pylint: disable=redefined-outer-name
+        proxies_enabled: Optional[bool] = False,
+        verify: Optional[Union[bool, str]] = True,
+        max_connections: Optional[int] = 100,
+    ) -> 'AsyncTcSession':
+        """Return an instance of asyncio HTTPX Session configured for the ThreatConnect API.
+
+        The asyncio equivalent of get_session_tc, requires the httpx package (tcex[async]).
+        """
+        # first-party
+        from tcex.sessions.async_tc_session import AsyncTcSession
+
+        auth = auth or TcAuth(
+            tc_api_access_id=self.inputs.model_unresolved.tc_api_access_id,
+            tc_api_secret_key=self.inputs.model_unresolved.tc_api_secret_key,
+            tc_token=self.token,
+        )
+
+        return AsyncTcSession(
+            auth=auth,
+            base_url=base_url or self.inputs.model_unresolved.tc_api_path,
+            log_curl=log_curl or self.inputs.model_unresolved.tc_log_curl,
+            proxies=proxies or self.proxies,
+            proxies_enabled=proxies_enabled or self.inputs.model_unresolved.tc_proxy_tc,
+            user_agent=self._user_agent,
+            verify=verify or self.inputs.model_unresolved.tc_verify,
+            max_connections=max_connections,
         )
 
     def get_session_external(self) -> ExternalSession:
@@ -264,6 +305,31 @@ class TcEx:
 
         return _session_external
 
+    def get_session_external_async(
+        self, max_connections: Optional[int] = 100
+    ) -> 'AsyncExternalSession':
+        """Return an instance of asyncio HTTPX Session for external requests.
+
+        The asyncio equivalent of get_session_external, requires the httpx package (tcex[async]).
+        """
+        # first-party
+        from tcex.sessions.async_external_session import AsyncExternalSession
+
+        _proxies = None
+        if self.inputs.model_unresolved.tc_proxy_external:
+            _proxies = self.proxies
+            self.log.info(
+                f'Using proxy host {self.inputs.model_unresolved.tc_proxy_host}:'
+                f'{self.inputs.model_unresolved.tc_proxy_port} for external session.'
+            )
+
+        return AsyncExternalSession(
+            headers=self._user_agent,
+            log_curl=self.inputs.model_unresolved.tc_log_curl,
+            max_connections=max_connections,
+            proxies=_proxies,
+        )
+
     # def get_ti(self) -> ThreatIntelligence:
     #     """Include the Threat Intel Module."""
     #     return ThreatIntelligence(session=self.get_session_tc())
@@ -441,6 +507,18 @@ class TcEx:
         """Return an instance of Requests Session configured for the ThreatConnect API."""
         return self.get_session_tc()
 
+    @cached_property
+    def session_tc_adapter(self) -> TcAdapter:
+        """Return the adapter with the connection pool shared by the ThreatConnect API sessions.
+
+        The TC session of each thread, token renewal, and the API log handler share this pool,
+        which keeps up to 100 connections per host open. To change the pool sizing or blocking
+        behavior (e.g., an App with more concurrent threads) set this property before the first
+        session is created, e.g. tcex.session_tc_adapter = TcAdapter(pool_maxsize=200).
+        The connection reuse metrics are available with tcex.session_tc_adapter.metrics.
+        """
+        return TcAdapter()
+
     @scoped_property
     def session_external(self) -> 'ExternalSession':
         """Return an instance of Requests Session configured for the ThreatConnect API."""
@@ -458,6 +536,7 @@ class TcEx:
             self.inputs.model_unresolved.tc_api_path,
             self.inputs.model_unresolved.tc_verify,
             _proxies,
+            self.session_tc_adapter,
         )
 
         # register token for Apps that pass token on start
@@ -1,10 +1,12 @@
 """TcEx Framework Service module"""
 # standard library
+import heapq
+import itertools
 import logging
 import os
 import threading
 import time
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 # third-party
 from requests import Session, exceptions
@@ -12,18 +14,24 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 # first-party
-from tcex.input.field_types.sensitive import Sensitive
+from tcex.input.field_types.sensitive import Sensitive, filter_sensitive
 from tcex.pleb.threading import ExceptionThread
 from tcex.utils import Utils
 
+if TYPE_CHECKING:
+    # first-party
+    from tcex.sessions.tc_session import TcAdapter
+
 # get tcex logger
 logger = logging.getLogger('tcex')
 
 
-def retry_session(retries=3, backoff_factor=0.8, status_forcelist=(500, 502, 504)):
+def retry_session(retries=3, backoff_factor=0.8, status_forcelist=(500, 502, 504), adapter=None):
     """Add retry to Requests Session.
 
     https://urllib3.readthedocs.io/en/latest/reference/urllib3.util.html#urllib3.util.retry.Retry
+
+    If an adapter (TcAdapter) is provided, the session uses its connection pool.
     """
     session = Session()
     retries = Retry(
@@ -34,18 +42,30 @@ def retry_session(retries=3, backoff_factor=0.8, status_forcelist=(500, 502, 504
         status_forcelist=status_forcelist,
     )
     # mount all https requests
-    session.mount('https://', HTTPAdapter(max_retries=retries))
+    if adapter is not None:
+        session.mount('https://', adapter.share(max_retries=retries))
+    else:
+        session.mount('https://', HTTPAdapter(max_retries=retries))
     return session
 
 
 class Tokens:
-    """Service methods for customer Service (e.g., Triggers)."""
+    """Service methods for customer Service (e.g., Triggers).
+
+    Tokens are renewed by a monitor thread, token_window seconds before they expire. Renewals are
+    scheduled per token using a heap keyed by the renewal time, so the monitor only wakes up
+    when a token is due. A renewed token is not renewed again for at least sleep_interval
+    seconds, even if its lifetime is shorter than token_window. The token map is replaced
+    (copy-on-write) on every change, so reading a token doesn't require a lock. Reading a token
+    only blocks while that specific token is being renewed and it has already expired.
+    """
 
     def __init__(
         self,
         token_url: Optional[str],
         verify: Optional[bool] = True,
         proxies: Optional[dict] = None,
+        adapter: Optional['TcAdapter'] = None,
     ):
         """Initialize the Class properties.
 
@@ -53,6 +73,7 @@ class Tokens:
             token_url: The ThreatConnect URL for token renewal.
             verify: A boolean to enable/disable SSL verification.
             proxies: A dictionary of proxy settings.
+            adapter: The adapter whose connection pool is used for token renewal.
         """
         self.token_url = token_url
         self.verify = verify
@@ -62,37 +83,169 @@ class Tokens:
             raise ValueError('A value for token_url is required.')
 
         # properties
-        #
-        # Threading event that is used as a barrier that determines whether a token can be retrieved
-        # from this module or not (via the token property). The barrier only blocks access to the
-        # token property whenever token renewal is taking place in order to keep from returning
-        # stale tokens.
-        self._barrier = threading.Event()
-        # Setting barrier event to True disables barrier, which makes the token property
-        # accessible (default behavior)
-        self._barrier.set()
-
-        # threading event that denotes whether renewal monitor should sleep after a renewal cycle
-        self._monitor_sleep_interval = threading.Event()
+        self._lock = threading.Lock()
+        # key -> threading event for the tokens being renewed, the event is set once renewed
+        self._renewing = {}
+        # heap of (renewal time, sequence, key, token_expires) for the registered tokens
+        self._schedule = []
+        self._schedule_condition = threading.Condition(self._lock)
+        self._schedule_sequence = itertools.count()
 
         self.log = logger
         self.monitor_thread = None
         # session with retry for token renewal
-        self.session: Session = retry_session()
+        self.session: Session = retry_session(adapter=adapter)
         self.session.proxies = proxies  # add proxies to session
+        # the max number of seconds the renewal monitor sleeps between checking the schedule
         self.sleep_interval = int(os.getenv('TC_TOKEN_SLEEP_INTERVAL', '150'))
         self._shutdown = False  # shutdown boolean
         # token map for storing keys -> tokens -> threads
         self.token_map = {}
-        # amount of time to wait before starting renewal process (after enabling barrier)
-        # buffer allows any other threads using a token to possibly finish their work
-        self.token_renewal_buffer_time = 5
+        # the max number of seconds to wait for an expired token to be renewed
+        self.token_renewal_timeout = 30
         self.token_window = 600  # seconds to pad before token renewal
         self.utils = Utils
 
         # start token renewal process
         self.token_renewal()
 
+    def _next_renewal(self) -> Optional[str]:
+        """Wait for the next token that is due for renewal and return its key.
+
+        Returns None when the monitor is shutdown.
+        """
+        with self._schedule_condition:
+            while self.shutdown is False:
+                timeout = self.sleep_interval
+                if self._schedule:
+                    renew_at, _, key, expires = self._schedule[0]
+                    if self.token_map.get(key, {}).get('token_expires') != expires:
+                        # the token was unregistered or has a new expiration
+                        heapq.heappop(self._schedule)
+                        continue
+
+                    # calculate the time left to sleep
+                    sleep_seconds = renew_at - int(time.time())
+                    self.log.trace(
+                        f'feature=token, event=token-status, key={key}, '
+                        f'expires={expires}, sleep-seconds={sleep_seconds}'
+                    )
+                    if sleep_seconds <= 0:
+                        heapq.heappop(self._schedule)
+                        return key
+                    timeout = min(timeout, sleep_seconds)
+
+                self._schedule_condition.wait(timeout)
+        return None
+
+    def _renew(self, key: str) -> None:
+        """Renew the token for the provided key."""
+        token_data = self.token_map.get(key)
+        if token_data is None:  # pragma: no cover
+            return
+
+        with self._lock:
+            # a reader of the expired token may have already requested the renewal
+            renewal = self._renewing.setdefault(key, threading.Event())
+        try:
+            api_token_data = self.renew_token(token_data.get('token'))
+            # a token with a lifetime shorter than token_window would be due again immediately
+            self._update_token(
+                key,
+                min_delay=self.sleep_interval,
+                token=Sensitive(api_token_data['apiToken']),
+                token_expires=int(api_token_data['apiTokenExpires']),
+            )
+            filter_sensitive.add(api_token_data['apiToken'], int(api_token_data['apiTokenExpires']))
+            self.log.info(
+                f'''feature=token, action=token-renewed, key={key}, '''
+                f'''token={api_token_data['apiToken']}, '''
+                f'''expires={api_token_data['apiTokenExpires']}'''
+            )
+        except RuntimeError as e:
+            self.log.error(e)
+            if self._remove_token(key) is not None:
+                self.log.error(f'feature=token, event=token-removal-failure, key={key}')
+        finally:
+            self._renewed(key, renewal)
+
+    def _renewed(self, key: str, renewal: Optional[threading.Event] = None) -> None:
+        """Release the readers waiting on the renewal of the token for the provided key.
+
+        Args:
+            key: The key of the token.
+            renewal: The renewal event to release, defaults to the current renewal event.
+        """
+        with self._lock:
+            if renewal is None or self._renewing.get(key) is renewal:
+                renewal = self._renewing.pop(key, renewal)
+        if renewal is not None:
+            renewal.set()
+
+    def _remove_token(self, key: str) -> Optional[dict]:
+        """Remove the token data for the provided key from the token map."""
+        with self._lock:
+            token_map = dict(self.token_map)
+            token_data = token_map.pop(key, None)
+            self.token_map = token_map
+        # the removed token will not be renewed
+        self._renewed(key)
+        return token_data
+
+    def _request_renewal(self, key: str) -> Optional[threading.Event]:
+        """Return the renewal event of an expired token, scheduling the renewal immediately.
+
+        The monitor may not have started the renewal yet, or the renewal may not be due yet
+        (e.g., the token was renewed less than sleep_interval seconds ago).
+
+        Args:
+            key: The key of the token.
+
+        Returns:
+            Optional[threading.Event]: The event set once the token is renewed, None if the
+                token is no longer expired.
+        """
+        with self._schedule_condition:
+            expires = self.token_map.get(key, {}).get('token_expires')
+            if expires is None or expires > time.time():
+                # the token was renewed or unregistered
+                return None
+
+            renewal = self._renewing.get(key)
+            if renewal is None:
+                renewal = self._renewing[key] = threading.Event()
+                heapq.heappush(
+                    self._schedule,
+                    (int(time.time()), next(self._schedule_sequence), key, expires),
+                )
+                self._schedule_condition.notify()
+        return renewal
+
+    def _update_token(self, key: str, min_delay: int = 0, **token_data) -> None:
+        """Update the token data for the provided key, scheduling renewal on a new expiration.
+
+        Args:
+            key: The key of the token.
+            min_delay: The minimum number of seconds before the token is renewed.
+            **token_data: The token data (e.g., token and token_expires) to update.
+        """
+        with self._schedule_condition:
+            token_map = dict(self.token_map)
+            token_map[key] = {**token_map.get(key, {}), **token_data}
+            self.token_map = token_map
+
+            expires = token_data.get('token_expires')
+            if expires is not None:
+                renew_at = max(expires - self.token_window, int(time.time()) + min_delay)
+                heapq.heappush(
+                    self._schedule, (renew_at, next(self._schedule_sequence), key, expires)
+                )
+                self._schedule_condition.notify()
+
+        if expires is not None:
+            # a pending renewal request is stale once the token has a new expiration
+            self._renewed(key)
+
     @property
     def key(self) -> str:
         """Return the current key"""
@@ -118,7 +271,10 @@ class Tokens:
             )
             return
 
-        self.token_map[key] = {'token': Sensitive(token), 'token_expires': int(expires)}
+        token = Sensitive(token)
+        self._update_token(key, token=token, token_expires=int(expires))
+        # the token is no longer masked in logs once it has expired (plus a grace period)
+        filter_sensitive.add(token.value, int(expires))
         self.log.debug(
             f'feature=token, action=token-register, key={key}, '
             f'token={token}, expiration={expires}'
@@ -171,13 +327,12 @@ class Tokens:
     def shutdown(self, value: bool):
         """Set shutdown property.
 
-        If new value is True, set the monitor_sleep Event so that renewal monitor knows to shut
-        down immediately (or after its current renewal cycle).
+        If new value is True, the renewal monitor is woken up so it shuts down immediately (or
+        after the current renewal).
         """
-        if value is True:
-            self._monitor_sleep_interval.set()
-
-        self._shutdown = value
+        with self._schedule_condition:
+            self._shutdown = value
+            self._schedule_condition.notify_all()
 
     @property
     def thread_name(self) -> str:
@@ -186,42 +341,34 @@ class Tokens:
 
     @property
     def token(self) -> Optional[Sensitive]:
-        """Return token for current thread."""
-        # wait until renewal barrier is set to True (meaning no renewal is in progress). If already
-        # true, then simply proceed.
-
-        # perform three attempts - safety net in case of heavily overloaded monitor. If we cannot
-        # retrieve a token after three attempts, there must be an issue
-        for i in range(3):
-            if self._barrier.wait(timeout=self.token_renewal_buffer_time + 10):
-                return self.token_map.get(self.key, {}).get('token')
-
-            self.log.debug(
-                'Timeout expired while waiting for token renewal barrier to be disabled. '
-                f'Attempts: {i + 1}'
-            )
-
-            if not self.monitor_thread.is_alive():
-                break
+        """Return token for current thread.
 
-        self.log.error(
-            'Could not retrieve TC token. Token renewal monitor did not disable token barrier. '
-            f'Token renewal monitor thread alive: {self.monitor_thread.is_alive()}'
-        )
+        If the token has expired, wait for the renewal to complete. A renewal that is not due
+        yet is started immediately.
+        """
+        key = self.key
+        token_data = self.token_map.get(key, {})
+        expires = token_data.get('token_expires')
+        if expires is None or expires > time.time():
+            return token_data.get('token')
 
-        # timeout expired, monitor likely offline
-        exc = RuntimeError(
-            'Timeout expired while waiting for renewal thread to disable token barrier.'
-        )
         if self.monitor_thread.exception is not None:
-            raise exc from self.monitor_thread.exception
-
-        raise exc
+            # the expired token will not be renewed
+            raise RuntimeError(
+                'Token renewal monitor exited unexpectedly.'
+            ) from self.monitor_thread.exception
+
+        renewal = self._request_renewal(key)
+        if renewal is not None:
+            if not renewal.wait(timeout=self.token_renewal_timeout):
+                self.log.error(f'feature=token, event=token-renewal-timeout, key={key}')
+                raise RuntimeError('Timeout expired while waiting for token renewal.')
+        return self.token_map.get(key, {}).get('token')
 
     @token.setter
     def token(self, token: Sensitive) -> None:
         """Set token for current thread."""
-        self.token_map.setdefault(self.key, {})['token'] = Sensitive(token)
+        self._update_token(self.key, token=Sensitive(token))
 
     @property
     def token_expires(self) -> Optional[int]:
@@ -231,7 +378,7 @@ class Tokens:
     @token_expires.setter
     def token_expires(self, expires) -> None:
         """Set token expires for current thread."""
-        self.token_map.setdefault(self.key, {})['token_expires'] = int(expires)
+        self._update_token(self.key, token_expires=int(expires))
 
     def token_renewal(self) -> None:
         """Start token renewal monitor thread."""
@@ -243,60 +390,14 @@ class Tokens:
     def token_renewal_monitor(self) -> None:
         """Monitor token expiration and renew when required."""
         self.log.debug('feature=token, event=renewal-monitor-started')
-        self._barrier.set()
-        self._monitor_sleep_interval.wait(self.sleep_interval)
         while True:
-            # Clear renewal barrier (setting it to False), which blocks access to token via
-            # the token property.
-            self._barrier.clear()
-            self.log.debug('Token renewal barrier enabled.')
-            self._monitor_sleep_interval.wait(self.token_renewal_buffer_time)
-            for key, token_data in dict(self.token_map).items():
-                # calculate the time left to sleep
-                sleep_seconds = (
-                    token_data.get('token_expires') - int(time.time()) - self.token_window
-                )
-                self.log.trace(
-                    '''feature=token, '''
-                    f'''event=token-status, key={key}, '''
-                    f'''token={token_data.get('token')}, '''
-                    f'''expires={token_data.get('token_expires')}, '''
-                    f'''sleep-seconds={sleep_seconds}'''
-                )
-
-                if sleep_seconds > 0:
-                    continue
-
-                # renew token data
-                try:
-                    api_token_data = self.renew_token(token_data.get('token'))
-                    self.token_map[key]['token'] = Sensitive(api_token_data['apiToken'])
-                    self.token_map[key]['token_expires'] = int(api_token_data['apiTokenExpires'])
-                    self.log.info(
-                        f'''feature=token, action=token-renewed, key={key}, '''
-                        f'''token={api_token_data['apiToken']}, '''
-                        f'''expires={api_token_data['apiTokenExpires']}'''
-                    )
-                except RuntimeError as e:
-                    self.log.error(e)
-                    try:
-                        del self.token_map[key]
-                        self.log.error(f'feature=token, event=token-removal-failure, key={key}')
-                    except KeyError:  # pragma: no cover
-                        pass
-            # renewal loop is finished, grant access to token via token property once again
-            self._barrier.set()
-            self.log.debug('Token renewal barrier disabled.')
-
-            # if monitor has not been shutdown, renewal monitor will sleep for sleep_interval
-            # seconds. If monitor has been shutdown, monitor does not sleep and proceeds to
-            # the shutdown logic within the if statement below. If the monitor is already sleeping,
-            # the monitor wakes up and proceeds to the shutdown logic.
-            self._monitor_sleep_interval.wait(self.sleep_interval)
-            if self.shutdown is True:
+            key = self._next_renewal()
+            if key is None:
                 self.log.debug('Token renewal monitor shutdown signal received')
                 break
 
+            self._renew(key)
+
     @property
     def trigger_id(self) -> Optional[int]:
         """Return the current trigger_id."""
@@ -313,8 +414,8 @@ class Tokens:
         Args:
             key: The key used to identify a token.
         """
-        try:
-            del self.token_map[key]
+        token_data = self._remove_token(key)
+        if token_data is not None:
+            if token_data.get('token') is not None:
+                filter_sensitive.expire(token_data['token'].value)
             self.log.debug(f'feature=token, action=token-unregister, key={key}')
-        except KeyError:
-            pass
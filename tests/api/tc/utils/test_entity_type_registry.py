@@ -0,0 +1,105 @@
+"""Test the TcEx Entity Type Registry Module."""
+# standard library
+from typing import List
+
+# third-party
+import pytest
+from pydantic import BaseModel, ValidationError
+
+# first-party
+from tcex.api.tc.utils.entity_type_registry import EntityTypeRegistry, entity_type_registry
+from tcex.input.field_types import AddressEntity, GroupEntity, IndicatorEntity, indicator_entity
+from tcex.input.field_types.group_entity import group_entity
+from tcex.pleb.registry import registry
+from tests.api.tc.utils.utils_helpers import MockSession
+
+
+class TestEntityTypeRegistry:
+    """Test the TcEx Entity Type Registry Module."""
+
+    @staticmethod
+    def test_entity_type_registry_lookup():
+        """Test the indicator types are retrieved once per session."""
+        session = MockSession(indicator_types=('Address',))
+        type_registry = EntityTypeRegistry()
+
+        for _ in range(3):
+            assert type_registry.indicator_types(session) == {'Address'}
+        assert len(session.calls) == 1
+
+        assert 'Intrusion Set' in type_registry.group_types
+
+        # failed lookups are not stored
+        session = MockSession(indicator_types=('Address',), ok=False)
+        with pytest.raises(RuntimeError):
+            type_registry.indicator_types(session)
+        session.ok = True
+        assert type_registry.indicator_types(session) == {'Address'}
+        assert len(session.calls) == 2
+
+    @staticmethod
+    def test_entity_type_registry_field_types():
+        """Test validating an entity array makes a single API call."""
+
+        class PytestModel(BaseModel):
+            """Test Model for Inputs"""
+
+            groups: List[GroupEntity]
+            indicators: List[IndicatorEntity]
+            addresses: List[AddressEntity]
+
+        session = MockSession(indicator_types=('Address',))
+        registry.add_service('TcSession', session)
+        entity_type_registry.clear()
+        try:
+            indicators = [{'id': i, 'type': 'Address', 'value': '1.1.1.1'} for i in range(1_000)]
+            model = PytestModel(
+                groups=[{'id': 1, 'type': 'Adversary', 'value': 'adversary'}],
+                indicators=indicators,
+                addresses=[{'id': 1, 'type': 'address', 'value': '1.1.1.1'}],
+            )
+            assert len(model.indicators) == 1_000
+            assert len(session.calls) == 1
+
+            with pytest.raises(ValidationError):
+                PytestModel(
+                    groups=[],
+                    indicators=[{'id': 1, 'type': 'Host', 'value': 'a.com'}],
+                    addresses=[],
+                )
+            assert len(session.calls) == 1
+        finally:
+            entity_type_registry.clear()
+            registry._reset()  # pylint: disable=protected-access
+
+    @staticmethod
+    def test_entity_type_registry_custom_entity_types():
+        """Test the custom entity types with and without types provided."""
+        group_types = ['Intrusion Set']
+        indicator_types = ['Address', 'Host']
+
+        class PytestModel(BaseModel):
+            """Test Model for Inputs"""
+
+            group: group_entity(group_types=group_types)
+            indicator: indicator_entity(indicator_types=indicator_types)
+
+        model = PytestModel(
+            group={'id': 1, 'type': 'intrusion set', 'value': 'intrusion set'},
+            indicator={'id': 1, 'type': 'host', 'value': 'a.com'},
+        )
+        assert model.indicator.type == 'host'
+
+        # without types the model can be created, but no entity is valid
+        class PytestModelNoTypes(BaseModel):
+            """Test Model for Inputs"""
+
+            group: group_entity()
+            indicator: indicator_entity()
+
+        with pytest.raises(ValidationError) as ex:
+            PytestModelNoTypes(
+                group={'id': 1, 'type': 'Adversary', 'value': 'adversary'},
+                indicator={'id': 1, 'type': 'Address', 'value': '1.1.1.1'},
+            )
+        assert len(ex.value.errors()) == 2
@@ -0,0 +1,135 @@
+"""Test the TcEx Type Metadata Cache Module."""
+# standard library
+import json
+import os
+import tempfile
+import threading
+import time
+
+# first-party
+from tcex.api.tc.utils.threat_intel_utils import ThreatIntelUtils
+from tcex.api.tc.utils.type_metadata_cache import TypeMetadataCache, type_metadata_cache
+from tests.api.tc.utils.utils_helpers import MockSession
+
+
+class Loader:
+    """Counting loader."""
+
+    def __init__(self, delay: float = 0) -> None:
+        """Initialize Class Properties."""
+        self.calls = 0
+        self.delay = delay
+
+    def __call__(self) -> dict:
+        """Return the data."""
+        time.sleep(self.delay)
+        self.calls += 1
+        return {'call': self.calls}
+
+
+class TestTypeMetadataCache:
+    """Test the TcEx Type Metadata Cache Module."""
+
+    @staticmethod
+    def test_type_metadata_cache_shared(tmp_path):
+        """Test the loader is only called once across cache instances and threads."""
+        loader = Loader(delay=0.05)
+        cache = TypeMetadataCache(cache_path=str(tmp_path))
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(cache.get('https://tc', '/v2/types', loader))
+            )
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [{'call': 1}] * 5
+        assert loader.calls == 1
+
+        # a new process (cache instance) reads the data from disk
+        assert TypeMetadataCache(cache_path=str(tmp_path)).get(
+            'https://tc', '/v2/types', loader
+        ) == {'call': 1}
+        assert loader.calls == 1
+
+        # the cache is keyed by TC instance URL
+        assert cache.get('https://other-tc', '/v2/types', loader) == {'call': 2}
+
+    @staticmethod
+    def test_type_metadata_cache_revalidate(tmp_path):
+        """Test stale data is returned and revalidated in the background."""
+        loader = Loader()
+        cache = TypeMetadataCache(cache_path=str(tmp_path), ttl=0)
+
+        assert cache.get('https://tc', '/v2/types', loader) == {'call': 1}
+        assert cache.get('https://tc', '/v2/types', loader) == {'call': 1}
+
+        for _ in range(100):
+            if cache.get('https://tc', '/v2/types', Loader()).get('call') == 2:
+                break
+            time.sleep(0.01)
+        assert loader.calls == 2
+
+    @staticmethod
+    def test_type_metadata_cache_failure(tmp_path):
+        """Test failed loads are not cached and no base url disables caching."""
+        cache = TypeMetadataCache(cache_path=str(tmp_path))
+        assert cache.get('https://tc', '/v2/types', lambda: None) is None
+        assert cache.get('https://tc', '/v2/types', Loader()) == {'call': 1}
+
+        loader = Loader()
+        cache.get(None, '/v2/types', loader)
+        cache.get(None, '/v2/types', loader)
+        assert loader.calls == 2
+
+    @staticmethod
+    def test_type_metadata_cache_default_path(tmp_path, monkeypatch):
+        """Test the default cache directory is private to the current user."""
+        monkeypatch.setattr(tempfile, 'gettempdir', lambda: str(tmp_path))
+        cache = TypeMetadataCache()
+        assert cache.cache_path == str(tmp_path / f'tcex-type-cache-{os.getuid()}')
+
+        assert cache.get('https://tc', '/v2/types', Loader()) == {'call': 1}
+        assert os.stat(cache.cache_path).st_mode & 0o777 == 0o700
+        assert len(os.listdir(cache.cache_path)) == 1
+
+    @staticmethod
+    def test_type_metadata_cache_untrusted_path(tmp_path):
+        """Test a cache directory writable by other users is not used."""
+        cache_path = tmp_path / 'shared'
+        cache_path.mkdir()
+        cache_path.chmod(0o777)
+
+        # type metadata planted by another user is not read
+        planted = TypeMetadataCache(cache_path=str(cache_path))
+        with open(planted._fqfn(planted._key('https://tc', '/v2/types')), 'w') as fh:
+            json.dump({'fetched_at': time.time(), 'data': {'planted': True}}, fh)
+
+        loader = Loader()
+        cache = TypeMetadataCache(cache_path=str(cache_path))
+        assert cache.get('https://tc', '/v2/types', loader) == {'call': 1}
+        assert cache.get('https://tc', '/v2/types', loader) == {'call': 1}
+        assert loader.calls == 1
+
+        # the data is only cached in memory
+        assert len(os.listdir(cache_path)) == 1
+
+    @staticmethod
+    def test_type_metadata_cache_threat_intel_utils(tmp_path, monkeypatch):
+        """Test ThreatIntelUtils instances share the cached type metadata."""
+        monkeypatch.setattr(type_metadata_cache, 'cache_path', str(tmp_path))
+        type_metadata_cache.clear()
+
+        session = MockSession('https://pytest.threatconnect.com')
+        for _ in range(3):
+            ti_utils = ThreatIntelUtils(session)
+            assert ti_utils.indicator_types == ['Address', 'Host']
+            assert list(ti_utils.indicator_associations_types_data) == ['Address to Host']
+
+        assert session.calls == ['/v2/types/indicatorTypes', '/v2/types/associationTypes']
+        type_metadata_cache.clear()
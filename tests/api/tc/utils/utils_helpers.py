@@ -0,0 +1,52 @@
+"""Test helpers for the TcEx API utils modules."""
+
+
+class MockResponse:
+    """Mock Response for the types endpoints."""
+
+    headers = {'content-type': 'application/json'}
+    ok = True
+
+    def __init__(self, data: dict) -> None:
+        """Initialize Class Properties."""
+        self.data = data
+
+    def json(self) -> dict:
+        """Return the response data."""
+        return self.data
+
+
+class MockSession:
+    """Mock Session for the types endpoints.
+
+    Args:
+        base_url: The base url of the session, when None the type metadata isn't cached.
+        indicator_types: The names of the indicator types returned.
+        ok: The ok value of the responses.
+    """
+
+    def __init__(
+        self, base_url: str = None, indicator_types: tuple = ('Address', 'Host'), ok: bool = True
+    ) -> None:
+        """Initialize Class Properties."""
+        self.base_url = base_url
+        self.calls = []
+        self.indicator_types = indicator_types
+        self.ok = ok
+
+    def get(self, url: str) -> MockResponse:
+        """Handle GET requests."""
+        self.calls.append(url)
+        if url == '/v2/types/associationTypes':
+            response = MockResponse(
+                {
+                    'status': 'Success',
+                    'data': {'associationType': [{'name': 'Address to Host'}]},
+                }
+            )
+        else:
+            response = MockResponse(
+                {'data': {'indicatorType': [{'name': n} for n in self.indicator_types]}}
+            )
+        response.ok = self.ok
+        return response
@@ -0,0 +1,167 @@
+"""Test helpers for the TcEx Batch modules."""
+# standard library
+import itertools
+import json
+import threading
+import time
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+# first-party
+from tcex.api.tc.v2.batch.batch import Batch
+
+if TYPE_CHECKING:
+    # first-party
+    from tcex.tokens import Tokens
+
+
+class MockResponse:
+    """Mock Response for the batch API endpoints."""
+
+    def __init__(self, data: dict = None, status_code: int = 200) -> None:
+        """Initialize Class Properties."""
+        self.headers = {'content-type': 'application/json'}
+        self.ok = status_code < 300
+        self.status_code = status_code
+        self.text = json.dumps(data)
+
+    def json(self) -> dict:
+        """Return the response data."""
+        return json.loads(self.text)
+
+
+class MockSession:
+    """Mock Session for the batch API and file upload endpoints.
+
+    Args:
+        errors: The errors returned for each batch job.
+        poll_delay: The number of seconds each batch status request takes.
+        responses: A list of status codes to return for each file upload xid, 200 is returned
+            once empty.
+        tokens: The token module used to record the token sent with each request.
+        upload_delay: The number of seconds each file upload takes.
+        wait_for: Batch status requests block until this many batch jobs are submitted.
+    """
+
+    def __init__(
+        self,
+        errors: list = None,
+        poll_delay: float = 0.05,
+        responses: dict = None,
+        tokens: 'Tokens' = None,
+        upload_delay: float = 0.05,
+        wait_for: int = 2,
+    ) -> None:
+        """Initialize Class Properties."""
+        self.batch_errors = errors or []
+        self.batch_status = 'Completed'
+        self.poll_delay = poll_delay
+        self.responses = responses or {}
+        self.tokens = tokens
+        self.upload_delay = upload_delay
+        self.wait_for = wait_for
+
+        # properties
+        self._batch_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.poll_threads = set()
+        self.requests = []
+        self.submitted = {}
+        self.submitted_event = threading.Event()
+        self.tokens_sent = []
+
+    def _in_flight(self, count: int) -> None:
+        """Update the number of requests in flight."""
+        with self._lock:
+            self.in_flight += count
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def _record_token(self) -> None:
+        """Record the token the auth would add to the request."""
+        if self.tokens is not None:
+            token = self.tokens.token
+            with self._lock:
+                self.tokens_sent.append(token and token.value)
+
+    def get(self, url: str, **kwargs) -> MockResponse:  # pylint: disable=unused-argument
+        """Handle GET requests."""
+        self._record_token()
+        if url == '/v2/types/indicatorTypes':
+            return MockResponse({'data': {'indicatorType': []}})
+
+        if url.endswith('/errors'):
+            return MockResponse(self.batch_errors)
+
+        # batch status, mark the batch job complete
+        self.poll_threads.add(threading.get_ident())
+        self.submitted_event.wait(timeout=10)
+        time.sleep(self.poll_delay)
+        batch_id = int(url.split('/')[-1])
+        self._in_flight(-1)
+        error_count = len(self.batch_errors)
+        return MockResponse(
+            {
+                'status': 'Success',
+                'data': {
+                    'batchStatus': {
+                        'id': batch_id,
+                        'errorCount': error_count,
+                        'status': self.batch_status,
+                        'successIndicatorCount': len(self.submitted[batch_id]) - error_count,
+                    }
+                },
+            }
+        )
+
+    def post(self, url: str, data, headers: dict, **kwargs) -> MockResponse:
+        """Handle batch createAndUpload requests."""
+        # pylint: disable=unused-argument
+        self._record_token()
+        # parse the content part from the streamed multipart body
+        boundary = headers.get('Content-Type').split('boundary=')[1].encode()
+        content = {}
+        for part in b''.join(data).split(b'--' + boundary):
+            if b'name="content"' in part:
+                content = json.loads(part.split(b'\r\n\r\n', 1)[1][:-2])
+        self._in_flight(1)
+        with self._lock:
+            batch_id = next(self._batch_ids)
+            self.submitted[batch_id] = content.get('indicator')
+            if len(self.submitted) >= self.wait_for:
+                self.submitted_event.set()
+        return MockResponse({'data': {'batchStatus': {'id': batch_id, 'status': 'Queued'}}})
+
+    def request(self, method: str, url: str, data, **kwargs) -> MockResponse:
+        """Handle file upload requests."""
+        # pylint: disable=unused-argument
+        self._record_token()
+        xid = url.split('/')[-2]
+        self._in_flight(1)
+
+        # read streamed content the same as requests would
+        body = data.read() if hasattr(data, 'read') else data
+        time.sleep(self.upload_delay)
+
+        self._in_flight(-1)
+        with self._lock:
+            self.requests.append((method, xid, body))
+            status_codes = self.responses.get(xid) or []
+            status_code = status_codes.pop(0) if status_codes else 200
+        return MockResponse(status_code=status_code)
+
+
+def mock_batch(session: MockSession, tmp_path, **kwargs) -> Batch:
+    """Return a batch using the mock session.
+
+    Args:
+        session: The mock session.
+        tmp_path: The temp path of the test.
+        **kwargs: Private batch settings to update (e.g., _batch_max_chunk=10).
+    """
+    inputs = SimpleNamespace(model=SimpleNamespace(tc_temp_path=str(tmp_path)))
+    batch = Batch(inputs, session, 'TCI')
+    for name, value in kwargs.items():
+        setattr(batch, name, value)
+    return batch
@@ -0,0 +1,96 @@
+"""Test the TcEx Batch Chunk Writer Module."""
+# standard library
+import gzip
+import io
+import json
+
+# third-party
+import pytest
+
+# first-party
+from tcex.api.tc.v2.batch.batch_chunk_writer import BatchChunkWriter
+
+
+class TestBatchChunkWriter:
+    """Test the TcEx Batch Chunk Writer Module."""
+
+    @staticmethod
+    def test_batch_chunk_writer_empty():
+        """Test writing a chunk with no entities."""
+        fh = io.BytesIO()
+        chunk = BatchChunkWriter(fh)
+        chunk.finish()
+
+        assert json.loads(fh.getvalue()) == {'group': [], 'indicator': []}
+        assert chunk.count == 0
+
+    @staticmethod
+    def test_batch_chunk_writer_groups_and_indicators():
+        """Test writing groups and indicators matches json.dumps output."""
+        content = {
+            'group': [
+                {'name': 'group-1', 'type': 'Adversary', 'xid': 'xid-1'},
+                {'name': 'group-2', 'type': 'Incident', 'xid': 'xid-2'},
+            ],
+            'indicator': [{'summary': '1.1.1.1', 'type': 'Address', 'xid': 'xid-3'}],
+        }
+
+        fh = io.BytesIO()
+        chunk = BatchChunkWriter(fh)
+        for group in content.get('group'):
+            chunk.add('group', group)
+        for indicator in content.get('indicator'):
+            # pre-serialized entity data is written as-is
+            chunk.add('indicator', json.dumps(indicator).encode())
+        chunk.finish()
+
+        assert fh.getvalue() == json.dumps(content).encode()
+        assert chunk.count == 3
+        assert chunk.size == len(fh.getvalue())
+
+    @staticmethod
+    def test_batch_chunk_writer_indicators_only():
+        """Test writing only indicators."""
+        fh = io.BytesIO()
+        chunk = BatchChunkWriter(fh)
+        chunk.add('indicator', {'summary': '1.1.1.1', 'type': 'Address'})
+        chunk.finish()
+
+        data = json.loads(fh.getvalue())
+        assert data.get('group') == []
+        assert len(data.get('indicator')) == 1
+
+    @staticmethod
+    def test_batch_chunk_writer_full():
+        """Test max count and max size limits."""
+        chunk = BatchChunkWriter(io.BytesIO(), max_count=2)
+        chunk.add('indicator', {'summary': '1.1.1.1', 'type': 'Address'})
+        assert chunk.full is False
+        chunk.add('indicator', {'summary': '1.1.1.2', 'type': 'Address'})
+        assert chunk.full is True
+
+        chunk = BatchChunkWriter(io.BytesIO(), max_size=100)
+        chunk.add('indicator', {'summary': '1.1.1.1', 'type': 'Address'})
+        assert chunk.full is False
+        chunk.add('indicator', {'summary': '1.1.1.2', 'type': 'Address'})
+        assert chunk.full is True
+
+    @staticmethod
+    def test_batch_chunk_writer_gzip(tmp_path):
+        """Test writing a chunk to a gzip file."""
+        fqfn = tmp_path / 'batch.json.gz'
+        with gzip.open(fqfn, mode='wb') as fh:
+            chunk = BatchChunkWriter(fh)
+            chunk.add('group', {'name': 'group-1', 'type': 'Adversary', 'xid': 'xid-1'})
+            chunk.finish()
+
+        with gzip.open(fqfn, mode='rt', encoding='utf-8') as fh:
+            assert json.load(fh).get('group')[0].get('xid') == 'xid-1'
+
+    @staticmethod
+    def test_batch_chunk_writer_invalid_order():
+        """Test that groups can not be added after indicators."""
+        chunk = BatchChunkWriter(io.BytesIO())
+        chunk.add('indicator', {'summary': '1.1.1.1', 'type': 'Address'})
+        with pytest.raises(RuntimeError):
+            chunk.add('group', {'name': 'group-1', 'type': 'Adversary'})
@@ -0,0 +1,53 @@
+"""Test the TcEx Batch Multipart Encoder Module."""
+# standard library
+import io
+import json
+
+# third-party
+from requests.models import RequestEncodingMixin
+from requests.utils import super_len
+
+# first-party
+from tcex.api.tc.v2.batch.batch_multipart_encoder import BatchMultipartEncoder
+
+
+class TestBatchMultipartEncoder:
+    """Test the TcEx Batch Multipart Encoder Module."""
+
+    @staticmethod
+    def test_batch_multipart_encoder_matches_requests():
+        """Test the streamed body matches the requests files encoding."""
+        config = json.dumps({'action': 'Create', 'owner': 'TCI'}).encode()
+        content = json.dumps({'group': [], 'indicator': [{'summary': '1.1.1.1'}]}).encode()
+
+        body = BatchMultipartEncoder(
+            [('config', config), ('content', io.BytesIO(content))], chunk_size=8
+        )
+        # pylint: disable=protected-access
+        expected, content_type = RequestEncodingMixin._encode_files(
+            (('config', config), ('content', content)), None
+        )
+        expected_boundary = content_type.split('boundary=')[1]
+
+        encoded = b''.join(body)
+        assert encoded == expected.replace(expected_boundary.encode(), body.boundary.encode())
+        assert body.content_type == f'multipart/form-data; boundary={body.boundary}'
+        assert len(body) == len(encoded)
+        assert super_len(body) == len(encoded)
+
+        # the body can be sent again (e.g., on retry)
+        assert b''.join(body) == encoded
+
+    @staticmethod
+    def test_batch_multipart_encoder_file(tmp_path):
+        """Test a file value is streamed in chunks."""
+        fqfn = tmp_path / 'content.json'
+        fqfn.write_bytes(b'x' * 200_000)
+
+        with open(fqfn, 'rb') as fh:
+            body = BatchMultipartEncoder([('content', fh)], chunk_size=65_536)
+            chunks = list(body)
+
+        assert max(len(c) for c in chunks) == 65_536
+        assert len(body) == len(b''.join(chunks))
+        assert b'x' * 200_000 in b''.join(chunks)
@@ -0,0 +1,100 @@
+"""Test the TcEx Batch Poll Strategy Module."""
+# third-party
+import pytest
+
+# first-party
+from tcex.api.tc.v2.batch.batch_poll_strategy import (
+    AdaptivePollStrategy,
+    ExponentialPollStrategy,
+    FixedPollStrategy,
+    PollJob,
+)
+
+
+class TestBatchPollStrategy:
+    """Test the TcEx Batch Poll Strategy Module."""
+
+    @staticmethod
+    def test_batch_poll_strategy_fixed():
+        """Test fixed poll strategy intervals and metrics."""
+        strategy = FixedPollStrategy(3)
+        job = PollJob(1, 10_000)
+        assert strategy.interval(job) == 3
+
+        job.poll_count = 2
+        job.wait_time = 6
+        job.update(6.5, {'status': 'Completed', 'successCount': 10_000})
+        strategy.completed(job)
+
+        assert strategy.metrics == {
+            'jobs': 1,
+            'polls': 2,
+            'poll_time': 6.5,
+            'wait_time': 6,
+            'average_polls': 2,
+            'average_poll_time': 6.5,
+        }
+
+    @staticmethod
+    def test_batch_poll_strategy_exponential():
+        """Test exponential poll strategy matches the previous retry behavior."""
+        strategy = ExponentialPollStrategy(initial_interval=15, retry_seconds=5, back_off=2.5)
+        job = PollJob(1)
+        intervals = []
+        for poll_count in range(6):
+            job.poll_count = poll_count
+            intervals.append(strategy.interval(job))
+
+        assert intervals == [15, 7, 10, 12, 15, 17]
+
+    @staticmethod
+    def test_batch_poll_strategy_adaptive_sync():
+        """Test small batches are polled immediately."""
+        strategy = AdaptivePollStrategy(sync_limit=1_000)
+        assert strategy.interval(PollJob(1, 500)) == 0
+        assert strategy.interval(PollJob(1, 5_000)) > 0
+
+    @staticmethod
+    def test_batch_poll_strategy_adaptive_history():
+        """Test the first interval is learned from completed batch jobs."""
+        strategy = AdaptivePollStrategy(min_interval=1, max_interval=60, sync_limit=0)
+        assert strategy.seconds_per_item is None
+        assert strategy.interval(PollJob(1, 3_000)) == 10
+
+        for batch_id in range(3):
+            job = PollJob(batch_id, 10_000)
+            job.poll_count = 1
+            job.update(5.0, {'status': 'Completed', 'successCount': 10_000})
+            strategy.completed(job)
+
+        assert strategy.seconds_per_item == pytest.approx(0.0005)
+        assert strategy.interval(PollJob(4, 20_000)) == pytest.approx(10)
+        assert strategy.interval(PollJob(5, 1_000_000)) == 60
+        assert strategy.metrics.get('jobs') == 3
+        assert strategy.metrics.get('seconds_per_item') == pytest.approx(0.0005)
+
+    @staticmethod
+    def test_batch_poll_strategy_adaptive_progress():
+        """Test subsequent intervals use the progress rate reported across polls."""
+        strategy = AdaptivePollStrategy(min_interval=1, max_interval=20)
+
+        # batch size is taken from the status counts when not provided
+        job = PollJob(1)
+        job.poll_count = 1
+        job.update(2.0, {'successCount': 1_000, 'errorCount': 0, 'unprocessCount': 9_000})
+        assert job.batch_size == 10_000
+
+        # no progress rate available yet, back off from the min interval
+        assert strategy.interval(job) == 2
+
+        # 2,000 items in 2 seconds, 7,000 items remaining
+        job.poll_count = 2
+        job.update(4.0, {'successCount': 2_900, 'errorCount': 100, 'unprocessCount': 7_000})
+        assert strategy.interval(job) == 7
+
+        # no progress between polls, back off from the min interval
+        job = PollJob(2, 10_000)
+        job.poll_count = 2
+        job.update(2.0, {'successCount': 0})
+        job.update(4.0, {'successCount': 0})
+        assert strategy.interval(job) == 4
@@ -0,0 +1,135 @@
+"""Test the TcEx Batch Size Tracker Module."""
+# standard library
+import json
+import threading
+
+# first-party
+from tcex.api.tc.v2.batch.batch_size_tracker import BatchSizeTracker
+from tcex.api.tc.v2.batch.indicator import File
+
+
+class TestBatchSizeTracker:
+    """Test the TcEx Batch Size Tracker Module."""
+
+    @staticmethod
+    def test_batch_size_tracker_encode():
+        """Test exact UTF-8 size accounting."""
+        tracker = BatchSizeTracker(default_size=500)
+        assert tracker.average_size == 500
+
+        data = {'summary': 'bücher.example.com', 'type': 'Host', 'xid': 'xid-1'}
+        encoded = tracker.encode(data)
+
+        assert encoded == json.dumps(data).encode('utf-8')
+        assert tracker.count == 1
+        assert tracker.size == len(encoded)
+        assert tracker.average_size == len(encoded)
+
+    @staticmethod
+    def test_batch_size_tracker_cache():
+        """Test cached bytes are only returned for the same entity data object."""
+        tracker = BatchSizeTracker()
+        data = {'summary': '1.1.1.1', 'type': 'Address', 'xid': 'xid-1'}
+        encoded = tracker.encode(data, cache=True)
+
+        assert tracker.cached(data) is encoded
+        assert tracker.cached(dict(data)) is None
+
+        tracker.clear()
+        assert tracker.cached(data) is None
+
+    @staticmethod
+    def test_batch_size_tracker_dumps():
+        """Test dumps output matches json.dumps output."""
+        tracker = BatchSizeTracker()
+        content = {
+            'group': [{'name': 'group-1', 'type': 'Adversary', 'xid': 'xid-1'}],
+            'indicator': [
+                {'summary': '1.1.1.1', 'type': 'Address', 'xid': 'xid-2'},
+                {'summary': '1.1.1.2', 'type': 'Address', 'xid': 'xid-3'},
+            ],
+        }
+        # cache only some of the entities
+        tracker.encode(content['indicator'][0], cache=True)
+
+        assert tracker.dumps(content) == json.dumps(content).encode()
+
+        # cached bytes are released once used
+        assert tracker.cached(content['indicator'][0]) is None
+
+    @staticmethod
+    def test_batch_size_tracker_max_cache_size():
+        """Test the oldest cached entries are dropped once the cache is full."""
+        tracker = BatchSizeTracker(max_cache_size=100)
+        entities = [
+            {'summary': f'1.1.1.{i}', 'type': 'Address', 'xid': f'xid-{i}'} for i in range(5)
+        ]
+        for data in entities:
+            tracker.encode(data, cache=True)
+
+        assert tracker.cached(entities[0]) is None
+        assert tracker.cached(entities[-1]) is not None
+
+    @staticmethod
+    def test_batch_size_tracker_estimate():
+        """Test the estimate is the exact size until sample_size entities are serialized."""
+        tracker = BatchSizeTracker(default_size=1_000, sample_size=2)
+        entities = [
+            {'summary': f'1.1.1.{i}', 'type': 'Address', 'xid': f'xid-{i}'} for i in range(3)
+        ]
+        sizes = [len(json.dumps(data).encode()) for data in entities]
+
+        assert tracker.estimate(entities[0]) == sizes[0]
+        assert tracker.estimate(entities[1]) == sizes[1]
+        assert tracker.estimate(entities[2]) == (sizes[0] + sizes[1]) // 2
+        assert tracker.sampled_count == 2
+        assert tracker.sampled_size == sizes[0] + sizes[1]
+
+        # the sampled sizes are not part of the exact totals of the encoded entities
+        assert tracker.count == 0
+        assert tracker.size == 0
+        tracker.encode(entities[2])
+        assert tracker.count == 1
+        assert tracker.size == sizes[2]
+        assert tracker.average_size == sum(sizes) // 3
+
+    @staticmethod
+    def test_batch_size_tracker_encode_threads():
+        """Test the totals are exact when entities are encoded by concurrent workers."""
+        tracker = BatchSizeTracker(sample_size=10)
+        entities = [
+            [
+                {'summary': f'1.1.{t}.{i}', 'type': 'Address', 'xid': f'xid-{t}-{i}'}
+                for i in range(500)
+            ]
+            for t in range(8)
+        ]
+
+        def _worker(worker_entities: list):
+            for data in worker_entities:
+                tracker.estimate(data)
+                tracker.encode(data, cache=True)
+
+        threads = [threading.Thread(target=_worker, args=(e,)) for e in entities]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert tracker.count == 4_000
+        assert tracker.size == sum(len(json.dumps(d).encode()) for e in entities for d in e)
+        assert tracker.sampled_count <= 10 + len(threads)
+
+    @staticmethod
+    def test_batch_size_tracker_estimate_file_indicator():
+        """Test sampling a File indicator doesn't change the data written later."""
+        tracker = BatchSizeTracker()
+        indicator = File(md5='a' * 32, xid='xid-1')
+        indicator.occurrence(file_name='malware.exe', path='/tmp')
+        indicator.action('drop').action('archive')
+
+        data = json.loads(json.dumps(indicator.data))
+        tracker.estimate(indicator.data)
+        assert indicator.data == data
+        assert len(indicator.data['fileOccurrence']) == 1
+        assert len(indicator.data['fileAction']['children'][0]['children']) == 1
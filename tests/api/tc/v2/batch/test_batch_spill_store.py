@@ -0,0 +1,84 @@
+"""Test the TcEx Batch Spill Store Module."""
+# standard library
+import os
+
+# first-party
+from tcex.api.tc.v2.batch.batch_spill_store import BatchSpillStore
+
+
+class TestBatchSpillStore:
+    """Test the TcEx Batch Spill Store Module."""
+
+    @staticmethod
+    def test_batch_spill_store_get_set_delete(tmp_path):
+        """Test basic mapping operations."""
+        store = BatchSpillStore(str(tmp_path / 'indicators'))
+        store['xid-1'] = {'summary': '1.1.1.1', 'type': 'Address', 'xid': 'xid-1'}
+        store['xid-2'] = {'summary': '1.1.1.2', 'type': 'Address', 'xid': 'xid-2'}
+
+        assert 'xid-1' in store
+        assert 'xid-3' not in store
+        assert store.get('xid-3') is None
+        assert store['xid-1'].get('summary') == '1.1.1.1'
+        assert len(store) == 2
+
+        # overwrite an existing entry
+        store['xid-1'] = {'summary': '1.1.1.3', 'type': 'Address', 'xid': 'xid-1'}
+        assert store.get('xid-1').get('summary') == '1.1.1.3'
+        assert len(store) == 2
+
+        del store['xid-2']
+        assert 'xid-2' not in store
+        assert sorted(store.keys()) == ['xid-1']
+        store.close()
+
+    @staticmethod
+    def test_batch_spill_store_drain(tmp_path):
+        """Test draining the store in insertion order."""
+        filename = str(tmp_path / 'indicators')
+        store = BatchSpillStore(filename)
+        for i in range(100):
+            store[f'xid-{i}'] = {'summary': f'1.1.1.{i}', 'type': 'Address'}
+        del store['xid-50']
+
+        drained = list(store.drain())
+        assert len(drained) == 99
+        assert drained[0][0] == 'xid-0'
+        assert drained[-1][1].get('summary') == '1.1.1.99'
+        assert len(store) == 0
+
+        # the spill file is truncated once the store is empty
+        assert os.path.getsize(filename) == 0
+        store['xid-1'] = {'summary': '1.1.1.1', 'type': 'Address'}
+        assert store['xid-1'].get('summary') == '1.1.1.1'
+        store.close()
+
+    @staticmethod
+    def test_batch_spill_store_drain_partial(tmp_path):
+        """Test closing the drain generator leaves remaining entries."""
+        store = BatchSpillStore(str(tmp_path / 'indicators'))
+        for i in range(10):
+            store[f'xid-{i}'] = i
+
+        for key, _ in store.drain():
+            if key == 'xid-4':
+                break
+
+        assert len(store) == 5
+        assert sorted(v for _, v in store.drain()) == [5, 6, 7, 8, 9]
+        store.close()
+
+    @staticmethod
+    def test_batch_spill_store_reopen(tmp_path):
+        """Test a previously written spill file is indexed on open."""
+        filename = str(tmp_path / 'groups')
+        store = BatchSpillStore(filename)
+        store['xid-1'] = {'name': 'group-1'}
+        store['xid-2'] = {'name': 'group-2'}
+        del store['xid-1']
+        store.close()
+
+        store = BatchSpillStore(filename)
+        assert list(store.keys()) == ['xid-2']
+        assert store['xid-2'] == {'name': 'group-2'}
+        store.close()
@@ -0,0 +1,158 @@
+"""Test the TcEx Batch Module file upload."""
+# standard library
+import io
+import os
+import time
+
+# first-party
+from tcex.api.tc.v2.batch.batch import Batch
+from tcex.tokens import Tokens
+from tests.api.tc.v2.batch.batch_helpers import MockSession, mock_batch
+from tests.tokens.tokens_helpers import run_in_trigger_thread
+
+
+class NonSeekableStream(io.RawIOBase):
+    """A stream that can only be read once (e.g., a socket or a pipe)."""
+
+    def __init__(self, content: bytes) -> None:
+        """Initialize Class Properties."""
+        self._content = io.BytesIO(content)
+
+    def readable(self) -> bool:
+        """Return True as the stream can be read."""
+        return True
+
+    def readinto(self, b) -> int:
+        """Read the content into the provided buffer."""
+        return self._content.readinto(b)
+
+
+class TestBatchSubmitFiles:
+    """Test the TcEx Batch Module file upload."""
+
+    @staticmethod
+    def _batch(session: MockSession, tmp_path) -> Batch:
+        """Return a batch for file uploads."""
+        return mock_batch(session, tmp_path, _debug=False, _file_upload_backoff=0)
+
+    def test_batch_submit_files_concurrent(self, tmp_path):
+        """Test files are uploaded concurrently and the status is returned in order."""
+        session = MockSession()
+        batch = self._batch(session, tmp_path)
+        batch.file_upload_workers = 4
+
+        file_data = {
+            f'xid-{i}': {'fileContent': f'content-{i}'.encode(), 'type': 'Document'}
+            for i in range(12)
+        }
+        upload_status = batch.submit_files(file_data)
+
+        assert upload_status == [{'uploaded': True, 'xid': f'xid-{i}'} for i in range(12)]
+        assert not file_data
+        assert 1 < session.max_in_flight <= 4
+        batch.close()
+
+    def test_batch_submit_files_stream_and_callable(self, tmp_path):
+        """Test file content from a path and a callable."""
+        fqfn = tmp_path / 'malware.bin'
+        fqfn.write_bytes(b'x' * 1_000)
+
+        session = MockSession()
+        batch = self._batch(session, tmp_path)
+        file_data = {
+            'xid-path': {'fileContent': fqfn, 'type': 'Document'},
+            'xid-callable': {'fileContent': lambda xid: f'{xid}-content', 'type': 'Report'},
+            'xid-null': {'fileContent': lambda xid: None, 'type': 'Report'},
+        }
+        upload_status = batch.submit_files(file_data)
+
+        assert upload_status == [
+            {'uploaded': True, 'xid': 'xid-path'},
+            {'uploaded': True, 'xid': 'xid-callable'},
+            {'uploaded': False, 'xid': 'xid-null'},
+        ]
+        bodies = {xid: body for _, xid, body in session.requests}
+        assert bodies == {'xid-path': b'x' * 1_000, 'xid-callable': 'xid-callable-content'}
+        batch.close()
+
+    def test_batch_submit_files_retry(self, tmp_path):
+        """Test retry on retryable status codes and PUT on 401."""
+        fqfn = tmp_path / 'report.pdf'
+        fqfn.write_bytes(b'report')
+
+        session = MockSession(
+            responses={'xid-1': [503, 401, 200], 'xid-2': [500, 500, 500, 500], 'xid-3': [400]}
+        )
+        batch = self._batch(session, tmp_path)
+        batch.file_upload_retries = 3
+        file_data = {
+            'xid-1': {'fileContent': fqfn, 'type': 'Document'},
+            'xid-2': {'fileContent': b'content', 'type': 'Document'},
+            'xid-3': {'fileContent': b'content', 'type': 'Document'},
+        }
+        upload_status = batch.submit_files(file_data, halt_on_error=False)
+
+        assert upload_status == [
+            {'uploaded': True, 'xid': 'xid-1'},
+            {'uploaded': False, 'xid': 'xid-2'},
+            {'uploaded': False, 'xid': 'xid-3'},
+        ]
+
+        requests = [(method, body) for method, xid, body in session.requests if xid == 'xid-1']
+        assert requests == [('POST', b'report'), ('POST', b'report'), ('PUT', b'report')]
+        assert len([r for r in session.requests if r[1] == 'xid-2']) == 4
+        assert len([r for r in session.requests if r[1] == 'xid-3']) == 1
+        batch.close()
+
+    def test_batch_submit_files_non_seekable_stream(self, tmp_path):
+        """Test a stream that can't be rewound is saved in debug mode, retried, and sent by PUT."""
+        session = MockSession(responses={'xid-1': [503, 401, 200]})
+        batch = self._batch(session, tmp_path)
+        batch._debug = True
+        batch.file_upload_retries = 3
+        os.makedirs(batch.debug_path_files)
+
+        file_data = {
+            'xid-1': {
+                'fileContent': NonSeekableStream(b'stream'),
+                'fileName': 'stream.bin',
+                'type': 'Document',
+            }
+        }
+        upload_status = batch.submit_files(file_data)
+
+        assert upload_status == [{'uploaded': True, 'xid': 'xid-1'}]
+        assert [(method, body) for method, _, body in session.requests] == [
+            ('POST', b'stream'),
+            ('POST', b'stream'),
+            ('PUT', b'stream'),
+        ]
+        fqfn = os.path.join(batch.debug_path_files, 'documents--xid-1--stream.bin')
+        with open(fqfn, 'rb') as fh:
+            assert fh.read() == b'stream'
+        batch.close()
+
+    def test_batch_submit_files_trigger_token(self, tmp_path):
+        """Test files are uploaded with the token of the calling trigger thread."""
+        tokens = Tokens('https://tc.example.com/api')
+        session = MockSession(tokens=tokens)
+        batches = []
+        file_data = {
+            f'xid-{i}': {'fileContent': f'content-{i}'.encode(), 'type': 'Document'}
+            for i in range(8)
+        }
+
+        def _submit() -> list:
+            batches.append(self._batch(session, tmp_path))
+            batches[0].file_upload_workers = 4
+            return batches[0].submit_files(file_data)
+
+        try:
+            tokens.register_token(123, 'trigger-token', int(time.time()) + 3_600)
+            upload_status = run_in_trigger_thread(_submit, 123)
+        finally:
+            tokens.shutdown = True
+
+        assert all(s.get('uploaded') for s in upload_status)
+        assert set(session.tokens_sent) == {'trigger-token'}
+        batches[0].close()
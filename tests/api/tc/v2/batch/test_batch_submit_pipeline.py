@@ -0,0 +1,139 @@
+"""Test the TcEx Batch Module pipelined submit."""
+# standard library
+import threading
+import time
+
+# third-party
+import pytest
+
+# first-party
+from tcex.api.tc.v2.batch.batch import Batch
+from tcex.api.tc.v2.batch.batch_poll_strategy import FixedPollStrategy, PollJob
+from tcex.tokens import Tokens
+from tests.api.tc.v2.batch.batch_helpers import MockSession, mock_batch
+from tests.tokens.tokens_helpers import run_in_trigger_thread
+
+
+class FailingPollStrategy(FixedPollStrategy):
+    """Poll strategy that raises when scheduling the next poll of a batch job."""
+
+    def interval(self, job: PollJob) -> float:
+        """Return the interval, raising after the first poll."""
+        if job.poll_count > 0:
+            raise RuntimeError('poll strategy failed')
+        return 0
+
+
+class TestBatchSubmitPipeline:
+    """Test the TcEx Batch Module pipelined submit."""
+
+    @staticmethod
+    def _batch(session: MockSession, tmp_path, count: int) -> Batch:
+        """Return a batch with count indicators split into chunks of 10."""
+        batch = mock_batch(session, tmp_path, _batch_max_chunk=10)
+        batch.poll_strategy = FixedPollStrategy(0)
+        for i in range(count):
+            batch.address(f'123.124.125.{i}', xid=f'pytest-address-xid-{i}')
+        return batch
+
+    def test_batch_submit_all_pipeline(self, tmp_path):
+        """Test all batch jobs are submitted with multiple batch jobs in flight."""
+        session = MockSession()
+        batch = self._batch(session, tmp_path, 55)
+
+        batch_status = batch.submit_all_pipeline(max_in_flight=3)
+
+        # batch ids are assigned as the worker threads submit, results are in submission order
+        assert sorted(bs.get('id') for bs in batch_status) == [1, 2, 3, 4, 5, 6]
+        assert [session.submitted[bs.get('id')][0]['xid'] for bs in batch_status] == [
+            f'pytest-address-xid-{i}' for i in range(0, 55, 10)
+        ]
+        assert sum(bs.get('successIndicatorCount') for bs in batch_status) == 55
+        assert sum(len(i) for i in session.submitted.values()) == 55
+        assert 1 < session.max_in_flight <= 3
+        assert batch.indicator_len == 0
+        batch.close()
+
+    def test_batch_submit_all_pipeline_single_poller(self, tmp_path):
+        """Test the status of all in flight batch jobs is polled from a single thread."""
+        session = MockSession(wait_for=3)
+        batch = self._batch(session, tmp_path, 30)
+        batch._debug = True
+        batch.debug_path_batch = str(tmp_path)
+
+        batch_status = batch.submit_all_pipeline(max_in_flight=3)
+
+        assert sorted(bs.get('id') for bs in batch_status) == [1, 2, 3]
+        assert len(session.poll_threads) == 1
+        assert threading.get_ident() not in session.poll_threads
+        assert session.max_in_flight == 3
+
+        # each batch job writes the errors to a unique debug file
+        assert len(list(tmp_path.glob('errors-*.json.gz'))) == 3
+        batch.close()
+
+    def test_batch_submit_all_pipeline_critical_error(self, tmp_path):
+        """Test no new batch jobs are submitted after a critical error."""
+        session = MockSession(
+            errors=[
+                {
+                    'errorReason': 'Request would exceed the number of allowed indicators.',
+                    'errorSource': 'pytest',
+                }
+            ]
+        )
+        batch = self._batch(session, tmp_path, 100)
+
+        # the critical error is raised once all in flight batch jobs are complete
+        with pytest.raises(RuntimeError):
+            batch.submit_all_pipeline(max_in_flight=2)
+
+        # no new batch jobs are submitted, the remaining data stays in the batch
+        assert 2 <= len(session.submitted) < 10
+        assert session.in_flight == 0
+        assert batch.indicator_len == 100 - len(session.submitted) * 10
+        batch.close()
+
+    def test_batch_submit_all_pipeline_trigger_token(self, tmp_path):
+        """Test the batch jobs are submitted and polled with the token of the trigger thread."""
+        tokens = Tokens('https://tc.example.com/api')
+        session = MockSession(tokens=tokens)
+        batches = []
+
+        def _submit() -> list:
+            batches.append(self._batch(session, tmp_path, 30))
+            return batches[0].submit_all_pipeline(max_in_flight=3)
+
+        try:
+            tokens.register_token(123, 'trigger-token', int(time.time()) + 3_600)
+            batch_status = run_in_trigger_thread(_submit, 123)
+        finally:
+            tokens.shutdown = True
+
+        assert len(batch_status) == 3
+        # the indicator types, submit, status, and errors requests
+        assert session.tokens_sent
+        assert set(session.tokens_sent) == {'trigger-token'}
+        batches[0].close()
+
+    def test_batch_submit_all_pipeline_poller_failure(self, tmp_path):
+        """Test a failure scheduling a poll is raised instead of leaving the batch job pending."""
+        session = MockSession(poll_delay=0, wait_for=1)
+        session.batch_status = 'Running'
+        batch = self._batch(session, tmp_path, 20)
+        batch.poll_strategy = FailingPollStrategy()
+        errors = []
+
+        def _submit():
+            try:
+                batch.submit_all_pipeline(max_in_flight=2)
+            except RuntimeError as ex:
+                errors.append(ex)
+
+        thread = threading.Thread(target=_submit, daemon=True)
+        thread.start()
+        thread.join(timeout=10)
+
+        assert not thread.is_alive()
+        assert [str(e) for e in errors] == ['poll strategy failed']
+        batch.close()
@@ -0,0 +1,45 @@
+"""Test the TcEx Batch Writer Module."""
+# standard library
+import gzip
+import json
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # first-party
+    from tcex import TcEx
+
+
+class TestBatchWriter:
+    """Test the TcEx Batch Writer Module."""
+
+    @staticmethod
+    def test_batch_writer_stream(tcex: 'TcEx', tmp_path):
+        """Test batch writer stream mode writes size bounded files."""
+        written_files = []
+        batch = tcex.v2.batch_writer(
+            str(tmp_path),
+            batch_max_chunk=10,
+            stream=True,
+            write_callback=written_files.append,
+        )
+
+        adversary = batch.adversary(name='pytest-adversary', xid='pytest-adversary-xid')
+        adversary.association('pytest-incident-xid')
+        batch.incident(name='pytest-incident', xid='pytest-incident-xid')
+        for i in range(25):
+            batch.address(f'123.124.125.{i}', xid=f'pytest-address-xid-{i}')
+        batch.dump()
+
+        groups = []
+        indicators = []
+        for fqfn in written_files:
+            with gzip.open(fqfn, mode='rt', encoding='utf-8') as fh:
+                content = json.load(fh)
+            assert len(content.get('group')) + len(content.get('indicator')) <= 10
+            groups.extend(content.get('group'))
+            indicators.extend(content.get('indicator'))
+
+        assert len(written_files) == 3
+        assert len(groups) == 2
+        assert len(indicators) == 25
+        assert not batch.groups and not batch.indicators
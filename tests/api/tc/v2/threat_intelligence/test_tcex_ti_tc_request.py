@@ -0,0 +1,159 @@
+"""Test the TcEx Threat Intel TC Request Module."""
+# standard library
+import json
+import random
+import threading
+import time
+
+# third-party
+import pytest
+from requests import PreparedRequest, Response
+
+# first-party
+from tcex.api.tc.v2.threat_intelligence.tcex_ti_tc_request import TiTcRequest
+from tcex.tokens import Tokens
+from tests.tokens.tokens_helpers import run_in_trigger_thread
+
+
+class MockSession:
+    """Session that returns pages of indicators."""
+
+    def __init__(self, result_count: int, fail_start: int = None, tokens: Tokens = None):
+        """Initialize Class Properties."""
+        self.fail_start = fail_start
+        self.in_flight = 0
+        self.lock = threading.Lock()
+        self.max_in_flight = 0
+        self.result_count = result_count
+        self.result_starts = []
+        self.tokens = tokens
+        self.tokens_sent = []
+
+    def get(self, url, params=None):
+        """Return the page for the request."""
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            self.result_starts.append(params['resultStart'])
+            if self.tokens is not None:
+                # the token the auth would add to the request
+                self.tokens_sent.append(self.tokens.token)
+        time.sleep(random.uniform(0.001, 0.02))  # nosec
+
+        start = params['resultStart']
+        end = min(start + params['resultLimit'], self.result_count)
+        content = {
+            'status': 'Success',
+            'data': {
+                'resultCount': self.result_count,
+                'indicator': [{'id': i} for i in range(start, end)],
+            },
+        }
+
+        response = Response()
+        response.request = PreparedRequest()
+        response.request.prepare(method='GET', url=f'https://tc.example.com{url}')
+        response.status_code = 400 if start == self.fail_start else 200
+        response._content = json.dumps(content).encode()
+
+        with self.lock:
+            self.in_flight -= 1
+        return response
+
+
+class TestTiTcRequest:
+    """Test the TcEx Threat Intel TC Request Module."""
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        'max_workers,ordered,result_count',
+        [(1, True, 95), (4, True, 95), (4, False, 95), (4, True, 100), (4, True, 5)],
+    )
+    def test_iterate(max_workers, ordered, result_count):
+        """Test pages are returned sequentially or concurrently."""
+        session = MockSession(result_count)
+        tc_requests = TiTcRequest(session)
+        tc_requests.max_workers = max_workers
+        tc_requests.ordered = ordered
+        tc_requests.result_limit = 10
+
+        # pylint: disable=protected-access
+        ids = [i['id'] for i in tc_requests._iterate('/v2/indicators', {}, 'indicator')]
+
+        if ordered:
+            assert ids == list(range(result_count))
+        else:
+            assert sorted(ids) == list(range(result_count))
+        if max_workers > 1:
+            # the pages are calculated from resultCount, so no trailing empty page is requested
+            assert sorted(session.result_starts) == list(range(0, result_count, 10))
+        assert session.max_in_flight <= max_workers
+
+    @staticmethod
+    def test_iterate_result_start():
+        """Test the pages start at the provided resultStart."""
+        session = MockSession(50)
+        tc_requests = TiTcRequest(session)
+        tc_requests.max_workers = 4
+        tc_requests.result_limit = 10
+
+        # pylint: disable=protected-access
+        ids = [
+            i['id']
+            for i in tc_requests._iterate('/v2/indicators', {'resultStart': 15}, 'indicator')
+        ]
+        assert ids == list(range(15, 50))
+
+    @staticmethod
+    def test_iterate_error():
+        """Test a failed page request raises an error."""
+        session = MockSession(100, fail_start=50)
+        tc_requests = TiTcRequest(session)
+        tc_requests.max_workers = 4
+        tc_requests.result_limit = 10
+
+        ids = []
+        with pytest.raises(RuntimeError):
+            # pylint: disable=protected-access
+            for indicator in tc_requests._iterate('/v2/indicators', {}, 'indicator'):
+                ids.append(indicator['id'])
+        assert ids == list(range(50))
+
+    @staticmethod
+    def test_iterate_close():
+        """Test closing the iterator stops requesting pages."""
+        session = MockSession(10_000)
+        tc_requests = TiTcRequest(session)
+        tc_requests.max_workers = 2
+        tc_requests.result_limit = 10
+
+        # pylint: disable=protected-access
+        iterator = tc_requests._iterate('/v2/indicators', {}, 'indicator')
+        next(iterator)
+        iterator.close()
+
+        # the first page and at most max_workers * 2 prefetched pages are requested
+        assert len(session.result_starts) <= 5
+
+    @staticmethod
+    def test_iterate_trigger_token():
+        """Test pages requested concurrently use the token of the calling trigger thread."""
+        tokens = Tokens('https://tc.example.com/api')
+        try:
+            tokens.register_token(123, 'trigger-token', int(time.time()) + 3_600)
+            session = MockSession(95, tokens=tokens)
+            tc_requests = TiTcRequest(session)
+            tc_requests.max_workers = 4
+            tc_requests.result_limit = 10
+
+            ids = run_in_trigger_thread(
+                # pylint: disable=protected-access
+                lambda: [i['id'] for i in tc_requests._iterate('/v2/indicators', {}, 'indicator')]
+            )
+        finally:
+            tokens.shutdown = True
+
+        assert ids == list(range(95))
+        assert len(session.tokens_sent) == 10
+        assert {t.value for t in session.tokens_sent if t is not None} == {'trigger-token'}
+        assert None not in session.tokens_sent
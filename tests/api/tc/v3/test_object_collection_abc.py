@@ -0,0 +1,226 @@
+"""Test the TcEx API V3 Object Collection Module."""
+# standard library
+import json
+import threading
+import time
+
+# third-party
+import pytest
+from requests import PreparedRequest, Response
+
+# first-party
+from tcex.api.tc.v3.artifacts.artifact import Artifact, Artifacts
+from tcex.api.tc.v3.artifacts.artifact_model import ArtifactModel
+from tcex.tokens import Tokens
+from tests.tokens.tokens_helpers import run_in_trigger_thread
+
+
+class MockSession:
+    """Session that returns the posted artifact with an id."""
+
+    def __init__(self, tokens: Tokens = None):
+        """Initialize Class Properties."""
+        self.in_flight = 0
+        self.lock = threading.Lock()
+        self.max_in_flight = 0
+        self.tokens = tokens
+        self.tokens_sent = []
+
+    def request(self, method, url, data=None, **kwargs):  # pylint: disable=unused-argument
+        """Return a response for the request."""
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            if self.tokens is not None:
+                # the token the auth would add to the request
+                self.tokens_sent.append(self.tokens.token)
+        time.sleep(0.01)
+
+        body = json.loads(data)
+        response = Response()
+        response.headers['Content-Type'] = 'application/json'
+        response.request = PreparedRequest()
+        response.request.prepare(method=method, url=f'https://tc.example.com{url}', data=data)
+        if body.get('summary') == 'fail':
+            response.status_code = 400
+            response._content = b'{"status": "Error", "message": "failed"}'
+        else:
+            response.status_code = 200
+            body['id'] = int(body['summary'].split('.')[-1]) + 1
+            response._content = json.dumps({'status': 'Success', 'data': body}).encode()
+
+        with self.lock:
+            self.in_flight -= 1
+        return response
+
+
+class PageSession:
+    """Session that returns pages of artifacts."""
+
+    def __init__(self, pages: int, fail_page: int = None, tokens: Tokens = None):
+        """Initialize Class Properties."""
+        self.fail_page = fail_page
+        self.pages = pages
+        self.requested = []
+        self.tokens = tokens
+        self.tokens_sent = []
+
+    def request(self, method, url, **kwargs):  # pylint: disable=unused-argument
+        """Return the page for the request."""
+        page = int(url.split('page=')[-1]) if 'page=' in url else 0
+        self.requested.append(page)
+        if self.tokens is not None:
+            # the token the auth would add to the request
+            self.tokens_sent.append(self.tokens.token)
+        time.sleep(0.01)
+
+        content = {
+            'status': 'Success',
+            'data': [{'id': page * 10 + i, 'summary': f'1.1.1.{i}'} for i in range(10)],
+        }
+        if page + 1 < self.pages:
+            content['next'] = f'https://tc.example.com/v3/artifacts?page={page + 1}'
+
+        response = Response()
+        response.headers['Content-Type'] = 'application/json'
+        response.request = PreparedRequest()
+        response.request.prepare(method=method, url=f'https://tc.example.com{url}')
+        response.status_code = 400 if page == self.fail_page else 200
+        response._content = json.dumps(content).encode()
+        return response
+
+
+class RateLimiter:
+    """Rate limiter that counts the acquired requests."""
+
+    def __init__(self):
+        """Initialize Class Properties."""
+        self.count = 0
+
+    def acquire(self):
+        """Count the request."""
+        self.count += 1
+
+
+class TestObjectCollectionABC:
+    """Test the TcEx API V3 Object Collection Module."""
+
+    @staticmethod
+    def test_create_many():
+        """Test creating objects concurrently with per item results."""
+        session = MockSession()
+        rate_limiter = RateLimiter()
+
+        items = [{'case_id': 1, 'summary': f'1.1.1.{i}', 'type': 'Address'} for i in range(20)]
+        items[3] = {'case_id': 1, 'summary': 'fail', 'type': 'Address'}
+        items[5] = ArtifactModel(case_id=1, summary='1.1.1.5', type='Address')
+        items[7] = Artifact(session=session, case_id=1, summary='1.1.1.7', type='Address')
+
+        results = list(
+            Artifacts(session=session).create_many(
+                iter(items), max_workers=4, rate_limiter=rate_limiter
+            )
+        )
+
+        assert sorted(r.index for r in results) == list(range(20))
+        assert 1 < session.max_in_flight <= 4
+        assert rate_limiter.count == 20
+
+        for result in results:
+            if result.index == 3:
+                assert result.ok is False
+                assert isinstance(result.error, RuntimeError)
+            else:
+                assert result.ok is True
+                assert result.obj.model.id == result.index + 1
+        assert next(r.obj for r in results if r.index == 7) is items[7]
+
+    @staticmethod
+    def test_update_many():
+        """Test updates of objects without an id and invalid items are reported."""
+        session = MockSession()
+        items = [
+            {'id': 1, 'case_id': 1, 'summary': '1.1.1.0', 'type': 'Address'},
+            {'case_id': 1, 'summary': '1.1.1.1', 'type': 'Address'},
+            'invalid',
+        ]
+
+        results = sorted(Artifacts(session=session).update_many(items), key=lambda r: r.index)
+
+        assert [r.ok for r in results] == [True, False, False]
+        assert results[0].obj.model.id == 1
+        assert isinstance(results[1].error, RuntimeError)
+        assert results[2].obj is None
+
+    @staticmethod
+    def test_create_many_trigger_token():
+        """Test the objects are created with the token of the calling trigger thread."""
+        tokens = Tokens('https://tc.example.com/api')
+        session = MockSession(tokens)
+        items = [{'case_id': 1, 'summary': f'1.1.1.{i}', 'type': 'Address'} for i in range(10)]
+        try:
+            tokens.register_token(123, 'trigger-token', int(time.time()) + 3_600)
+            results = run_in_trigger_thread(
+                lambda: list(Artifacts(session=session).create_many(items, max_workers=4))
+            )
+        finally:
+            tokens.shutdown = True
+
+        assert all(r.ok for r in results)
+        assert [t and t.value for t in session.tokens_sent] == ['trigger-token'] * 10
+
+    @staticmethod
+    @pytest.mark.parametrize('prefetch', [0, 1, 3])
+    def test_iterate_prefetch(prefetch):
+        """Test all pages are returned in order with and without prefetching."""
+        artifacts = Artifacts(session=PageSession(pages=5))
+        artifacts.prefetch = prefetch
+        assert [a.model.id for a in artifacts] == list(range(50))
+
+    @staticmethod
+    def test_iterate_prefetch_ahead():
+        """Test pages are fetched ahead of the consumer, bounded by the prefetch depth."""
+        session = PageSession(pages=20)
+        artifacts = Artifacts(session=session)
+        artifacts.prefetch = 2
+        threads = set(threading.enumerate())
+
+        iterator = iter(artifacts)
+        next(iterator)
+        time.sleep(0.2)
+        # the page being consumed, the prefetched pages, and the page waiting to be queued
+        assert session.requested == [0, 1, 2, 3]
+
+        # closing the generator stops the fetch thread
+        iterator.close()
+        time.sleep(0.3)
+        assert session.requested == [0, 1, 2, 3]
+        assert set(threading.enumerate()) <= threads
+
+    @staticmethod
+    def test_iterate_prefetch_trigger_token():
+        """Test the pages are fetched with the token of the consuming trigger thread."""
+        tokens = Tokens('https://tc.example.com/api')
+        session = PageSession(pages=5, tokens=tokens)
+        artifacts = Artifacts(session=session)
+        artifacts.prefetch = 2
+        try:
+            tokens.register_token(123, 'trigger-token', int(time.time()) + 3_600)
+            ids = run_in_trigger_thread(lambda: [a.model.id for a in artifacts])
+        finally:
+            tokens.shutdown = True
+
+        assert ids == list(range(50))
+        assert [t and t.value for t in session.tokens_sent] == ['trigger-token'] * 5
+
+    @staticmethod
+    def test_iterate_prefetch_error():
+        """Test request errors on the fetch thread are raised to the consumer."""
+        artifacts = Artifacts(session=PageSession(pages=5, fail_page=2))
+        artifacts.prefetch = 2
+
+        ids = []
+        with pytest.raises(RuntimeError):
+            for artifact in artifacts:
+                ids.append(artifact.model.id)
+        assert ids == list(range(20))
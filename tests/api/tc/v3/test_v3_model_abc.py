@@ -0,0 +1,82 @@
+"""Test the TcEx API V3 Base Model Module."""
+# third-party
+import pytest
+
+# first-party
+from tcex.api.tc.v3.cases.case_model import CaseModel
+from tcex.api.tc.v3.indicators.indicator_model import IndicatorModel
+from tcex.api.tc.v3.tags.tag_model import TagModel
+
+INDICATOR_DATA = {
+    'id': 1,
+    'type': 'Address',
+    'ip': '1.1.1.1',
+    'rating': 3,
+    'tags': {'data': [{'id': 1, 'name': 'pytest-1'}, {'id': 2, 'name': 'pytest-2'}]},
+    'attributes': {'data': [{'id': 3, 'type': 'Description', 'value': 'pytest'}]},
+}
+
+
+class TestV3ModelABC:
+    """Test the TcEx API V3 Base Model Module."""
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        'update,expected',
+        [
+            (lambda m: None, False),
+            (lambda m: setattr(m, 'rating', 3), False),
+            (lambda m: setattr(m, 'rating', 4), True),
+            (lambda m: m.tags.data.append(TagModel(name='pytest-3')), True),
+            (lambda m: m.tags.data.pop(), True),
+            (lambda m: setattr(m.tags.data[0], 'name', 'pytest-updated'), True),
+            (lambda m: setattr(m.attributes.data[0], 'value', 'pytest-updated'), True),
+        ],
+    )
+    def test_v3_model_updated(update, expected):
+        """Test the model reports changes made after construction."""
+        model = IndicatorModel(**INDICATOR_DATA)
+        update(model)
+        assert model.updated is expected
+
+    @staticmethod
+    def test_v3_model_updated_body():
+        """Test tracking changes doesn't change the generated body."""
+        model = IndicatorModel(**INDICATOR_DATA)
+        model.rating = 5
+        # pylint: disable=protected-access
+        assert model._dirty == {'rating': 3}
+        assert model.gen_body('PUT') == IndicatorModel(**{**INDICATOR_DATA, 'rating': 5}).gen_body(
+            'PUT'
+        )
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        'model',
+        [
+            IndicatorModel(**INDICATOR_DATA),
+            IndicatorModel(**{**INDICATOR_DATA, 'id': None}),
+            TagModel(name='pytest'),
+            TagModel(id=1, name='pytest'),
+            CaseModel(id=0, name='pytest', severity='Low', status='Open'),
+        ],
+    )
+    def test_v3_model_body_plan(model):
+        """Test the cached body plan matches the field inclusion rules."""
+        # pylint: disable=protected-access
+        for method in ['POST', 'PUT']:
+            for mode in [None, 'append', 'delete', 'replace']:
+                for nested in [False, True]:
+                    plan = model._body_plan(method, mode, nested)
+                    assert model._body_plan(method, mode, nested) is plan
+
+                    for name, value in model:
+                        if plan[name] is None:
+                            continue
+                        key, property_, include = plan[name]
+                        for value_ in [value, None, 0, '', 'pytest']:
+                            assert bool(include and value_) is bool(
+                                model._calculate_field_inclusion(
+                                    key, method, mode, nested, property_, value_
+                                )
+                            )
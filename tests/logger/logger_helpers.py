@@ -0,0 +1,43 @@
+"""Test helpers for the TcEx logger modules."""
+# standard library
+import logging
+import threading
+from types import SimpleNamespace
+
+
+class MockResponse:
+    """Mock Response that fails when the body is decoded (e.g., for a disabled log message)."""
+
+    content = b'{}'
+    url = 'https://tc/v2/indicators'
+
+    def __init__(self, status_code: int = 200) -> None:
+        """Initialize Class Properties."""
+        self.ok = status_code < 400
+        self.request = SimpleNamespace(method='get', url=self.url)
+        self.status_code = status_code
+
+    @property
+    def text(self) -> str:
+        """Return the response text."""
+        raise AssertionError('response text decoded while logging is disabled')
+
+
+class RecordHandler(logging.Handler):
+    """Handler that stores the emitted records and the thread that emitted them."""
+
+    def __init__(self, level: int = logging.NOTSET) -> None:
+        """Initialize Class Properties."""
+        super().__init__(level)
+        self.records = []
+        self.thread_idents = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Store the record."""
+        self.records.append(record)
+        self.thread_idents.append(threading.current_thread().ident)
+
+    @property
+    def messages(self) -> list:
+        """Return the messages of the emitted records."""
+        return [r.getMessage() for r in self.records]
@@ -0,0 +1,121 @@
+"""Test the TcEx API Handler shipper."""
+# standard library
+import gzip
+import json
+import logging
+import threading
+
+# first-party
+from tcex.logger.api_handler import ApiHandler, ApiHandlerFormatter
+from tests.logger.logger_helpers import MockResponse
+
+
+class MockSession:
+    """Mock Session for the logs endpoint."""
+
+    def __init__(
+        self, status_codes: list = None, accept_gzip: bool = True, reject_gzip_status: int = 415
+    ) -> None:
+        """Initialize Class Properties."""
+        self.accept_gzip = accept_gzip
+        self.encodings = []
+        self.reject_gzip_status = reject_gzip_status
+        self.posted = threading.Event()
+        self.posts = []
+        self.status_codes = list(status_codes or [])
+
+    def post(self, url: str, data: bytes, headers: dict) -> MockResponse:
+        """Handle POST requests."""
+        assert url == '/v2/logs/app'
+        self.encodings.append(headers.get('Content-Encoding'))
+        if headers.get('Content-Encoding') == 'gzip':
+            if not self.accept_gzip:
+                return MockResponse(self.reject_gzip_status)
+            data = gzip.decompress(data)
+
+        # log events logged while shipping are not shipped
+        logging.getLogger('tcex-pytest-api').info('posting log events')
+
+        status_code = self.status_codes.pop(0) if self.status_codes else 200
+        if status_code == 200:
+            self.posts.append([e['message'] for e in json.loads(data)])
+            self.posted.set()
+        return MockResponse(status_code)
+
+
+def _handler(session: MockSession, **kwargs) -> ApiHandler:
+    """Return an API handler added to a test logger."""
+    handler = ApiHandler(session, **kwargs)
+    handler.setFormatter(ApiHandlerFormatter())
+    logger = logging.getLogger('tcex-pytest-api')
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    logger.handlers = [handler]
+    return handler
+
+
+class TestApiHandlerShipper:
+    """Test the TcEx API Handler shipper."""
+
+    @staticmethod
+    def test_api_handler_shipper():
+        """Test log events are shipped in the background on error and flush limit."""
+        session = MockSession()
+        handler = _handler(session, flush_limit=3, flush_interval=60, backoff_factor=0)
+        logger = logging.getLogger('tcex-pytest-api')
+
+        def _log_thread():
+            logger.info('info from thread')
+
+        thread = threading.Thread(target=_log_thread)
+        thread.start()
+        thread.join()
+        logger.error('error')
+        assert session.posted.wait(5)
+        assert session.posts == [['info from thread', 'error']]
+
+        session.posted.clear()
+        for i in range(3):
+            logger.info(f'info {i}')
+        assert session.posted.wait(5)
+
+        handler.close()
+        assert session.posts == [['info from thread', 'error'], ['info 0', 'info 1', 'info 2']]
+        assert handler.dropped == 0
+
+        # compression is opt-in
+        assert set(session.encodings) == {None}
+
+    @staticmethod
+    def test_api_handler_shipper_retry():
+        """Test failed posts are retried and compression falls back when not supported."""
+        session = MockSession(status_codes=[500, 503], accept_gzip=False, reject_gzip_status=422)
+        handler = _handler(session, flush_interval=60, retries=2, backoff_factor=0, compress=True)
+        logging.getLogger('tcex-pytest-api').info('info')
+        handler.close()
+
+        assert session.posts == [['info']]
+        assert handler.compress is False
+        assert session.encodings == ['gzip', None, None, None]
+
+        # events are dropped after the retries are exhausted
+        session = MockSession(status_codes=[500, 500])
+        handler = _handler(session, flush_interval=60, retries=1, backoff_factor=0)
+        logging.getLogger('tcex-pytest-api').info('info')
+        handler.close()
+        assert not session.posts
+        assert handler.dropped == 1
+
+    @staticmethod
+    def test_api_handler_shipper_buffer():
+        """Test the buffer is bounded and the oldest events are dropped."""
+        session = MockSession()
+        handler = _handler(session, flush_limit=100, flush_interval=60, max_entries=5)
+        handler.in_token_renewal = True
+        for i in range(8):
+            logging.getLogger('tcex-pytest-api').info(f'info {i}')
+        assert handler.dropped == 3
+
+        handler.in_token_renewal = False
+        handler.close()
+        assert session.posts == [[f'info {i}' for i in range(3, 8)]]
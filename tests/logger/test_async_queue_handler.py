@@ -0,0 +1,127 @@
+"""Test the TcEx Async Queue Handler Module."""
+# standard library
+import logging
+import os
+import threading
+
+# first-party
+from tcex.logger.async_queue_handler import AsyncQueueHandler
+from tcex.logger.logger import Logger  # pylint: disable=no-name-in-module
+from tests.logger.logger_helpers import RecordHandler
+
+
+class TestAsyncQueueHandler:
+    """Test the TcEx Async Queue Handler Module."""
+
+    @staticmethod
+    def test_async_queue_handler_logger(tmp_path):
+        """Test the existing and later added handlers run on the writer thread."""
+        logger = Logger(logger_name='tcex-pytest-async')
+        handler = RecordHandler()
+        handler.set_name('records')
+        logger._add_handler(handler)  # pylint: disable=protected-access
+
+        logger.enable_async(queue_size=100)
+        try:
+            assert logger.handler_exist('records')
+            assert [h.get_name() for h in logger.log.handlers] == ['async']
+
+            # the thread file handler routes records on the thread_key of the logging thread
+            logger.add_thread_file_handler(
+                name='thread-file',
+                filename='trigger.log',
+                level='debug',
+                path=str(tmp_path),
+                handler_key='trigger-1',
+                thread_key='trigger_id',
+            )
+
+            def _log_trigger(trigger_id: str):
+                threading.current_thread().trigger_id = trigger_id
+                logger.log.info(f'event for {trigger_id}')
+
+            for trigger_id in ['trigger-1', 'trigger-2']:
+                thread = threading.Thread(target=_log_trigger, args=(trigger_id,))
+                thread.start()
+                thread.join()
+            logger.log.info('message %s', 1)
+        finally:
+            logger.disable_async()
+
+        # queued events are written when async is disabled
+        assert handler.messages == [
+            'event for trigger-1',
+            'event for trigger-2',
+            'message 1',
+        ]
+        assert threading.get_ident() not in handler.thread_idents
+        with open(os.path.join(tmp_path, 'trigger.log')) as fh:
+            contents = fh.read()
+        assert 'event for trigger-1' in contents
+        assert 'event for trigger-2' not in contents
+
+        # handlers are restored on the logger
+        assert {h.get_name() for h in logger.log.handlers} == {'records', 'thread-file-router'}
+        logger.shutdown()
+
+    @staticmethod
+    def test_async_queue_handler_level(tmp_path):
+        """Test records below the level of every handler are not queued."""
+        logger = Logger(logger_name='tcex-pytest-async-level')
+        handler = RecordHandler()
+        handler.set_name('records')
+        handler.setLevel(logging.INFO)
+        logger._add_handler(handler)  # pylint: disable=protected-access
+
+        logger.enable_async(queue_size=100)
+        async_handler = logger.log.handlers[0]
+        try:
+            assert async_handler.level == logging.INFO
+            async_handler.stop()
+            logger.log.debug('debug message')
+            assert async_handler.queue.empty()
+            async_handler.start()
+
+            # the level follows the handlers as they are added and updated
+            logger.add_thread_file_handler(
+                name='thread-file',
+                filename='trigger.log',
+                level='debug',
+                path=str(tmp_path),
+                handler_key='trigger-1',
+                thread_key='trigger_id',
+            )
+            assert async_handler.level == logging.DEBUG
+            logger.remove_handler_by_name('thread-file')
+            assert async_handler.level == logging.INFO
+            logger.update_handler_level('error')
+            assert async_handler.level == logging.ERROR
+            logger.log.warning('warning message')
+            logger.log.error('error message')
+        finally:
+            logger.disable_async()
+
+        assert handler.messages == ['error message']
+        logger.shutdown()
+
+    @staticmethod
+    def test_async_queue_handler_overflow():
+        """Test the overflow policies."""
+        record = logging.LogRecord('tcex', logging.DEBUG, __file__, 1, 'debug', None, None)
+
+        # drop-debug drops debug records when the queue is full
+        handler = AsyncQueueHandler(queue_size=1, overflow='drop-debug')
+        handler.handle(record)
+        handler.handle(record)
+        assert handler.queue.qsize() == 1
+        assert handler.dropped == 1
+
+        # sample keeps one of every sample_rate debug/info records
+        handler = AsyncQueueHandler(queue_size=1, overflow='sample', sample_rate=3)
+        # pylint: disable=protected-access
+        assert [handler._drop(record) for _ in range(6)] == [True, True, False] * 2
+        record.levelno = logging.WARNING
+        assert handler._drop(record) is False
+
+        # block never drops
+        assert AsyncQueueHandler(overflow='block')._drop(record) is False
@@ -0,0 +1,62 @@
+"""Test lazy log message formatting on the request hot paths."""
+# standard library
+import logging
+from types import SimpleNamespace
+
+# first-party
+from tcex.api.tc.v2.threat_intelligence.tcex_ti_tc_request import TiTcRequest
+from tcex.api.tc.v3.object_abc import ObjectABC
+from tcex.api.tc.v3.object_collection_abc import ObjectCollectionABC
+from tests.logger.logger_helpers import MockResponse
+
+
+class MockSession:
+    """Mock Session that returns the mock response."""
+
+    def get(self, url: str, params: dict) -> MockResponse:  # pylint: disable=unused-argument
+        """Handle GET requests."""
+        return MockResponse()
+
+
+class TestLazyLogging:
+    """Test lazy log message formatting on the request hot paths."""
+
+    @staticmethod
+    def test_lazy_logging_info_level(caplog):
+        """Test responses are not decoded for log messages below the logger level."""
+        logger = logging.getLogger('tcex')
+        level = logger.level
+        logger.setLevel(logging.INFO)
+        try:
+            owner = SimpleNamespace(log=logger)
+            ObjectABC.log_response_text(owner, MockResponse())
+            ObjectCollectionABC.log_response_text(owner, MockResponse())
+
+            ti_request = TiTcRequest(MockSession())
+            for _ in range(3):
+                ti_request._get('/v2/indicators')  # pylint: disable=protected-access
+        finally:
+            logger.setLevel(level)
+
+        assert not caplog.records
+
+    @staticmethod
+    def test_lazy_logging_debug_level(caplog):
+        """Test the deferred messages are formatted when the level is enabled."""
+        logger = logging.getLogger('tcex')
+        level = logger.level
+        logger.setLevel(logging.DEBUG)
+        try:
+            with caplog.at_level(logging.DEBUG, logger='tcex'):
+                # trace is disabled, so the response text is not decoded
+                ti_request = TiTcRequest(MockSession())
+                ti_request._get('/v2/indicators')  # pylint: disable=protected-access
+        finally:
+            logger.setLevel(level)
+
+        assert caplog.messages[-1] == (
+            'Method: (GET), Params: ({\'createActivityLog\': \'false\'}), '
+            'Status Code: 200, URL: (https://tc/v2/indicators)'
+        )
+        # the record reports the request method, not a logging helper
+        assert caplog.records[-1].funcName == '_get'
@@ -0,0 +1,116 @@
+"""Test the TcEx Sensitive Filter Module."""
+# standard library
+import logging
+import time
+
+# first-party
+from tcex.logger.logger import Logger  # pylint: disable=no-name-in-module
+from tcex.logger.sensitive_filter import SensitiveFilter
+from tests.logger.logger_helpers import RecordHandler
+
+
+class TestSensitiveFilter:
+    """Test the TcEx Sensitive Filter Module."""
+
+    @staticmethod
+    def test_sensitive_filter_replace():
+        """Test all registered values are masked in a single pass."""
+        sensitive_filter = SensitiveFilter()
+        assert sensitive_filter.replace('no secrets registered') == 'no secrets registered'
+
+        for value in ['secret', 'secret-token', 'a.b*c', '', None]:
+            sensitive_filter.add(value)
+
+        assert sensitive_filter.replace('secret-token and secret and a.b*c and abbc') == (
+            '*** and *** and *** and abbc'
+        )
+
+        # values added later are masked
+        sensitive_filter.add('password')
+        assert sensitive_filter.replace('password secret') == '*** ***'
+
+    @staticmethod
+    def test_sensitive_filter_expire():
+        """Test expired values are evicted after the grace period."""
+        sensitive_filter = SensitiveFilter(expire_grace=0)
+        sensitive_filter.add('static-secret')
+        sensitive_filter.add('expired-token', expires=int(time.time()) - 1)
+        sensitive_filter.add('valid-token', expires=int(time.time()) + 3_600)
+
+        assert sensitive_filter.replace('expired-token valid-token static-secret') == (
+            'expired-token *** ***'
+        )
+
+        sensitive_filter.expire('valid-token')
+        assert sensitive_filter.replace('valid-token static-secret') == 'valid-token ***'
+
+    @staticmethod
+    def test_sensitive_filter_expire_added_again():
+        """Test an evicted value added again without an expiration keeps its expiration."""
+        sensitive_filter = SensitiveFilter(expire_grace=0)
+        sensitive_filter.add('expired-token', expires=int(time.time()) - 1)
+        assert sensitive_filter.replace('expired-token') == 'expired-token'
+
+        # e.g., the expired token wrapped in Sensitive again
+        sensitive_filter.add('expired-token')
+        assert sensitive_filter.replace('expired-token') == 'expired-token'
+
+        # a new expiration replaces the original expiration
+        sensitive_filter.add('expired-token', expires=int(time.time()) + 3_600)
+        sensitive_filter.add('expired-token')
+        assert sensitive_filter.replace('expired-token') == '***'
+
+    @staticmethod
+    def test_sensitive_filter_level():
+        """Test records below the handler level are not masked."""
+        sensitive_filter = SensitiveFilter()
+        sensitive_filter.add('secret')
+
+        logger = logging.getLogger('tcex-pytest-sensitive')
+        logger.propagate = False
+        logger.setLevel(logging.DEBUG)
+        logger.addFilter(sensitive_filter)
+        handler = RecordHandler(logging.INFO)
+        logger.addHandler(handler)
+        try:
+            record = logger.makeRecord(
+                logger.name, logging.DEBUG, __file__, 1, 'debug %s', ('secret',), None
+            )
+            assert sensitive_filter.filter(record) is True
+            assert record.args == ('secret',)
+
+            logger.info('info %s', 'secret')
+            assert handler.messages == ['info ***']
+        finally:
+            logger.removeHandler(handler)
+            logger.removeFilter(sensitive_filter)
+
+    @staticmethod
+    def test_sensitive_filter_level_handlers_changed():
+        """Test the cached handler level is refreshed when the logger handlers change."""
+        sensitive_filter = SensitiveFilter()
+        sensitive_filter.add('secret')
+
+        logger = Logger(logger_name='tcex-pytest-sensitive-changed')
+        logger.log.propagate = False
+        logger.log.addFilter(sensitive_filter)
+        info_handler = RecordHandler(logging.INFO)
+        logger._add_handler(info_handler)  # pylint: disable=protected-access
+        try:
+            logger.log.debug('debug %s', 'secret')
+            assert info_handler.messages == []
+
+            # a handler added with a lower level writes the records masked
+            debug_handler = RecordHandler(logging.DEBUG)
+            logger._add_handler(debug_handler)  # pylint: disable=protected-access
+            logger.log.debug('debug %s', 'secret')
+            assert debug_handler.messages == ['debug ***']
+
+            # the level is also refreshed when the level of the handlers is updated
+            logger._remove_handler(debug_handler)  # pylint: disable=protected-access
+            logger.update_handler_level('trace')
+            logger.log.trace('trace %s', 'secret')
+            assert info_handler.messages == ['trace ***']
+        finally:
+            logger.log.removeFilter(sensitive_filter)
+            logger.shutdown()
@@ -0,0 +1,66 @@
+"""Test the TcEx Thread Routing File Handler Module."""
+# standard library
+import os
+import threading
+
+# first-party
+from tcex.logger.logger import Logger  # pylint: disable=no-name-in-module
+from tcex.logger.thread_routing_file_handler import ThreadRoutingFileHandler
+
+
+def _log_trigger(logger: Logger, trigger_id: int, message: str) -> None:
+    """Log the message on a thread for the trigger id."""
+
+    def _target():
+        threading.current_thread().trigger_id = trigger_id
+        logger.log.info(message)
+
+    thread = threading.Thread(target=_target)
+    thread.start()
+    thread.join()
+
+
+class TestThreadRoutingFileHandler:
+    """Test the TcEx Thread Routing File Handler Module."""
+
+    @staticmethod
+    def test_thread_routing_file_handler(tmp_path):
+        """Test events are written only to the file of the trigger and open files are limited."""
+        logger = Logger(logger_name='tcex-pytest-routing')
+        for trigger_id in range(5):
+            logger.add_thread_file_handler(
+                name=f'trigger-{trigger_id}',
+                filename=f'trigger-id-{trigger_id}.log',
+                level='info',
+                path=str(tmp_path),
+                handler_key=trigger_id,
+                mode='w',
+                thread_key='trigger_id',
+            )
+
+        # a single routing handler is added to the logger
+        router = logger.log.handlers[0]
+        assert isinstance(router, ThreadRoutingFileHandler)
+        assert len(logger.log.handlers) == 1
+        assert logger.handler_exist('trigger-3')
+        router.max_open_files = 2
+
+        for trigger_id in [0, 1, 2, 0, 3, 4, 0]:
+            _log_trigger(logger, trigger_id, f'event for trigger {trigger_id}')
+        logger.log.info('not logged to a trigger file')
+
+        # pylint: disable=protected-access
+        assert list(router._open_files) == ['trigger-4', 'trigger-0']
+        assert sum(h.stream is not None for h in router.handlers.values()) == 2
+
+        logger.remove_handler_by_name('trigger-4')
+        assert not logger.handler_exist('trigger-4')
+        _log_trigger(logger, 4, 'event after remove')
+
+        for trigger_id in range(5):
+            with open(os.path.join(tmp_path, f'trigger-id-{trigger_id}.log')) as fh:
+                lines = fh.read().splitlines()
+            expected = [f'event for trigger {trigger_id}'] * (3 if trigger_id == 0 else 1)
+            assert [line.split(' - ')[3].split(' (')[0] for line in lines] == expected
+
+        logger.shutdown()
@@ -0,0 +1,71 @@
+"""Test the TcEx Trace Logger Module."""
+# standard library
+import logging
+import timeit
+from inspect import getframeinfo, stack
+
+# first-party
+from tcex.logger.trace_logger import TraceLogger
+from tests.logger.logger_helpers import RecordHandler
+
+
+class InspectTraceLogger(TraceLogger):
+    """Trace Logger using the previous inspect.stack() caller resolution."""
+
+    def findCaller(self, stack_info=False, stacklevel=1):  # pylint: disable=arguments-differ
+        """Find the caller for the current log event."""
+        depth = 3
+        while True:
+            caller = getframeinfo(stack()[depth][0])
+            if caller.function != 'trace' or depth >= 6:
+                break
+            depth += 1
+        return (caller.filename, caller.lineno, caller.function, None)
+
+
+def _logger(logger_class: type, name: str) -> logging.Logger:
+    """Return a logger of the provided class with a record handler."""
+    logger = logger_class(name)
+    logger.setLevel(logging.TRACE)
+    logger.addHandler(RecordHandler())
+    return logger
+
+
+def _log_calls(logger: logging.Logger) -> None:
+    """Log a message with each logger method."""
+    logger.trace('trace')
+    logger.debug('debug')
+    logger.info('info')
+    logger.log(logging.WARNING, 'log')
+    logger.error('error')
+
+
+class TestTraceLogger:
+    """Test the TcEx Trace Logger Module."""
+
+    @staticmethod
+    def test_trace_logger_find_caller():
+        """Test the caller matches the previous inspect based implementation."""
+        logger = _logger(TraceLogger, 'tcex-pytest-fast')
+        inspect_logger = _logger(InspectTraceLogger, 'tcex-pytest-inspect')
+
+        _log_calls(logger)
+        _log_calls(inspect_logger)
+
+        records = logger.handlers[0].records
+        inspect_records = inspect_logger.handlers[0].records
+        assert [r.funcName for r in records] == ['_log_calls'] * 5
+        assert [(r.pathname, r.lineno, r.funcName) for r in records] == [
+            (r.pathname, r.lineno, r.funcName) for r in inspect_records
+        ]
+        assert records[0].levelname == 'TRACE'
+
+    @staticmethod
+    def test_trace_logger_find_caller_performance():
+        """Test the caller resolution is significantly faster than inspect.stack()."""
+        logger = _logger(TraceLogger, 'tcex-pytest-fast')
+        inspect_logger = _logger(InspectTraceLogger, 'tcex-pytest-inspect')
+
+        fast = min(timeit.repeat(lambda: logger.debug('debug'), number=100, repeat=3))
+        slow = min(timeit.repeat(lambda: inspect_logger.debug('debug'), number=100, repeat=3))
+        assert slow / fast > 5
@@ -0,0 +1,245 @@
+"""Test the TcEx asyncio Session Modules."""
+# standard library
+import asyncio
+import json
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# third-party
+import pytest
+
+# first-party
+from tcex.input.field_types.sensitive import Sensitive
+from tcex.sessions.auth.tc_auth import TcAuth
+from tcex.tokens import Tokens
+
+httpx = pytest.importorskip('httpx')
+
+# first-party
+from tcex.sessions.async_external_session import (  # noqa: E402; pylint: disable=C0413
+    AsyncExternalSession,
+)
+from tcex.sessions.async_tc_session import AsyncTcSession  # noqa: E402; pylint: disable=C0413
+from tests.tokens.tokens_helpers import (  # noqa: E402; pylint: disable=C0413
+    run_in_trigger_thread,
+)
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+    """Request handler that fails requests based on the path."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def _respond(self, status_code: int, headers: dict = None):
+        """Return a JSON response with the request data."""
+        body = json.dumps(
+            {
+                'headers': {k.lower(): v for k, v in self.headers.items()},
+                'method': self.command,
+                'path': self.path,
+            }
+        ).encode()
+        self.send_response(status_code)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Return a response based on the path.
+
+        * /fail/<status code>/<count>: fail the first <count> requests to the path.
+        * /slow: wait before responding.
+        """
+        server = self.server
+        with server.lock:
+            server.requests.append(self.path)
+            count = server.requests.count(self.path)
+
+        if self.path.startswith('/fail/'):
+            _, _, status_code, fail_count = self.path.split('/')
+            if count <= int(fail_count):
+                headers = {'Retry-After': '1'} if status_code == '429' else None
+                self._respond(int(status_code), headers)
+                return
+        elif self.path.startswith('/slow'):
+            with server.lock:
+                server.in_flight += 1
+                server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            time.sleep(0.1)
+            with server.lock:
+                server.in_flight -= 1
+        self._respond(200)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Don't log requests."""
+
+
+class Server(ThreadingHTTPServer):
+    """HTTP server accepting many concurrent connections."""
+
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self):
+        """Initialize Class Properties."""
+        super().__init__(('127.0.0.1', 0), RequestHandler)
+        self.in_flight = 0
+        self.lock = threading.Lock()
+        self.max_in_flight = 0
+        self.requests = []
+        self.url = f'http://127.0.0.1:{self.server_port}'
+
+
+@pytest.fixture(name='server')
+def fixture_server():
+    """Return a local HTTP server."""
+    server = Server()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class BlockingTokens:
+    """Token module that blocks while the token is renewed."""
+
+    def __init__(self, delay: float):
+        """Initialize Class Properties."""
+        self.delay = delay
+
+    @property
+    def token(self) -> Sensitive:
+        """Return the token, blocking for the renewal delay."""
+        time.sleep(self.delay)
+        return Sensitive('renewed-token')
+
+
+class TestSessionAsync:
+    """Test the TcEx asyncio Session Modules."""
+
+    @staticmethod
+    def test_session_tc_async_auth(server):
+        """Test the base URL and the HMAC/token auth headers of the TC session."""
+
+        async def _requests():
+            auth = TcAuth('access-id', Sensitive('secret-key'))
+            async with AsyncTcSession(
+                auth, f'{server.url}/api/', user_agent={'User-Agent': 'tcex'}
+            ) as session:
+                return await session.get('/v3/cases', params={'tql': 'id=1'})
+
+        response = asyncio.run(_requests())
+        data = response.json()
+        assert data['path'] == '/api/v3/cases?tql=id%3D1'
+        assert data['headers']['user-agent'] == 'tcex'
+        assert data['headers']['authorization'].startswith('TC access-id:')
+        assert abs(int(data['headers']['timestamp']) - time.time()) < 2
+
+        async def _token_request():
+            async with AsyncTcSession(TcAuth(tc_token='token'), server.url) as session:
+                return await session.get('/v3/cases')
+
+        assert asyncio.run(_token_request()).json()['headers']['authorization'] == 'TC-Token token'
+
+    @staticmethod
+    def test_session_tc_async_blocking_token(server):
+        """Test a token module that blocks doesn't block the event loop."""
+
+        async def _ticker() -> float:
+            start = time.monotonic()
+            for _ in range(5):
+                await asyncio.sleep(0.01)
+            return time.monotonic() - start
+
+        async def _requests():
+            async with AsyncTcSession(TcAuth(tc_token=BlockingTokens(0.5)), server.url) as session:
+                return await asyncio.gather(_ticker(), session.get('/v3/cases'))
+
+        ticker_elapsed, response = asyncio.run(_requests())
+        assert response.json()['headers']['authorization'] == 'TC-Token renewed-token'
+        assert ticker_elapsed < 0.4
+
+    @staticmethod
+    def test_session_tc_async_trigger_token(server):
+        """Test the token module resolves the token of the event loop thread (e.g., trigger)."""
+        tokens = Tokens('https://tc.example.com/api')
+
+        async def _requests():
+            async with AsyncTcSession(TcAuth(tc_token=tokens), server.url) as session:
+                return await session.get('/v3/cases')
+
+        try:
+            tokens.register_token(123, 'trigger-token', int(time.time()) + 3_600)
+            response = run_in_trigger_thread(lambda: asyncio.run(_requests()), 123)
+        finally:
+            tokens.shutdown = True
+
+        assert response.json()['headers']['authorization'] == 'TC-Token trigger-token'
+
+    @staticmethod
+    def test_session_tc_async_retry(server):
+        """Test status_forcelist responses are retried and the 401 race condition is retried."""
+
+        async def _requests():
+            async with AsyncTcSession(TcAuth(tc_token='token'), server.url) as session:
+                session.retry(retries=2, backoff_factor=0.01)
+                return [
+                    await session.get('/fail/500/2'),
+                    await session.get('/fail/502/3'),
+                    await session.get('/fail/401/1'),
+                ]
+
+        responses = asyncio.run(_requests())
+        assert [r.status_code for r in responses] == [200, 502, 200]
+        assert server.requests.count('/fail/500/2') == 3
+        assert server.requests.count('/fail/502/3') == 3
+        assert server.requests.count('/fail/401/1') == 2
+
+    @staticmethod
+    def test_session_external_async_too_many_requests(server):
+        """Test a 429 response waits for the too_many_requests_handler and is retried once."""
+
+        async def _requests():
+            async with AsyncExternalSession(server.url) as session:
+                session.too_many_requests_handler = lambda r: float(r.headers['Retry-After']) / 10
+                return await session.get('/fail/429/1'), await session.get('/fail/429/2')
+
+        first, second = asyncio.run(_requests())
+        assert first.status_code == 200
+        assert second.status_code == 429
+        assert server.requests.count('/fail/429/2') == 2
+
+    @staticmethod
+    def test_session_external_async_curl(server, caplog):
+        """Test the curl command is logged with the headers masked."""
+
+        async def _requests():
+            async with AsyncExternalSession(server.url, log_curl=True) as session:
+                return await session.get('/v1/items', headers={'Authorization': 'Bearer secret'})
+
+        with caplog.at_level(logging.DEBUG, logger='tcex'):
+            asyncio.run(_requests())
+
+        curl = [r.getMessage() for r in caplog.records if r.getMessage().startswith('curl')]
+        assert len(curl) == 1
+        assert f'{server.url}/v1/items' in curl[0]
+        assert 'Bearer secret' not in curl[0]
+
+    @staticmethod
+    def test_session_external_async_concurrency(server):
+        """Test concurrent requests share the event loop, bounded by max_connections."""
+
+        async def _requests():
+            async with AsyncExternalSession(server.url, max_connections=20) as session:
+                return await asyncio.gather(*[session.get(f'/slow/{i}') for i in range(200)])
+
+        responses = asyncio.run(_requests())
+
+        assert [r.json()['path'] for r in responses] == [f'/slow/{i}' for i in range(200)]
+        assert 1 < server.max_in_flight <= 20
@@ -0,0 +1,74 @@
+"""Test the TcEx Session Auth Module."""
+# standard library
+import hmac
+import time
+from base64 import b64encode
+from hashlib import sha256
+
+# third-party
+from requests import PreparedRequest
+
+# first-party
+from tcex.input.field_types.sensitive import Sensitive
+from tcex.sessions.auth.hmac_auth import HmacAuth
+from tcex.sessions.auth.tc_auth import TcAuth
+from tcex.sessions.auth.token_auth import TokenAuth
+
+
+def hmac_header(access_id: str, secret_key: str, r: PreparedRequest) -> str:
+    """Return the expected HMAC Authorization header value."""
+    signature = f'{r.path_url}:{r.method}:{r.headers["Timestamp"]}'
+    digest = hmac.new(secret_key.encode(), signature.encode(), digestmod=sha256).digest()
+    return f'TC {access_id}:{b64encode(digest).decode()}'
+
+
+def prepared_request(method: str = 'GET', url: str = '/v3/security/owners') -> PreparedRequest:
+    """Return a prepared request."""
+    r = PreparedRequest()
+    r.prepare(method=method, url=f'https://tc.example.com/api{url}')
+    return r
+
+
+class MockTokens:
+    """Token module that returns the current token."""
+
+    def __init__(self, token: str):
+        """Initialize Class Properties."""
+        self.token = Sensitive(token)
+
+
+class TestSessionAuth:
+    """Test the TcEx Session Auth Module."""
+
+    @staticmethod
+    def test_hmac_auth():
+        """Test the HMAC header matches a signature keyed for each request."""
+        for auth in [
+            HmacAuth('access-id', Sensitive('secret-key')),
+            TcAuth('access-id', Sensitive('secret-key'), 'token'),
+        ]:
+            for method, url in [('GET', '/v3/cases?tql=id%3D1'), ('POST', '/v2/indicators')]:
+                r = auth(prepared_request(method, url))
+                assert abs(int(r.headers['Timestamp']) - time.time()) < 2
+                assert r.headers['Authorization'] == hmac_header('access-id', 'secret-key', r)
+
+            # a new secret key is used for the following requests
+            auth.tc_api_secret_key = Sensitive('new-secret-key')
+            r = auth(prepared_request())
+            assert r.headers['Authorization'] == hmac_header('access-id', 'new-secret-key', r)
+
+    @staticmethod
+    def test_token_auth():
+        """Test the token header is updated when the token is rotated."""
+        tokens = MockTokens('token-1')
+        for auth in [TokenAuth(tokens), TcAuth(tc_token=tokens)]:
+            assert auth(prepared_request()).headers['Authorization'] == 'TC-Token token-1'
+            assert auth(prepared_request()).headers['Authorization'] == 'TC-Token token-1'
+
+            tokens.token = Sensitive('token-2')
+            assert auth(prepared_request()).headers['Authorization'] == 'TC-Token token-2'
+            tokens.token = Sensitive('token-1')
+
+        for tc_token in ['token', Sensitive('token'), lambda: 'token']:
+            auth = TokenAuth(tc_token)
+            assert auth(prepared_request()).headers['Authorization'] == 'TC-Token token'
@@ -0,0 +1,121 @@
+"""Test the TcEx Session Module connection pool."""
+# standard library
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# third-party
+import pytest
+from requests import adapters
+
+# first-party
+from tcex.sessions.tc_session import DEFAULT_POOL_MAXSIZE, TcAdapter, TcSession
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    """HTTP/1.1 request handler that keeps connections open."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Return a JSON response."""
+        body = b'{"status": "Success"}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Don't log requests."""
+
+
+@pytest.fixture(name='base_url')
+def fixture_base_url():
+    """Return the URL of a local HTTP server."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_port}'
+    server.shutdown()
+    server.server_close()
+
+
+def tc_session(url: str, adapter: TcAdapter = None) -> TcSession:
+    """Return a TC session that also uses the pool for the local (http) server."""
+    session = TcSession(auth=None, base_url=url, adapter=adapter)
+    session.mount('http://', session.adapter.share())
+    return session
+
+
+class TestTcSessionPool:
+    """Test the TcEx Session Module connection pool."""
+
+    @staticmethod
+    def test_session_tc_shared_pool(base_url):
+        """Test sessions sharing an adapter reuse the pooled connection."""
+        adapter = TcAdapter()
+        sessions = [tc_session(base_url, adapter) for _ in range(3)]
+        for session in sessions:
+            for _ in range(4):
+                assert session.get('/v3/security/owners').ok
+
+        assert adapter.metrics == {
+            'connections': 1,
+            'requests': 12,
+            'reuse_ratio': round(1 - 1 / 12, 4),
+            'tls_handshakes': 0,
+        }
+        assert sessions[0].metrics == adapter.metrics
+
+    @staticmethod
+    def test_session_tc_share(monkeypatch):
+        """Test share() reuses the pool manager of the adapter without creating a new one."""
+        adapter = TcAdapter()
+        assert adapter.poolmanager.connection_pool_kw['maxsize'] == DEFAULT_POOL_MAXSIZE
+
+        created = []
+
+        def _pool_manager(*args, **kwargs):
+            created.append((args, kwargs))
+            raise AssertionError('A pool manager was created.')
+
+        session = TcSession(auth=None, base_url='https://127.0.0.1', adapter=adapter)
+        monkeypatch.setattr(adapters, 'PoolManager', _pool_manager)
+        session.retry(retries=5)
+
+        shared = session.get_adapter('https://127.0.0.1')
+        assert shared is not adapter
+        assert shared.poolmanager is adapter.poolmanager
+        assert shared.max_retries.total == 5
+        assert not created
+
+    @staticmethod
+    def test_session_tc_separate_pools(base_url):
+        """Test sessions without a shared adapter each open a connection."""
+        sessions = [tc_session(base_url) for _ in range(3)]
+        for session in sessions:
+            for _ in range(4):
+                assert session.get('/v3/security/owners').ok
+
+        for session in sessions:
+            assert session.metrics['connections'] == 1
+            assert session.metrics['requests'] == 4
+
+    @staticmethod
+    def test_session_tc_pool_block(base_url):
+        """Test a blocking pool limits the number of connections opened by threads."""
+        adapter = TcAdapter(pool_maxsize=2, pool_block=True)
+        session = tc_session(base_url, adapter)
+
+        def _requests():
+            for _ in range(5):
+                assert session.get('/v3/security/owners').ok
+
+        threads = [threading.Thread(target=_requests) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert adapter.metrics['requests'] == 30
+        assert adapter.metrics['connections'] <= 2
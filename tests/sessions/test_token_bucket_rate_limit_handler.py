@@ -0,0 +1,225 @@
+"""Test the TokenBucketRateLimitHandler"""
+# standard library
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock, patch
+
+# third-party
+import pytest
+from requests import PreparedRequest, Response
+
+# first-party
+from tcex.sessions.external_session import ExternalSession
+from tcex.sessions.rate_limit_handler import seconds_until
+from tcex.sessions.token_bucket_rate_limit_handler import TokenBucket, TokenBucketRateLimitHandler
+
+
+class WindowHandler(BaseHTTPRequestHandler):
+    """Request handler enforcing a fixed window rate limit."""
+
+    limit = 10
+    window = 0.5
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """Return a 200 response or a 429 response when the limit is exceeded."""
+        server = self.server
+        with server.lock:
+            now = time.monotonic()
+            if now >= server.window_start + self.window:
+                server.window_start = now
+                server.window_count = 0
+            server.window_count += 1
+            remaining = self.limit - server.window_count
+            reset = server.window_start + self.window - now
+
+        if remaining < 0:
+            server.too_many_requests += 1
+            self.send_response(429)
+            self.send_header('Retry-After', '1')
+        else:
+            server.ok += 1
+            self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.send_header('X-RateLimit-Limit', str(self.limit))
+        self.send_header('X-RateLimit-Remaining', str(max(remaining, 0)))
+        self.send_header('X-RateLimit-Reset', f'{reset:.3f}')
+        self.end_headers()
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        """Don't log requests."""
+
+
+@pytest.fixture(name='server')
+def fixture_server():
+    """Return a local HTTP server enforcing a rate limit."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), WindowHandler)
+    server.lock = threading.Lock()
+    server.ok = 0
+    server.too_many_requests = 0
+    server.window_count = 0
+    server.window_start = time.monotonic()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def response(url: str, status_code: int = 200, **headers) -> Response:
+    """Return a response for the url with the provided headers."""
+    r = Response()
+    r.request = PreparedRequest()
+    r.request.prepare(method='GET', url=url)
+    r.headers.update(headers)
+    r.status_code = status_code
+    return r
+
+
+class TestTokenBucketRateLimitHandler:
+    """Test the TokenBucketRateLimitHandler"""
+
+    @staticmethod
+    @patch('time.time', MagicMock(return_value=1600283000))
+    @pytest.mark.parametrize(
+        'value,expected',
+        [
+            (10, 10.0),
+            ('2.5', 2.5),
+            ('3600', 3600.0),
+            (1600284000, 1000.0),
+            ('Wed, 16 Sep 2020 19:04:00 GMT', 40.0),
+            # timestamps and dates in the past
+            (1600282998, 0.0),
+            ('1600282998', 0.0),
+            ('Wed, 16 Sep 2020 18:00:00 GMT', 0.0),
+        ],
+    )
+    def test_seconds_until(value, expected):
+        """Test reset values as seconds, timestamps, and dates."""
+        assert seconds_until(value) == expected
+
+    @staticmethod
+    def test_token_bucket_spacing():
+        """Test concurrent callers are spaced by the rate instead of released at once."""
+        bucket = TokenBucket(rate=50, capacity=1)
+        times = []
+
+        def _acquire():
+            bucket.acquire()
+            times.append(time.monotonic())
+
+        threads = [threading.Thread(target=_acquire) for _ in range(10)]
+        start = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # one token is available and the other 9 are released every 20ms
+        assert time.monotonic() - start >= 0.17
+        times.sort()
+        assert min(b - a for a, b in zip(times, times[1:])) > 0.01
+
+    @staticmethod
+    def test_calibrate():
+        """Test the remaining requests are spread over the rest of the window."""
+        handler = TokenBucketRateLimitHandler()
+        url = 'https://api.example.com/v1/items'
+        # an uncalibrated bucket does not wait
+        assert handler.acquire(url) < 0.01
+
+        handler.post_send(
+            response(url, **{'X-RateLimit-Remaining': '4', 'X-RateLimit-Reset': '0.4'})
+        )
+        bucket = handler.bucket(url)
+        assert bucket.rate == pytest.approx(10)
+        assert handler.last_limit_remaining_value == 4
+
+        start = time.monotonic()
+        for _ in range(3):
+            handler.acquire(url)
+        assert time.monotonic() - start == pytest.approx(0.3, abs=0.05)
+
+        # other hosts have their own bucket
+        assert handler.acquire('https://other.example.com/') < 0.01
+
+    @staticmethod
+    def test_calibrate_past_reset():
+        """Test a reset timestamp in the past (e.g., clock skew) does not stall the bucket."""
+        handler = TokenBucketRateLimitHandler()
+        url = 'https://api.example.com/v1/items'
+        reset = str(int(time.time()) - 2)
+
+        handler.post_send(
+            response(url, **{'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': reset})
+        )
+        assert handler.acquire(url) < 0.01
+        handler.post_send(
+            response(url, **{'X-RateLimit-Remaining': '5', 'X-RateLimit-Reset': reset})
+        )
+        assert handler.acquire(url) < 0.01
+
+    @staticmethod
+    def test_calibrate_in_flight():
+        """Test requests sent, but not yet answered, are taken from the remaining requests."""
+        handler = TokenBucketRateLimitHandler(remaining_threshold=1)
+        url = 'https://api.example.com/v1/items'
+        for _ in range(3):
+            handler.pre_send(response(url).request)
+
+        # 4 remaining, less the threshold and the 2 requests still in flight
+        handler.post_send(response(url, **{'X-RateLimit-Remaining': '4', 'X-RateLimit-Reset': '1'}))
+        assert handler.bucket(url).rate == pytest.approx(1)
+
+        # a failed request is no longer in flight
+        handler.send_error(response(url).request)
+        handler.post_send(response(url, **{'X-RateLimit-Remaining': '4', 'X-RateLimit-Reset': '1'}))
+        assert handler.bucket(url).rate == pytest.approx(3)
+
+    @staticmethod
+    def test_pause():
+        """Test exhausted limits and Retry-After pause all requests to the host."""
+        handler = TokenBucketRateLimitHandler(rate=100)
+        url = 'https://api.example.com/v1/items'
+
+        handler.post_send(response(url, 429, **{'Retry-After': '0.2'}))
+        start = time.monotonic()
+        handler.acquire(url)
+        assert time.monotonic() - start == pytest.approx(0.2, abs=0.05)
+
+        handler.post_send(
+            response(url, **{'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '0.2'})
+        )
+        start = time.monotonic()
+        handler.acquire(url)
+        assert time.monotonic() - start == pytest.approx(0.2, abs=0.05)
+
+    @staticmethod
+    def test_external_session_shared(server):
+        """Test threads sharing the handler stay within the limit of the server."""
+        handler = TokenBucketRateLimitHandler()
+        base_url = f'http://127.0.0.1:{server.server_port}'
+        sessions = []
+        for _ in range(2):
+            session = ExternalSession(base_url)
+            session.rate_limit_handler = handler
+            session.retry(urls=['http://'])
+            sessions.append(session)
+
+        def _requests(session: ExternalSession):
+            for _ in range(6):
+                session.get('/v1/items', tc_is_retry=True)
+
+        threads = [threading.Thread(target=_requests, args=(s,)) for s in sessions * 4]
+        start = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.monotonic() - start
+
+        assert server.ok == 48
+        assert server.too_many_requests <= 1
+        # 48 requests at 10 requests per 0.5s window
+        assert 2 <= elapsed < 4
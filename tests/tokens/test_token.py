@@ -12,31 +12,17 @@ from tcex.input.field_types import Sensitive
 from tcex.pleb.scoped_property import scoped_property
 
 
-def await_token_barrier_enabled(token_service, timeout=120):
-    """Await for token barrier to be enabled"""
-    while token_service._barrier.is_set():
+def await_token_renewal(token_service, key, token, timeout=60):
+    """Await for the token of the key to be renewed (or removed when renewal fails)."""
+    while True:
+        current = token_service.token_map.get(key, {}).get('token')
+        if current is None or current.value != Sensitive(token).value:
+            return
+
         time.sleep(1)
         timeout -= 1
         if timeout <= 0:
-            raise RuntimeError('Timeout expired while waiting for token barrier to be enabled')
-
-
-def await_token_barrier_disabled(token_service, timeout=60):
-    """Await token service to be disabled"""
-    result = token_service._barrier.wait(timeout=timeout)
-
-    if not result:
-        raise RuntimeError('Timeout Expired while waiting for token barrier to be disabled')
-
-
-def await_token_renewal_cycle(token_service, timeout=60):
-    """Await for a token renewal cycle to take place and finish"""
-    # wait until renewal monitor has enabled the barrier (is_set == False), which
-    # means that renewal monitor has started renewal process
-    await_token_barrier_enabled(token_service, timeout)
-
-    # wait until renewal monitor has disabled the barrier, meaning that renewal is done
-    await_token_barrier_disabled(token_service, timeout)
+            raise RuntimeError('Timeout expired while waiting for token renewal')
 
 
 # pylint: disable=no-self-argument, no-self-use
@@ -140,20 +126,15 @@ class TestToken:
 
         # get clean instance of tcex
         tcex = service_app().tcex
-        # Initialize Tokens module, which starts token renewal monitor and immediately kicks off
-        # first renewal cycle. Wait until initial cycle is finished before staging test token
-
-        await_token_renewal_cycle(tcex.token)
 
         token = 'JOB:3:ksKNpI:1567352558827:220:null:YPSaVFIGVbIkt1cfi4DzoG2bjWwsLBfwv9fJbeEx68A='
         # register expired token
         tcex.token.register_token(
             key=self.thread_name,
             token=token,
-            # expire token immediately. Note this by itself does not expire the token. This merely
-            # tells the renewal monitor that the token is expired. The token used in this test is
-            # a very old token which is expired.
-            expires=int(time.time()) - 999,
+            # the token used in this test is a very old token which is expired, but the expiration
+            # tells the renewal monitor that the token is valid, so it is not renewed.
+            expires=int(time.time()) + tcex.token.token_window + 999,
         )
 
         # ensure token was registered
@@ -176,10 +157,6 @@ class TestToken:
         # get clean instance of tcex
         tcex = service_app().tcex
 
-        # Initialize Tokens module, which starts token renewal monitor and immediately kicks off
-        # first renewal cycle. Wait until initial cycle is finished before staging test token
-        await_token_renewal_cycle(tcex.token)
-
         token = 'JOB:3:ksKNpI:1567352558827:220:null:YPSaVFIGVbIkt1cfi4DzoG2bjWwsLBfwv9fJbeEx68A='
         # register expired token
         tcex.token.register_token(
@@ -191,11 +168,8 @@ class TestToken:
             expires=int(time.time()) - 999,
         )
 
-        # ensure token was registered
-        assert tcex.token.token.value == token
-
         # await a renewal attempt. Should fail, as token is very old and cannot be renewed
-        await_token_renewal_cycle(tcex.token)
+        await_token_renewal(tcex.token, self.thread_name, token)
 
         # renewal failed, token removed from tokens module
         assert tcex.token.token is None
@@ -213,10 +187,6 @@ class TestToken:
 
         app = service_app()
 
-        # Initialize Tokens module, which starts token renewal monitor and immediately kicks off
-        # first renewal cycle. Wait until initial cycle is finished before staging test token
-        await_token_renewal_cycle(app.tcex.token)
-
         # get token from fixture
         tc_token = app.service_token
         # Token itself is valid, but we tell tokens.py that it is now expired
@@ -226,10 +196,7 @@ class TestToken:
             key=self.thread_name, token=tc_token, expires=tc_token_expires
         )
 
-        # "expired" token registered successfully.
-        assert app.tcex.token.token.value == tc_token
-
-        await_token_renewal_cycle(app.tcex.token)
+        await_token_renewal(app.tcex.token, self.thread_name, tc_token)
 
         assert app.tcex.token.token.value != tc_token, 'Token not was not renewed'
         assert app.tcex.session_tc.get('/v2/owners').ok, 'API call failed after token renewal'
@@ -246,11 +213,11 @@ class TestToken:
         monkeypatch.setenv('TC_TOKEN_SLEEP_INTERVAL', '5')
 
         app = service_app()
-        # Initialize Tokens module, which starts token renewal monitor and immediately kicks off
-        # first renewal cycle. Wait until initial cycle is finished before intentionally
-        # corrupting monitor thread state. Otherwise, test executes too fast and the
-        # corrupted state is never used, as everything happens within the initial renewal cycle
-        await_token_renewal_cycle(app.tcex.token)
+
+        # set token_window to a value that is not an integer to cause an exception
+        # within the renewal monitor on purpose
+        app.tcex.token.token_window = 'not an integer'
+
         tc_token = app.service_token
         tc_token_expires = int(time.time()) - 999
         # stage token to give renewal monitor some work
@@ -258,15 +225,10 @@ class TestToken:
             key=self.thread_name, token=tc_token, expires=tc_token_expires
         )
 
-        # set token_window to a value that is not an integer to cause an exception
-        # within the renewal monitor on purpose
-        app.tcex.token.token_window = 'not an integer'
+        # wait until the exception causes the renewal monitor to exit.
+        app.tcex.token.monitor_thread.join(timeout=60)
 
-        # wait until renewal monitor enters a renewal cycle. Monitor should enable the barrier
-        # but the exception will cause it to exit before it disables the barrier.
-        await_token_barrier_enabled(app.tcex.token)
-
-        # attempt to retrieve token. Barrier await timeout should expire. RuntimeError expected
+        # attempt to retrieve the expired token, which will not be renewed. RuntimeError expected
         with pytest.raises(RuntimeError):
             _ = app.tcex.token.token
 
@@ -296,16 +258,12 @@ class TestToken:
 
         app = service_app()
 
-        # Initialize Tokens module, which starts token renewal monitor and immediately kicks off
-        # first renewal cycle. Wait until initial cycle is finished before staging test token
-        await_token_renewal_cycle(app.tcex.token)
-
         # get new API token
         tc_token = Sensitive(app.service_token)
 
-        # register new token with expiration time in the past, so that renewal monitor
-        # renews this token upon next execution of token renewal logic
-        tc_token_expires = int(time.time()) - 999
+        # register new token with an expiration time within the token window, so that renewal
+        # monitor renews this token in a few seconds
+        tc_token_expires = int(time.time()) + app.tcex.token.token_window + 5
 
         # The goal is to prepare a token header but wait until it is no longer valid before it is
         # used. The token header is no longer valid because the renewal monitor would have
@@ -338,8 +296,8 @@ class TestToken:
                 # monitor has already renewed the staged token, which corrupts test state
                 assert tc_token.value in header, 'Original token has been unexpectedly renewed.'
 
-                # await for renewal cycle, which should renew the token
-                await_token_renewal_cycle(app.tcex.token)
+                # await for renewal, which should renew the token
+                await_token_renewal(app.tcex.token, threading.current_thread().name, tc_token)
 
                 # ensure token has been renewed
                 assert tc_token.value != app.tcex.token.token.value, 'Original token not renewed'
@@ -356,9 +314,9 @@ class TestToken:
 
         monkeypatch.setattr(app.tcex.session_tc.auth, '_token_header', mock_token_header)
 
-        # register "expired" token for the current thread. Note: Token is actually good,
-        # but we are setting a bad expiration time on the token service so that the
-        # renewal monitor knows to renew it.
+        # register token for the current thread. Note: Token is actually good, but we are
+        # setting an expiration time on the token service so that the renewal monitor knows to
+        # renew it.
         app.tcex.token.register_token(
             key=threading.current_thread().name, token=tc_token, expires=tc_token_expires
         )
@@ -0,0 +1,149 @@
+"""Test the TcEx Tokens Module renewal schedule."""
+# standard library
+import threading
+import time
+
+# first-party
+from tcex.tokens import Tokens
+
+
+def await_condition(condition, timeout=5):
+    """Wait for the condition to be True."""
+    end = time.time() + timeout
+    while not condition():
+        if time.time() > end:
+            raise RuntimeError('Timeout expired while waiting for condition.')
+        time.sleep(0.01)
+
+
+class MockRenewal:
+    """Renew tokens, recording the renewed tokens."""
+
+    def __init__(self, delay: float = 0, fail: bool = False, lifetime: int = 3_600):
+        """Initialize Class Properties."""
+        self.delay = delay
+        self.fail = fail
+        self.lifetime = lifetime
+        self.renewed = []
+        self.started = threading.Event()
+
+    def __call__(self, token):
+        """Return the renewed token data."""
+        self.started.set()
+        time.sleep(self.delay)
+        self.renewed.append(token.value)
+        if self.fail:
+            raise RuntimeError(1042, 'renewal failed')
+        return {
+            'apiToken': f'{token.value}-renewed',
+            'apiTokenExpires': int(time.time()) + self.lifetime,
+        }
+
+
+class TestTokenRenewal:
+    """Test the TcEx Tokens Module renewal schedule."""
+
+    @staticmethod
+    def _tokens(renewal: MockRenewal) -> Tokens:
+        """Return a Tokens instance using the mock renewal."""
+        tokens = Tokens('https://tc.example.com/api')
+        tokens.renew_token = renewal
+        return tokens
+
+    def test_token_renewal_due(self):
+        """Test only the tokens due for renewal are renewed."""
+        renewal = MockRenewal()
+        tokens = self._tokens(renewal)
+        try:
+            now = int(time.time())
+            tokens.register_token('valid', 'valid-token', now + 3_600)
+            tokens.register_token('due', 'due-token', now + tokens.token_window - 1)
+
+            await_condition(lambda: 'due-token-renewed' == tokens.token_map['due']['token'].value)
+            assert renewal.renewed == ['due-token']
+            assert tokens.token_map['valid']['token'].value == 'valid-token'
+        finally:
+            tokens.shutdown = True
+
+    def test_token_renewal_reader_blocking(self):
+        """Test readers only wait for their own expired token while it is renewed."""
+        renewal = MockRenewal(delay=0.5)
+        tokens = self._tokens(renewal)
+        try:
+            now = int(time.time())
+            tokens.register_token('valid', 'valid-token', now + 3_600)
+            tokens.register_token('MainThread', 'expired-token', now - 1)
+            assert renewal.started.wait(5)
+
+            results = {}
+
+            def _read_valid():
+                threading.current_thread().name = 'valid'
+                start = time.time()
+                results['valid'] = (tokens.token.value, time.time() - start)
+
+            thread = threading.Thread(target=_read_valid)
+            thread.start()
+            thread.join()
+
+            # the valid token is returned while the expired token is being renewed
+            assert results['valid'][0] == 'valid-token'
+            assert results['valid'][1] < 0.25
+
+            # the expired token is only returned once it is renewed
+            assert tokens.token.value == 'expired-token-renewed'
+        finally:
+            tokens.shutdown = True
+
+    def test_token_renewal_short_lived(self):
+        """Test a token with a lifetime shorter than token_window isn't renewed in a loop."""
+        renewal = MockRenewal(lifetime=60)
+        tokens = self._tokens(renewal)
+        tokens.sleep_interval = 1
+        try:
+            tokens.register_token('MainThread', 'expired-token', int(time.time()) - 1)
+            await_condition(lambda: len(renewal.renewed) == 1)
+            time.sleep(0.5)
+            assert len(renewal.renewed) == 1
+
+            # the token is renewed again once sleep_interval has passed
+            await_condition(lambda: len(renewal.renewed) == 2)
+        finally:
+            tokens.shutdown = True
+
+    def test_token_renewal_expired_not_due(self):
+        """Test reading an expired token renews it when the renewal is not due yet."""
+        renewal = MockRenewal(lifetime=1)
+        tokens = self._tokens(renewal)
+        try:
+            tokens.register_token('MainThread', 'expired-token', int(time.time()) - 1)
+            await_condition(lambda: len(renewal.renewed) == 1)
+
+            # the renewed token expires before its renewal is due (after sleep_interval)
+            await_condition(lambda: tokens.token_map['MainThread']['token_expires'] < time.time())
+            assert tokens.token.value == 'expired-token-renewed-renewed'
+            assert len(renewal.renewed) == 2
+        finally:
+            tokens.shutdown = True
+
+    def test_token_renewal_failure(self):
+        """Test a token that can not be renewed is removed."""
+        renewal = MockRenewal(fail=True)
+        tokens = self._tokens(renewal)
+        try:
+            tokens.register_token('MainThread', 'expired-token', int(time.time()) - 1)
+            await_condition(lambda: 'MainThread' not in tokens.token_map)
+            assert tokens.token is None
+        finally:
+            tokens.shutdown = True
+
+    def test_token_renewal_shutdown(self):
+        """Test the renewal monitor stops when shutdown."""
+        tokens = self._tokens(MockRenewal())
+        tokens.register_token('valid', 'valid-token', int(time.time()) + 3_600)
+        tokens.unregister_token('valid')
+        assert not tokens.token_map
+
+        tokens.shutdown = True
+        tokens.monitor_thread.join(timeout=5)
+        assert not tokens.monitor_thread.is_alive()
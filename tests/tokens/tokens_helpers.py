@@ -0,0 +1,28 @@
+"""Test helpers for the TcEx Tokens module."""
+# standard library
+import threading
+from typing import Any, Callable
+
+
+def run_in_trigger_thread(target: Callable[[], Any], trigger_id: int = 123) -> Any:
+    """Return the result of the target run in a thread with a trigger id, like a trigger.
+
+    Args:
+        target: The method to run.
+        trigger_id: The trigger id of the thread.
+    """
+    results = {}
+
+    def _trigger():
+        threading.current_thread().trigger_id = trigger_id
+        try:
+            results['result'] = target()
+        except Exception as ex:  # raised in the calling thread
+            results['error'] = ex
+
+    thread = threading.Thread(target=_trigger, name='trigger-thread')
+    thread.start()
+    thread.join()
+    if 'error' in results:
+        raise results['error']
+    return results['result']